@@ -0,0 +1 @@
+"""Benchmarks for the portfolio app. Run each one with ``python -m benchmarks.<name>``."""
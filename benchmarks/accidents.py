@@ -0,0 +1,87 @@
+"""Streaming ingestion of the Traffic Accident Analysis demo at growing file sizes.
+
+Generates synthetic accident CSVs of ``--rows`` / 10 and ``--rows`` rows with
+the demo's generator, streams each through the same IngestJob the page uses,
+and reports rows/sec and RSS growth during ingestion. Memory is flat when the
+big file costs no more than the small one.
+
+    python -m benchmarks.accidents                     # 5M rows, ~300 MiB
+    python -m benchmarks.accidents --rows 40000000     # ~2.4 GiB
+    python -m benchmarks.accidents --csv data/US_Accidents.csv   # a real file instead
+
+Fails if rows go missing or RSS growth exceeds --max-rss-mib or grows with the file.
+"""
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from portfolio.demos import accidents
+
+
+def ingest(path):
+    job = accidents.IngestJob(path)
+    job.run()
+    return job.snapshot()
+
+
+def report(path, snap):
+    size = path.stat().st_size / 2 ** 20
+    print(f"{path.name:<24} {size:>9,.0f} MiB {snap['stats'].rows:>13,} rows {snap['elapsed']:>7.1f} s "
+          f"{snap['rows_per_second']:>11,.0f} rows/s {snap['rss_growth_kib'] / 1024:>7,.0f} MiB RSS growth")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=5_000_000)
+    parser.add_argument("--csv", type=Path, help="ingest this file instead of generating data")
+    parser.add_argument("--dir", help="where to write the generated CSVs (default: a temporary directory)")
+    parser.add_argument("--max-rss-mib", type=float, default=256.0, help="allowed RSS growth while ingesting")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    failures = []
+    if args.csv:
+        snap = ingest(args.csv)
+        report(args.csv, snap)
+        if snap["error"] is not None:
+            failures.append(f"{args.csv}: {snap['error']}")
+        runs = [snap]
+    else:
+        tmp = None if args.dir else tempfile.TemporaryDirectory()
+        directory = Path(args.dir or tmp.name)
+        runs = []
+        try:
+            for rows in (args.rows // 10, args.rows):
+                path = directory / f"accidents-{rows}.csv"
+                start = time.perf_counter()
+                accidents.generate(path, rows, args.seed)
+                print(f"generated {rows:,} rows in {time.perf_counter() - start:.1f} s")
+                snap = ingest(path)
+                report(path, snap)
+                stats = snap["stats"]
+                if snap["error"] is not None:
+                    failures.append(f"{path.name}: {snap['error']}")
+                if stats.rows != rows or stats.hours.sum() != rows or stats.weather.sum() != rows:
+                    failures.append(f"{path.name}: {stats.rows:,} rows counted, expected {rows:,}")
+                path.unlink()
+                runs.append(snap)
+        finally:
+            if tmp is not None:
+                tmp.cleanup()
+        small, big = (snap["rss_growth_kib"] / 1024 for snap in runs)
+        if big > max(1.5 * small, small + 32):
+            failures.append(f"RSS growth rose with the file size ({small:.0f} -> {big:.0f} MiB)")
+
+    for snap in runs:
+        growth = snap["rss_growth_kib"] / 1024
+        if growth > args.max_rss_mib:
+            failures.append(f"RSS growth {growth:.0f} MiB > {args.max_rss_mib:.0f} MiB")
+    for failure in failures:
+        print(f"FAIL {failure}")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,149 @@
+"""Synthetic page-view events at scale, and the cost of logging and reporting them.
+
+Generates ``--events`` page views spread over ``--days`` days (weighted like
+the load generator's navigation, busier on weekdays) straight into an
+analytics log, in chunks, through the same append path the writer thread
+uses. Then measures:
+
+* page_view() cost on the script thread, and that the writer keeps up;
+* reopening the log (aggregates are loaded, not rebuilt);
+* summary() and the hidden dashboard rendered through AppTest.
+
+    python -m benchmarks.analytics_events --events 20000000
+    python -m benchmarks.analytics_events --events 50000000 --dir /tmp/views --keep
+
+Fails if the dashboard takes longer than --budget-ms or events go missing.
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+
+from benchmarks import harness
+from benchmarks.loadgen import PAGE_WEIGHTS
+from portfolio import analytics, settings
+
+CHUNK = 1_000_000
+ADMIN_TOKEN = "benchmark"
+
+
+def generate(log, events, days, seed):
+    rng = np.random.default_rng(seed)
+    labels = list(PAGE_WEIGHTS)
+    codes = np.array(log.page_codes(labels), dtype=np.uint8)
+    weights = np.array(list(PAGE_WEIGHTS.values()), dtype=float)
+    weights /= weights.sum()
+    start = time.time() - days * analytics.DAY
+    # Weekends get half the traffic
+    day_weights = np.array([0.5 if (int(start // analytics.DAY) + d + 3) % 7 >= 5 else 1.0 for d in range(days)])
+    day_weights /= day_weights.sum()
+
+    for offset in range(0, events, CHUNK):
+        n = min(CHUNK, events - offset)
+        day = rng.choice(days, size=n, p=day_weights)
+        ts = start + day * analytics.DAY + rng.random(n) * analytics.DAY
+        ts.sort()
+        log.append_columns(ts, codes[rng.choice(len(labels), size=n, p=weights)],
+                           rng.integers(0, 2 ** 32, size=n, dtype=np.uint32))
+
+
+def log_bytes(directory):
+    return sum(path.stat().st_size for path in Path(directory).iterdir() if path.is_file())
+
+
+def time_page_views(log, bursts, size):
+    # Bursts of half the ring at full speed, each followed by one writer pass
+    elapsed = 0.0
+    for _ in range(bursts):
+        start = time.perf_counter()
+        for _ in range(size):
+            log.page_view("🏠 Home", "benchmark-session")
+        elapsed += time.perf_counter() - start
+        log.flush(timeout=60)
+    return elapsed / (bursts * size)
+
+
+def time_dashboard(data_dir, runs):
+    settings.DATA_DIR = data_dir  # read by analytics.event_log() when the dashboard opens the log
+    os.environ["PORTFOLIO_ADMIN_TOKEN"] = ADMIN_TOKEN
+    from streamlit.testing.v1 import AppTest
+
+    at = AppTest.from_file(harness.APP_SCRIPT, default_timeout=300)
+    at.query_params["admin"] = ADMIN_TOKEN
+    times = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        at.run()
+        times.append((time.perf_counter() - start) * 1000)
+        harness.check(at)
+    views = at.metric[0].value if at.metric else "?"
+    return times, views
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--events", type=int, default=20_000_000)
+    parser.add_argument("--days", type=int, default=365)
+    parser.add_argument("--dir", help="data directory to use (default: a temporary one)")
+    parser.add_argument("--keep", action="store_true", help="keep the generated log")
+    parser.add_argument("--budget-ms", type=float, default=1000.0, help="allowed warm dashboard rerun time")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    harness.quiet()
+    tmp = None if args.dir else tempfile.TemporaryDirectory()
+    data_dir = Path(args.dir or tmp.name)
+    log_dir = data_dir / "analytics"
+    failures = []
+    try:
+        log = analytics.EventLog(log_dir)
+        log.flush()
+        before = log.rows
+        start = time.perf_counter()
+        generate(log, args.events, args.days, args.seed)
+        elapsed = time.perf_counter() - start
+        print(f"generated {args.events:,} events in {elapsed:.1f} s "
+              f"({args.events / elapsed:,.0f}/s), log {log_bytes(log_dir) / 2 ** 20:,.1f} MiB")
+
+        bursts, size = 10, log._ring.capacity // 2
+        per_call = time_page_views(log, bursts, size)
+        written = log.rows - before - args.events
+        dropped = log.summary()["dropped"]
+        print(f"page_view()              {per_call * 1e9:,.0f} ns/call, "
+              f"{written:,} of {bursts * size:,} written, {dropped:,} dropped")
+        if written != bursts * size:
+            failures.append("page views went missing between page_view() and the log")
+        log.close()
+
+        start = time.perf_counter()
+        reopened = analytics.EventLog(log_dir)
+        summary = reopened.summary()
+        print(f"reopen + first summary   {(time.perf_counter() - start) * 1000:,.1f} ms ({summary['rows']:,} rows)")
+        start = time.perf_counter()
+        for _ in range(100):
+            reopened.summary()
+        print(f"summary()                {(time.perf_counter() - start) * 10:,.2f} ms")
+        reopened.close()
+
+        times, views = time_dashboard(data_dir, 5)
+        warm = min(times[1:])
+        print(f"dashboard rerun          cold {times[0]:,.0f} ms, warm {warm:,.0f} ms (shows {views} views)")
+        if warm > args.budget_ms:
+            failures.append(f"dashboard rerun {warm:.0f} ms > {args.budget_ms:.0f} ms")
+    finally:
+        if tmp is not None and not args.keep:
+            tmp.cleanup()
+        elif tmp is not None:
+            print(f"kept {data_dir}")
+
+    for failure in failures:
+        print(f"FAIL {failure}")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,49 @@
+"""Skill badge rendering: original += loop vs. the renderer, cold and memoized.
+
+Plain names are what the pages show; names with <, > and & exercise the
+escaping the original helper never did. "vs cold" is the original's time over
+the renderer's with its cache cleared, "vs memoized" over a cache hit.
+
+    python -m benchmarks.badges
+"""
+import timeit
+
+from portfolio.components import _render_badges, skill_badges
+
+SIZES = (10, 1_000, 100_000)
+
+
+# The helper app1.py shipped with, kept here as the baseline
+def legacy_badges(skills_list):
+    badges_html = ""
+    for skill in skills_list:
+        badges_html += f'<span class="skill-badge">{skill}</span>'
+    return badges_html
+
+
+def best_of(func, number):
+    return min(timeit.repeat(func, number=number, repeat=5)) / number
+
+
+def main():
+    print(f"{'names':<8}{'badges':>8}{'legacy µs':>14}{'cold µs':>14}{'memoized µs':>14}"
+          f"{'vs cold':>10}{'vs memoized':>13}")
+    for label, name in (("plain", "Skill {}"), ("escaped", "Skill <{}> & co")):
+        for size in SIZES:
+            skills = [name.format(i) for i in range(size)]
+            number = max(1, 20_000 // size)
+
+            def cold():
+                _render_badges.cache_clear()
+                return skill_badges(skills)
+
+            legacy = best_of(lambda: legacy_badges(skills), number)
+            uncached = best_of(cold, number)
+            skill_badges(skills)
+            memoized = best_of(lambda: skill_badges(skills), number)
+            print(f"{label:<8}{size:>8,}{legacy * 1e6:>14.1f}{uncached * 1e6:>14.1f}{memoized * 1e6:>14.1f}"
+                  f"{legacy / uncached:>9.1f}x{legacy / memoized:>12.0f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""Decision tree demo: training, artifact reuse and batch inference throughput.
+
+Trains the demo's tree on synthetic Bank Marketing data (UCI size), then
+scores synthetic batches of 1 to 1M rows with the vectorized path the page
+uses (one encode() and one predict_proba per batch). Small batches are also
+scored the naive way, one DataFrame row at a time, for comparison.
+
+    python -m benchmarks.bank_tree
+    python -m benchmarks.bank_tree --sizes 1,1000,1000000 --min-rows-per-s 500000
+
+Fails if the artifact is retrained instead of loaded, the two paths disagree,
+or the largest batch is slower than --min-rows-per-s.
+"""
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+
+from portfolio import settings
+from portfolio.demos import bank_tree
+
+LOOP_LIMIT = 1000  # the per-row loop is only timed up to this batch size
+
+
+def best_of(fn, repeat):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", default="1,10,100,1000,10000,100000,1000000")
+    parser.add_argument("--min-rows-per-s", type=float, default=200_000.0, help="required for the largest batch")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+    sizes = [int(size) for size in args.sizes.split(",")]
+
+    failures = []
+    with tempfile.TemporaryDirectory() as tmp:
+        settings.DATA_DIR = Path(tmp)  # artifacts go to <data dir>/models
+        frame = bank_tree.synthetic(bank_tree.UCI_ROWS)
+        start = time.perf_counter()
+        trained = bank_tree.train(frame, bank_tree.DEFAULT_PARAMS, "synthetic")
+        cold = time.perf_counter() - start
+        start = time.perf_counter()
+        loaded = bank_tree.train(frame, bank_tree.DEFAULT_PARAMS, "synthetic")
+        warm = time.perf_counter() - start
+        print(f"train {cold * 1000:,.0f} ms (fit {trained.seconds * 1000:,.0f} ms), "
+              f"load artifact {warm * 1000:,.0f} ms, holdout accuracy {trained.accuracy:.3f}")
+        if loaded.seconds != trained.seconds:
+            failures.append("second train() fitted again instead of loading the artifact")
+
+    batches = bank_tree.synthetic(max(sizes), seed=args.seed).drop(columns=bank_tree.TARGET)
+    # CSV uploads arrive as strings, not categoricals
+    batches = batches.astype({name: str for name in bank_tree.CATEGORIES})
+    print(f"{'rows':>9} {'vectorized':>12} {'rows/s':>13} {'per-row loop':>13} {'speedup':>8}")
+    rate = 0.0
+    for size in sizes:
+        batch = batches.iloc[:size]
+        repeat = 5 if size <= 100_000 else 2
+        elapsed = best_of(lambda: bank_tree.predict(trained, batch), repeat)
+        rate = size / elapsed
+        line = f"{size:>9,} {elapsed * 1000:>9,.2f} ms {rate:>13,.0f}"
+        if size <= LOOP_LIMIT:
+            looped = best_of(lambda: [bank_tree.predict(trained, batch.iloc[[i]]) for i in range(size)], 1)
+            line += f" {looped * 1000:>10,.1f} ms {looped / elapsed:>7,.0f}x"
+            vectorized = bank_tree.predict(trained, batch)
+            single = np.concatenate([bank_tree.predict(trained, batch.iloc[[i]]) for i in range(min(size, 100))])
+            if not np.allclose(vectorized[:len(single)], single):
+                failures.append(f"batch of {size}: vectorized and per-row predictions differ")
+        print(line)
+    if rate < args.min_rows_per_s:
+        failures.append(f"{sizes[-1]:,}-row batch at {rate:,.0f} rows/s < {args.min_rows_per_s:,.0f}")
+
+    for failure in failures:
+        print(f"FAIL {failure}")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
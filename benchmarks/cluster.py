@@ -0,0 +1,231 @@
+"""Throughput from 1 to N workers behind portfolio.launch, and restart safety.
+
+For each worker count a fresh ``python -m portfolio.launch --workers N``
+is started (warm-up on, temporary data directory) and, once the proxy
+reports every worker healthy, ``--users`` websocket visitors with no think
+time load it through the proxy for ``--duration`` seconds. Reports reruns/s,
+latency, speedup over one worker and how the sessions were spread.
+
+With the largest worker count it also checks that:
+
+* a visitor gets the ``portfolio_worker`` cookie once and keeps it;
+* a session opened before SIGHUP keeps working while its worker drains,
+  the rolling restart replaces every worker and no request fails meanwhile;
+* the old and new worker of a slot, which run side by side during the
+  restart, log page views to separate directories.
+
+    python -m benchmarks.cluster [--workers 1,2,N] [--users 16] [--duration 15]
+
+Fails on errors, an uneven session spread, a broken cookie or restart, or
+speedup below --min-efficiency x workers for worker counts this machine has
+a spare core for (the load generator needs one too).
+"""
+import argparse
+import asyncio
+import json
+import os
+import signal
+import subprocess
+import sys
+import tempfile
+import time
+import urllib.request
+from pathlib import Path
+
+from benchmarks import loadgen
+from benchmarks.harness import ROOT
+from portfolio import proxy
+
+ABOUT = "👨‍💼 About"
+
+
+def spawn(workers, port, base_port, metrics_port, data_dir):
+    # Workers expose /ready on metrics_port + 1..., so the proxy only routes to warmed-up ones
+    env = dict(os.environ, PORTFOLIO_DATA_DIR=data_dir, PORTFOLIO_METRICS_PORT=str(metrics_port),
+               PORTFOLIO_WARMUP="1")
+    return subprocess.Popen(
+        [sys.executable, "-m", "portfolio.launch", "--workers", str(workers), "--port", str(port),
+         "--host", "127.0.0.1", "--base-port", str(base_port), "--browser.gatherUsageStats", "false"],
+        cwd=ROOT, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+    )
+
+
+def status(port):
+    with urllib.request.urlopen(f"http://127.0.0.1:{port}{proxy.STATUS_PATH}", timeout=5) as resp:
+        return json.load(resp)
+
+
+def wait_workers(port, process, workers, generation=0, timeout=180):
+    """Block until ``workers`` healthy backends of ``generation`` and nothing else are behind the proxy."""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError("launcher exited")
+        try:
+            backends = status(port)
+        except OSError:
+            backends = []
+        names = sorted(b["name"] for b in backends if b["healthy"] and not b["draining"])
+        if names == [f"w{slot}g{generation}" for slot in range(workers)] and len(backends) == workers:
+            return backends
+        time.sleep(0.2)
+    raise TimeoutError(f"{workers} workers did not become ready")
+
+
+def stop(process):
+    process.send_signal(signal.SIGTERM)
+    try:
+        process.wait(timeout=60)
+    except subprocess.TimeoutExpired:
+        process.kill()
+        process.wait()
+
+
+async def load(port, users, duration, seed):
+    """loadgen stage through the proxy, plus the session count per worker halfway through."""
+    async def spread():
+        await asyncio.sleep(duration / 2)
+        backends = await asyncio.get_running_loop().run_in_executor(None, status, port)
+        return {b["name"]: b["sessions"] for b in backends}
+
+    return await asyncio.gather(
+        loadgen.run_stage(f"ws://127.0.0.1:{port}", users, duration, 0.0, seed), spread())
+
+
+def cookie_check(port, failures):
+    def get(cookie=None):
+        request = urllib.request.Request(f"http://127.0.0.1:{port}/",
+                                         headers={"Cookie": cookie} if cookie else {})
+        with urllib.request.urlopen(request, timeout=10) as resp:
+            resp.read()
+            return resp.headers.get("Set-Cookie")
+
+    assigned = get()
+    if not assigned or not assigned.startswith(f"{proxy.COOKIE}="):
+        failures.append(f"first request got no worker cookie: {assigned!r}")
+        return
+    cookie = assigned.split(";", 1)[0]
+    repeats = [get(cookie) for _ in range(20)]
+    stale = get(f"{proxy.COOKIE}=gone")
+    print(f"cookie: {cookie}; 20 requests with it re-assigned {sum(map(bool, repeats))} times, "
+          f"an unknown worker was re-assigned: {bool(stale)}")
+    if any(repeats):
+        failures.append("requests with a valid cookie were re-assigned")
+    if not stale:
+        failures.append("a cookie for an unknown worker was not replaced")
+
+
+def served(port):
+    try:
+        with urllib.request.urlopen(f"http://127.0.0.1:{port}/", timeout=10) as resp:
+            return resp.status == 200
+    except OSError:
+        return False
+
+
+async def restart_check(port, process, workers, data_dir, failures):
+    session = loadgen.AppSession(f"ws://127.0.0.1:{port}")
+    await session.connect()
+    try:
+        await session.run()
+        process.send_signal(signal.SIGHUP)
+        loop = asyncio.get_running_loop()
+        restarted = loop.run_in_executor(None, wait_workers, port, process, workers, 1)
+        start = time.perf_counter()
+        draining = errors = requests = 0
+        while not restarted.done():
+            # The open session keeps working while its worker drains, new visitors are always served
+            result = await session.goto(ABOUT)
+            ok = await loop.run_in_executor(None, served, port)
+            backends = await loop.run_in_executor(None, status, port)
+            draining = max(draining, sum(b["draining"] for b in backends))
+            requests += 2
+            errors += bool(result.error) + (not ok)
+            if draining:
+                result = await session.goto(ABOUT)
+                requests += 1
+                errors += bool(result.error)
+                # Closing the session lets the drained worker go
+                await session.close()
+                break
+            await asyncio.sleep(0.2)
+        backends = await restarted
+        print(f"rolling restart: {time.perf_counter() - start:.1f} s, {requests} requests during it, "
+              f"{errors} failed, workers now {', '.join(b['name'] for b in backends)}")
+        if errors:
+            failures.append(f"{errors} requests failed during the rolling restart")
+        if not draining:
+            failures.append("no worker was seen draining with an open session")
+        # New visitors log page views on the new workers; analytics writes every second
+        visitors = [loadgen.AppSession(f"ws://127.0.0.1:{port}") for _ in range(2 * workers)]
+        for visitor in visitors:
+            await visitor.connect()
+            await visitor.run()
+            await visitor.goto(ABOUT)
+        await asyncio.sleep(2.0)
+        for visitor in visitors:
+            await visitor.close()
+        logs = sorted(path.name for path in (Path(data_dir) / "analytics").iterdir() if path.is_dir())
+        print(f"analytics logs: {', '.join(logs)}")
+        names = {b["name"] for b in backends}
+        if not names <= set(logs) or not any(log.endswith("g0") for log in logs):
+            failures.append(f"old and new workers did not log to their own directories: {logs}")
+    except (OSError, TimeoutError, RuntimeError) as exc:
+        failures.append(f"rolling restart: {type(exc).__name__}: {exc}")
+    finally:
+        await session.close()
+
+
+def main():
+    cores = os.cpu_count() or 1
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--workers", default=f"1,2,{max(2, cores)}")
+    parser.add_argument("--users", type=int, default=16, help="concurrent visitors, no think time")
+    parser.add_argument("--duration", type=float, default=15.0, help="seconds of load per worker count")
+    parser.add_argument("--min-efficiency", type=float, default=0.6, help="required speedup / workers")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+    counts = sorted({int(n) for n in args.workers.split(",")})
+
+    failures = []
+    single = None
+    print(f"{args.users} visitors for {args.duration:.0f} s per run on {cores} core(s)")
+    print(f"{'workers':>8}{'reruns':>9}{'rerun/s':>10}{'speedup':>9}{'p50 ms':>9}{'p99 ms':>9}{'errors':>9}"
+          "  sessions per worker")
+    for workers in counts:
+        port, base_port, metrics_port = loadgen.free_port(), loadgen.free_port(), loadgen.free_port()
+        with tempfile.TemporaryDirectory() as data_dir:
+            process = spawn(workers, port, base_port, metrics_port, data_dir)
+            try:
+                wait_workers(port, process, workers)
+                row, spread = asyncio.run(load(port, args.users, args.duration, args.seed))
+                single = single or row["throughput_rps"]
+                speedup = row["throughput_rps"] / single
+                print(f"{workers:>8}{row['reruns']:>9}{row['throughput_rps']:>10.1f}{speedup:>8.2f}x"
+                      f"{row['p50_ms']:>9.1f}{row['p99_ms']:>9.1f}{row['error_rate']:>9.2%}  "
+                      + " ".join(f"{name}={n}" for name, n in sorted(spread.items())))
+                for error in row["sample_errors"]:
+                    print(f"{'':>8}error: {error}")
+                if row["error_rate"]:
+                    failures.append(f"{workers} workers: {row['error_rate']:.2%} of requests failed")
+                if args.users >= workers and min(spread.values()) < args.users // workers - 1:
+                    failures.append(f"{workers} workers: uneven session spread {spread}")
+                if workers < cores and speedup < args.min_efficiency * workers:
+                    failures.append(f"{workers} workers: {speedup:.2f}x speedup < {args.min_efficiency:.0%} of linear")
+                if workers == counts[-1]:
+                    cookie_check(port, failures)
+                    asyncio.run(restart_check(port, process, workers, data_dir, failures))
+            except (OSError, TimeoutError, RuntimeError) as exc:
+                failures.append(f"{workers} workers: {type(exc).__name__}: {exc}")
+            finally:
+                stop(process)
+    if max(counts) >= cores:
+        print(f"(speedup is only checked below {cores} workers: the load generator needs a core of its own)")
+
+    for failure in failures:
+        print(f"FAIL {failure}")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
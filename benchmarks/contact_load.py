@@ -0,0 +1,81 @@
+"""Concurrent load test for the contact form outbox.
+
+Thousands of messages are submitted from a thread pool, with a share of exact
+duplicates and of sessions that exceed the rate limit. Reports submit latency
+percentiles, writer batching, and whether every accepted message reached SQLite.
+
+    python -m benchmarks.contact_load --messages 20000 --threads 64
+"""
+import argparse
+import statistics
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from portfolio import outbox
+
+
+def percentile(values, pct):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct / 100))]
+
+
+def run(messages, threads, duplicate_share, db_path):
+    box = outbox.ContactOutbox(db_path)
+    every = int(1 / duplicate_share) if duplicate_share else 0  # every n-th body repeats
+
+    def submit(i):
+        # Every 50th "visitor" keeps hammering the same session to hit the rate limit
+        session = "spammer" if i % 50 == 0 else f"session-{i}"
+        body = "Hello again" if every and i % every == 0 else f"Hello #{i}"
+        start = time.perf_counter()
+        result = box.submit(session, f"Visitor {i}", f"visitor{i % 1000}@example.com", "General Inquiry", body)
+        return time.perf_counter() - start, result
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(threads) as pool:
+        results = list(pool.map(submit, range(messages)))
+    submit_wall = time.perf_counter() - start
+    box.flush()
+    drain_wall = time.perf_counter() - start
+    box.close()
+
+    latencies = [latency * 1e6 for latency, _ in results]
+    outcomes = {name: sum(1 for _, r in results if r == name)
+                for name in (outbox.QUEUED, outbox.DUPLICATE, outbox.RATE_LIMITED)}
+    stored = box.stored()
+    return {
+        "messages": messages,
+        "threads": threads,
+        "submit_p50_us": percentile(latencies, 50),
+        "submit_p99_us": percentile(latencies, 99),
+        "submit_mean_us": statistics.fmean(latencies),
+        "submits_per_s": messages / submit_wall,
+        "drained_after_s": drain_wall,
+        "batches": box.counts["batches"],
+        "stored": stored,
+        "lost": outcomes[outbox.QUEUED] - stored,
+        "error": repr(box.error) if box.error else None,
+        **outcomes,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--messages", type=int, default=10000)
+    parser.add_argument("--threads", type=int, default=32)
+    parser.add_argument("--duplicates", type=float, default=0.05, help="share of repeated message bodies")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        report = run(args.messages, args.threads, args.duplicates, Path(tmp) / "contact.sqlite3")
+
+    for key, value in report.items():
+        print(f"{key:<18}{value:,.2f}" if isinstance(value, float) else f"{key:<18}{value}")
+    return 1 if report["lost"] or report["error"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
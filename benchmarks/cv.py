@@ -0,0 +1,172 @@
+"""CV download: cache behaviour and proof that downloads do no rendering work.
+
+In process, against a temporary cache directory:
+
+* the first request queues a build on the worker and returns nothing; the
+  build renders once;
+* repeated requests return the same cached bytes (time per call, renders);
+* a new builder over the same directory (a restart) loads the file, no render;
+* changed content renders once more and replaces the old file.
+
+Against a live server (``python -m portfolio.serve``): the About page is
+opened, the download button's URL fetched ``--downloads`` times and the page
+re-run ``--reruns`` times; ``portfolio_cv_renders_total`` and
+``portfolio_reruns_total`` from the metrics endpoint show that downloads
+neither render nor re-run the script.
+
+    python -m benchmarks.cv [--downloads 50] [--reruns 20]
+
+Fails on any extra render, mismatching bytes or download-triggered rerun.
+"""
+import argparse
+import asyncio
+import dataclasses
+import statistics
+import sys
+import tempfile
+import time
+import urllib.request
+
+from benchmarks import loadgen, warmup
+from portfolio import cv
+from portfolio.content import get_content
+
+ABOUT = "👨‍💼 About"
+
+
+def renders():
+    return cv.cv_renders.value()
+
+
+def in_process(failures):
+    content = get_content()
+    with tempfile.TemporaryDirectory() as directory:
+        builder = cv.CVBuilder(directory)
+        before = renders()
+        if builder.get(content) is not None:
+            failures.append("first request returned bytes before any build")
+        start = time.perf_counter()
+        data = builder.build(content).result()
+        print(f"first build               {(time.perf_counter() - start) * 1000:>8.1f} ms, {len(data):,} bytes, "
+              f"{renders() - before} render")
+
+        before = renders()
+        times = []
+        for _ in range(10_000):
+            start = time.perf_counter()
+            cached = builder.get(content)
+            times.append(time.perf_counter() - start)
+            if cached is not data:
+                failures.append("cached request returned different bytes")
+                break
+        print(f"10,000 cached requests    {statistics.median(times) * 1e6:>8.2f} us median, "
+              f"{renders() - before} renders")
+        if renders() != before:
+            failures.append(f"cached requests rendered {renders() - before} times")
+
+        before = renders()
+        start = time.perf_counter()
+        restarted = cv.CVBuilder(directory).build(content).result()
+        print(f"after restart             {(time.perf_counter() - start) * 1000:>8.1f} ms, "
+              f"{renders() - before} renders")
+        if renders() != before or restarted != data:
+            failures.append("restart did not reuse the file on disk")
+
+        changed = dataclasses.replace(content, version="changed",
+                                      about=dataclasses.replace(content.about, headline="Senior Data Analyst"))
+        before = renders()
+        rebuilt = builder.build(changed).result()
+        files = sorted(path.name for path in builder.directory.glob("cv-*.html"))
+        print(f"content changed           {renders() - before} render, files on disk: {len(files)}")
+        if renders() - before != 1 or b"Senior Data Analyst" not in rebuilt:
+            failures.append("changed content was not rebuilt exactly once")
+        if files != [builder.path(cv.cv_key(changed)).name]:
+            failures.append(f"stale CV files left on disk: {files}")
+
+
+class DownloadSession(loadgen.AppSession):
+    url_path = None
+
+    def element(self, element_type, proto):
+        if element_type == "download_button":
+            self.url_path = proto.url
+
+
+def counters(metrics_port):
+    with urllib.request.urlopen(f"http://127.0.0.1:{metrics_port}/metrics", timeout=5) as resp:
+        text = resp.read().decode("utf-8")
+    values = {"renders": 0.0, "reruns": 0.0}
+    for line in text.splitlines():
+        if line.startswith("portfolio_cv_renders_total"):
+            values["renders"] += float(line.rsplit(" ", 1)[1])
+        elif line.startswith("portfolio_reruns_total"):
+            values["reruns"] += float(line.rsplit(" ", 1)[1])
+    return values
+
+
+async def live(port, metrics_port, downloads, reruns, failures):
+    session = DownloadSession(f"ws://127.0.0.1:{port}")
+    await session.connect()
+    try:
+        await session.run()
+        await session.goto(ABOUT)
+        if session.url_path is None:
+            failures.append("About page has no download button")
+            return
+        expected = cv.render_html(get_content()).encode("utf-8")
+
+        before = counters(metrics_port)
+        times = []
+        for _ in range(downloads):
+            start = time.perf_counter()
+            with urllib.request.urlopen(f"http://127.0.0.1:{port}{session.url_path}", timeout=10) as resp:
+                body = resp.read()
+            times.append(time.perf_counter() - start)
+            if body != expected:
+                failures.append("downloaded bytes differ from the CV")
+                break
+        after = counters(metrics_port)
+        print(f"{downloads} downloads              {statistics.median(times) * 1000:>8.2f} ms median, "
+              f"{after['renders'] - before['renders']:.0f} renders, {after['reruns'] - before['reruns']:.0f} reruns")
+        if after != before:
+            failures.append(f"downloads changed the counters: {before} -> {after}")
+
+        before = after
+        for _ in range(reruns):
+            await session.goto(ABOUT)
+        after = counters(metrics_port)
+        print(f"{reruns} About reruns            {after['renders'] - before['renders']:.0f} renders "
+              f"(total since boot: {after['renders']:.0f})")
+        if after["renders"] != before["renders"]:
+            failures.append("About reruns rendered the CV")
+    finally:
+        await session.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--downloads", type=int, default=50)
+    parser.add_argument("--reruns", type=int, default=20)
+    args = parser.parse_args()
+
+    failures = []
+    in_process(failures)
+
+    port, metrics_port = loadgen.free_port(), loadgen.free_port()
+    with tempfile.TemporaryDirectory() as data_dir:
+        process = warmup.spawn(port, metrics_port, data_dir, True)
+        try:
+            loadgen.wait_healthy(f"http://127.0.0.1:{port}", process)
+            warmup.wait_ready(metrics_port, process)
+            asyncio.run(live(port, metrics_port, args.downloads, args.reruns, failures))
+        finally:
+            process.terminate()
+            process.wait(timeout=30)
+
+    for failure in failures:
+        print(f"FAIL {failure}")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,195 @@
+"""EDA demo on synthetic CSV and Parquet files from 10 MB to 5 GB.
+
+For each size and format, writes a file with the demo's generator and
+profiles it in a fresh interpreter, as the first visitor after a restart
+would: time to first summary (from asking for the scan to the first
+summary a page can show), time to the full summary, MiB/s, peak RSS growth
+during the scan (sampled per batch, as the page shows it), and p99 of the snapshot() calls polled
+meanwhile (the work a page rerun does). A second interpreter then asks for
+the same file and must be served from the results cache without a scan.
+
+On the smallest CSV, checks exact counts and moments against pyarrow over
+the whole table, the exact pass against NumPy, and how far the sample's
+quartiles, histograms and correlations are from the exact values.
+
+    python -m benchmarks.eda                              # 10 MB to 1 GB
+    python -m benchmarks.eda --sizes 10,100,1000,5000     # up to 5 GB
+    python -m benchmarks.eda --formats csv --dir /big/disk
+
+Fails if the first summary takes longer than --max-first-summary, RSS growth
+exceeds --max-rss-mib or rises with the file size, a poll exceeds
+--max-poll-ms, the cache misses, or on any mismatch.
+"""
+import argparse
+import json
+import math
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+import pyarrow.csv as pa_csv
+
+from benchmarks.harness import ROOT
+from portfolio.demos import eda
+
+PROBE = """
+import json, sys, time
+from pathlib import Path
+from portfolio.demos import eda
+path = Path(sys.argv[1])
+start = time.perf_counter()
+job = eda.job_for(path, eda.read_schema(path).names)
+first, polls = None, []
+while True:
+    t = time.perf_counter()
+    snap = job.snapshot()
+    polls.append(time.perf_counter() - t)
+    if first is None and snap["summary"] is not None:
+        first = time.perf_counter() - start
+    if snap["done"]:
+        break
+    time.sleep(0.05)
+polls.sort()
+json.dump({"first": first, "total": time.perf_counter() - start, "rows": snap["summary"]["rows"],
+           "cached": snap["cached"], "error": str(snap["error"]) if snap["error"] else None,
+           "poll_p99": polls[int(0.99 * (len(polls) - 1))],
+           "peak_kib": snap["rss_growth_kib"]}, sys.stdout)
+"""
+
+
+def probe(path, data_dir):
+    env = dict(os.environ, PORTFOLIO_DATA_DIR=data_dir)
+    proc = subprocess.run([sys.executable, "-c", PROBE, str(path)], cwd=ROOT, env=env, capture_output=True,
+                          text=True, check=True)
+    return json.loads(proc.stdout)
+
+
+def scale(directory, sizes, formats, args, failures):
+    print(f"{'file':<28}{'MiB':>8}{'rows':>14}{'first':>9}{'full':>9}{'MiB/s':>8}{'RSS +MiB':>10}"
+          f"{'poll p99':>10}{'cached':>9}")
+    runs = []
+    for fmt in formats:
+        for size in sizes:
+            path = directory / f"passengers-{size:g}mb.{fmt}"
+            start = time.perf_counter()
+            eda.generate(path, size, fmt, args.seed)
+            generated = time.perf_counter() - start
+            with tempfile.TemporaryDirectory() as data_dir:
+                cold = probe(path, data_dir)
+                warm = probe(path, data_dir)
+            mib = path.stat().st_size / 2 ** 20
+            print(f"{path.name:<28}{mib:>8,.0f}{cold['rows']:>14,}{cold['first']:>8.2f}s{cold['total']:>8.1f}s"
+                  f"{mib / cold['total']:>8.0f}{cold['peak_kib'] / 1024:>10.0f}{cold['poll_p99'] * 1000:>8.1f}ms"
+                  f"{warm['total'] * 1000:>7.0f}ms   (generated in {generated:.0f} s)")
+            path.unlink()
+            runs.append((fmt, size, cold))
+
+            if cold["error"] or warm["error"]:
+                failures.append(f"{path.name}: {cold['error'] or warm['error']}")
+            if cold["first"] > args.max_first_summary:
+                failures.append(f"{path.name}: first summary after {cold['first']:.2f} s")
+            if cold["peak_kib"] / 1024 > args.max_rss_mib:
+                failures.append(f"{path.name}: RSS grew {cold['peak_kib'] / 1024:.0f} MiB")
+            if cold["poll_p99"] * 1000 > args.max_poll_ms:
+                failures.append(f"{path.name}: snapshot p99 {cold['poll_p99'] * 1000:.0f} ms")
+            if not warm["cached"] or warm["rows"] != cold["rows"]:
+                failures.append(f"{path.name}: second visit was not served from the results cache")
+
+    for fmt in formats:
+        growth = [cold["peak_kib"] / 1024 for run_fmt, _, cold in runs if run_fmt == fmt]
+        if len(growth) > 1 and growth[-1] > max(1.5 * growth[0], growth[0] + 64):
+            failures.append(f"{fmt}: RSS growth rose with the file size ({growth[0]:.0f} -> {growth[-1]:.0f} MiB)")
+
+
+def accuracy(directory, size, args, failures):
+    path = eda.generate(directory / "accuracy.csv", size, "csv", args.seed)
+    schema = eda.read_schema(path)
+    job = eda.ProfileJob(path, schema, schema.names)
+    job.run()
+    summary = job.snapshot()["summary"]
+    refine = eda.RefineJob(path, schema, summary)
+    refine.run()
+    exact = refine.snapshot()["result"]
+
+    table = pa_csv.read_csv(path, convert_options=pa_csv.ConvertOptions(strings_can_be_null=True))
+    columns = {entry["name"]: entry for entry in summary["columns"]}
+    mismatches = []
+    quartile_error, histogram_error = 0.0, 0.0
+    for name, entry in columns.items():
+        column = table.column(name)
+        if entry["count"] != len(column) - column.null_count or summary["rows"] != len(column):
+            mismatches.append(f"{name} count")
+        if entry["kind"] != "numeric":
+            continue
+        values = eda._floats(column)
+        values = values[~np.isnan(values)]
+        for stat, expected in (("mean", values.mean()), ("std", values.std(ddof=1)), ("min", values.min()),
+                               ("max", values.max())):
+            if not math.isclose(entry[stat], expected, rel_tol=1e-9, abs_tol=1e-9):
+                mismatches.append(f"{name} {stat}: {entry[stat]} != {expected}")
+        counts = np.histogram(values, exact["histograms"][name]["edges"])[0]
+        if counts.tolist() != exact["histograms"][name]["counts"]:
+            mismatches.append(f"{name} exact histogram")
+        # Quartile error: distance in rank (a fraction of the rows) from the ranks the value spans
+        ordered = np.sort(values)
+        below = np.searchsorted(ordered, entry["quartiles"], side="left") / len(values)
+        upto = np.searchsorted(ordered, entry["quartiles"], side="right") / len(values)
+        wanted = np.array([0.25, 0.5, 0.75])
+        quartile_error = max(quartile_error, float(np.maximum(0, np.maximum(below - wanted, wanted - upto)).max()))
+        # Histogram error: total variation distance
+        estimated = np.array(summary["histograms"][name]["counts"])
+        histogram_error = max(histogram_error, 0.5 * float(np.abs(estimated - counts).sum()) / len(values))
+
+    names = exact["correlation"]["columns"]
+    frame = table.select(names).to_pandas()
+    expected = frame.corr().to_numpy()
+    measured = np.array(exact["correlation"]["matrix"], dtype=float)
+    if not np.allclose(measured, expected, atol=1e-5, equal_nan=True):
+        mismatches.append("exact correlation")
+    correlation_error = float(np.nanmax(np.abs(np.array(summary["correlation"]["matrix"], dtype=float) - expected)))
+    path.unlink()
+
+    print(f"accuracy on {summary['rows']:,} rows, sample of {summary['sample_rows']:,}: "
+          f"quartiles within {quartile_error:.4f} of rank, histograms {histogram_error:.4f} total variation, "
+          f"correlations within {correlation_error:.4f}; {len(mismatches)} exact mismatches")
+    failures.extend(f"accuracy: {mismatch}" for mismatch in mismatches)
+    for label, error, bound in (("quartile", quartile_error, 0.01), ("histogram", histogram_error, 0.02),
+                                ("correlation", correlation_error, 0.03)):
+        if error > bound:
+            failures.append(f"accuracy: sample {label} error {error:.4f} > {bound}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", default="10,100,1000", help="file sizes in MiB, comma-separated")
+    parser.add_argument("--formats", default="csv,parquet")
+    parser.add_argument("--dir", help="where to write the generated files (default: a temporary directory)")
+    parser.add_argument("--max-first-summary", type=float, default=1.0, help="seconds")
+    parser.add_argument("--max-rss-mib", type=float, default=256.0, help="allowed RSS growth while scanning")
+    parser.add_argument("--max-poll-ms", type=float, default=250.0, help="allowed snapshot() p99")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    sizes = [float(size) for size in args.sizes.split(",")]
+    failures = []
+    tmp = None if args.dir else tempfile.TemporaryDirectory()
+    directory = Path(args.dir or tmp.name)
+    directory.mkdir(parents=True, exist_ok=True)
+    try:
+        scale(directory, sizes, args.formats.split(","), args, failures)
+        accuracy(directory, min(sizes), args, failures)
+    finally:
+        if tmp is not None:
+            tmp.cleanup()
+
+    for failure in failures:
+        print(f"FAIL {failure}")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
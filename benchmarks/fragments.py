@@ -0,0 +1,133 @@
+"""Rerun cost of each interactive widget: whole-script rerun vs. its fragment.
+
+Against a live server (spawned by default), every interaction is sent
+``--repeat`` times the way the browser did before the interactive regions
+became fragments -- a full rerun of app1.py -- and the way it does now -- a
+rerun of the widget's fragment only (``fragment_id`` in the rerun request).
+Reports median latency, bytes and elements sent back per interaction.
+
+    python -m benchmarks.fragments
+    python -m benchmarks.fragments --url ws://127.0.0.1:8501 --repeat 50
+
+Interactions are ``--think`` seconds apart, as a visitor's clicks are: the
+server collects garbage after every run (``runner.postScriptGC``), and a
+fragment rerun is handed to the session's existing script thread, so a
+back-to-back request would measure that collection instead of the rerun.
+
+Fails if any interaction's widget is not inside a fragment, or if its
+fragment rerun does not send back less than the full rerun. Latency is
+reported, not checked: Streamlit's per-run overhead (session messages,
+widget bookkeeping) is the same for both and dominates on a small page.
+"""
+import argparse
+import asyncio
+import statistics
+import sys
+import tempfile
+
+from benchmarks import loadgen
+
+TOGGLE = "🔍 Interactive chart"
+
+
+def interactions(session):
+    """(name, page, widget key, states factory) for every interaction measured."""
+    n = iter(range(10 ** 9))
+
+    def button(label):
+        return lambda: [session.state("button", label, trigger_value=True)]
+
+    def toggle(label):
+        flip = iter(range(10 ** 9))
+        return lambda: [session.state("checkbox", label, bool_value=next(flip) % 2 == 0)]
+
+    def submit():
+        i = next(n)
+        return [
+            session.state("text_input", "Your Name", string_value=f"Fragment {i}"),
+            session.state("text_input", "Your Email", string_value=f"fragment{i}@example.com"),
+            session.state("selectbox", "Subject", string_value="General Inquiry"),
+            session.state("text_area", "Message", string_value=f"Fragment benchmark {i}"),
+            session.state("button", "Send Message", trigger_value=True),
+        ]
+
+    return [
+        ("LinkedIn button", "📞 Contact", ("button", "🔗 LinkedIn Profile"), button("🔗 LinkedIn Profile")),
+        ("GitHub button", "📞 Contact", ("button", "💻 GitHub Repository"), button("💻 GitHub Repository")),
+        ("contact_form submit", "📞 Contact", ("button", "Send Message"), submit),
+        ("chart toggle (Skills)", "🛠️ Skills", ("checkbox", TOGGLE), toggle(TOGGLE)),
+        ("chart toggle (Projects)", "🚀 Projects", ("checkbox", TOGGLE), toggle(TOGGLE)),
+    ]
+
+
+async def measure(url, repeat, think):
+    session = loadgen.AppSession(url)
+    await session.connect()
+    rows, failures = [], []
+    try:
+        await session.run()
+        for name, page, widget, states in interactions(session):
+            await session.goto(page)
+            fragment_id = session.fragments.get(widget)
+            if not fragment_id:
+                failures.append(f"{name}: widget is not inside a fragment")
+                continue
+            full, fragment = [], []
+            for _ in range(repeat):
+                # Before: the interaction re-ran the whole script (page selection included)
+                await asyncio.sleep(think)
+                full.append(await session.run([session.page_state(page), *states()]))
+                await asyncio.sleep(think)
+                fragment.append(await session.run(states(), fragment_id=fragment_id))
+            errors = [r.error for r in full + fragment if r.error]
+            if errors:
+                failures.append(f"{name}: {errors[0]}")
+            row = [name] + [summarize(results) for results in (full, fragment)]
+            rows.append(row)
+            if row[2][1] >= row[1][1]:
+                failures.append(f"{name}: fragment rerun sent {row[2][1]:.1f} KiB, full rerun {row[1][1]:.1f} KiB")
+    finally:
+        await session.close()
+    return rows, failures
+
+
+def summarize(results):
+    return (statistics.median(r.latency for r in results) * 1000,
+            statistics.median(r.received for r in results) / 1024,
+            statistics.median(r.elements for r in results))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--url", help="server to measure (default: spawn one)")
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--think", type=float, default=0.2, help="seconds between interactions")
+    args = parser.parse_args()
+
+    process = tmp = None
+    url = args.url
+    if url is None:
+        tmp = tempfile.TemporaryDirectory()
+        port = loadgen.free_port()
+        process = loadgen.spawn_server(port, tmp.name)
+        url = f"ws://127.0.0.1:{port}"
+    try:
+        rows, failures = asyncio.run(measure(url, args.repeat, args.think))
+    finally:
+        if process is not None:
+            process.terminate()
+            process.wait(timeout=30)
+            tmp.cleanup()
+
+    print(f"{'interaction':<26}{'full ms':>9}{'KiB':>7}{'elems':>7}{'fragment ms':>13}{'KiB':>7}{'elems':>7}"
+          f"{'speedup':>9}")
+    for name, full, fragment in rows:
+        print(f"{name:<26}{full[0]:>9.1f}{full[1]:>7.1f}{full[2]:>7.0f}{fragment[0]:>13.1f}{fragment[1]:>7.1f}"
+              f"{fragment[2]:>7.0f}{full[0] / fragment[0]:>8.1f}x")
+    for failure in failures:
+        print(f"FAIL {failure}")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,378 @@
+"""GitHub stats cache against a local stub API that injects latency and failures.
+
+The stub serves ``/users/<user>`` and its paginated ``/repos`` (chunked, as
+GitHub does) after ``--latency`` seconds, and can be switched to answering
+502s or to hanging past the client timeout. In process, against a
+``StatsCache`` with a temporary file:
+
+* cold: ``get()`` returns at once with nothing, one refresh fills it;
+* ``--threads`` concurrent lookups on an empty cache make one fetch;
+* fresh lookups: time per call, no requests;
+* stale-while-revalidate: an expired value is still returned at once while
+  exactly one refresh runs;
+* failures and timeouts: the last value stays, the error is reported and no
+  retry happens within ``retry_after``;
+* a new cache over the same file (a restart) serves the saved value.
+
+The account comes from PORTFOLIO_GITHUB_USER, ``[portfolio.github] user`` or
+the About ``github`` URL, checked in that order in fresh interpreters; with
+none (as shipped) there is no cache and Contact shows the opt-in note.
+
+Against a live server (``python -m portfolio.serve`` with a config.toml copy
+whose ``[portfolio.github]`` names the account and points at the stub,
+``--latency-live`` seconds per request): ``--users`` visitors open Contact
+at once. Their reruns must not wait for the API, the stub must see one
+fetch, and the stats appear once it lands.
+
+    python -m benchmarks.github_stats [--latency 0.3] [--threads 200] [--users 8]
+
+Fails if a lookup waits on the network (p99 over 1 ms; the first one, which
+starts the refresh thread, within a tenth of the stub latency), on more than one
+fetch per refresh, on wrong totals, on a lost value or if an account source
+is not picked up.
+"""
+import argparse
+import asyncio
+import collections
+import http.server
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+import toml
+
+from benchmarks import loadgen
+from benchmarks.harness import ROOT
+from portfolio import github, settings
+from portfolio.content import CONTENT_PATH
+
+USER = "octo-analyst"
+LANGUAGES = ("Python", "Jupyter Notebook", "SQL", "Python", None)
+CONTACT = "📞 Contact"
+
+
+def repos(count):
+    return [{"name": f"repo-{i}", "stargazers_count": i % 7, "forks_count": i % 3,
+             "language": LANGUAGES[i % len(LANGUAGES)]} for i in range(count)]
+
+
+class StubHandler(http.server.BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        stub = self.server
+        path, _, query = self.path.partition("?")
+        kind = "repos" if path.endswith("/repos") else "profile"
+        with stub.lock:
+            stub.requests[kind] += 1
+        time.sleep(stub.hang if stub.mode == "hang" else stub.latency)
+        if stub.mode != "ok":
+            self.send_response(502)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        if kind == "profile":
+            body = json.dumps({"login": USER, "html_url": f"https://github.com/{USER}",
+                               "public_repos": stub.repos, "followers": 42}).encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+            return
+        page = int(dict(part.partition("=")[::2] for part in query.split("&")).get("page", 1))
+        body = json.dumps(repos(stub.repos)[(page - 1) * 100:page * 100]).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+        for start in range(0, len(body), 4096):
+            chunk = body[start:start + 4096]
+            self.wfile.write(f"{len(chunk):x}\r\n".encode() + chunk + b"\r\n")
+        self.wfile.write(b"0\r\n\r\n")
+
+
+class Stub(http.server.ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, repo_count, latency):
+        super().__init__(("127.0.0.1", 0), StubHandler)
+        self.repos = repo_count
+        self.latency = latency
+        self.hang = 0.0
+        self.mode = "ok"  # "ok", "fail" (502) or "hang" (sleep self.hang first)
+        self.lock = threading.Lock()
+        self.requests = collections.Counter()
+        threading.Thread(target=self.serve_forever, daemon=True).start()
+
+    def handle_error(self, request, client_address):
+        pass  # clients that timed out close early
+
+    @property
+    def url(self):
+        return f"http://127.0.0.1:{self.server_address[1]}"
+
+    def profiles(self):
+        with self.lock:
+            return self.requests["profile"]
+
+
+def timed_gets(cache, count):
+    times, snapshots = [], []
+    for _ in range(count):
+        start = time.perf_counter()
+        snapshots.append(cache.get())
+        times.append(time.perf_counter() - start)
+    times.sort()
+    return times[len(times) // 2] * 1e6, times[int(len(times) * 0.99)] * 1e6, snapshots
+
+
+def in_process(stub, args, failures):
+    expected = repos(args.repos)
+    timeout = 1.0
+    with tempfile.TemporaryDirectory() as directory:
+        path = Path(directory) / f"{USER}.json"
+
+        def new_cache(ttl=600.0):
+            return github.StatsCache(lambda: github.fetch_stats(stub.url, USER, timeout=timeout),
+                                     ttl=ttl, stale_ttl=3600.0, retry_after=args.retry_after, path=path)
+
+        def check(label, p99_us, limit=1000):
+            if p99_us > limit:
+                failures.append(f"{label}: lookup p99 {p99_us:.0f} us waits on the network")
+
+        # Cold: nothing to show, one refresh
+        cache = new_cache()
+        start = time.perf_counter()
+        snapshot = cache.get()
+        first = (time.perf_counter() - start) * 1e6
+        value = cache.refresh().result()
+        print(f"cold lookup               {first:>9.1f} us, state {snapshot.state}; refresh took "
+              f"{(time.perf_counter() - start) * 1000:.0f} ms ({args.latency * 1000:.0f} ms stub latency, "
+              f"{-(-args.repos // 100)} repo pages)")
+        # The very first lookup also starts the refresh thread
+        check("cold", first, args.latency * 1e6 / 10)
+        totals = (args.repos, sum(r["stargazers_count"] for r in expected),
+                  sum(r["forks_count"] for r in expected), 42)
+        if snapshot.value is not None or (value.repos, value.stars, value.forks, value.followers) != totals:
+            failures.append(f"cold fetch: {value} does not match the stub's {totals}")
+        if value.languages[0] != ("Python", collections.Counter(r["language"] for r in expected)["Python"]):
+            failures.append(f"top language is {value.languages[0]}")
+
+        # Single flight: many sessions on an empty cache
+        path.unlink()
+        cache = new_cache()
+        before = stub.profiles()
+        barrier = threading.Barrier(args.threads)
+        results = []
+
+        def lookup():
+            barrier.wait()
+            start = time.perf_counter()
+            cache.get()
+            results.append(time.perf_counter() - start)
+
+        threads = [threading.Thread(target=lookup) for _ in range(args.threads)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        cache.refresh().result()
+        results.sort()
+        fetched = stub.profiles() - before
+        print(f"{args.threads} concurrent lookups   {results[int(len(results) * 0.99)] * 1e6:>9.1f} us p99, "
+              f"{fetched} fetch")
+        if fetched != 1:
+            failures.append(f"{args.threads} concurrent lookups made {fetched} fetches")
+
+        # Fresh
+        before = stub.profiles()
+        p50, p99, snapshots = timed_gets(cache, 10_000)
+        print(f"10,000 fresh lookups      {p50:>9.2f} us p50, {p99:.2f} us p99, {stub.profiles() - before} fetches")
+        check("fresh", p99)
+        if stub.profiles() != before or any(s.state != "fresh" for s in snapshots):
+            failures.append("fresh lookups were not served from the cache")
+
+        # Stale while revalidate
+        cache.ttl = 0.0
+        before = stub.profiles()
+        p50, p99, snapshots = timed_gets(cache, 1_000)
+        states = collections.Counter(s.state for s in snapshots)
+        cache.refresh().result()
+        cache.ttl = 600.0
+        print(f"1,000 stale lookups       {p50:>9.2f} us p50, {p99:.2f} us p99, {dict(states)}, "
+              f"{stub.profiles() - before} fetch")
+        check("stale", p99)
+        if states["missing"] or stub.profiles() - before != 1:
+            failures.append(f"stale lookups: {dict(states)}, {stub.profiles() - before} fetches")
+
+        # Failures and timeouts keep the value and back off
+        for mode in ("fail", "hang"):
+            stub.mode, stub.hang = mode, timeout + 0.5
+            cache.ttl = 0.0
+            before = stub.profiles()
+            cache.refresh(force=True).result()
+            p50, p99, snapshots = timed_gets(cache, 1_000)
+            last = snapshots[-1]
+            print(f"1,000 lookups ({mode:<4})      {p50:>9.2f} us p50, {p99:.2f} us p99, value kept: "
+                  f"{last.value is not None}, error: {last.error}")
+            check(mode, p99)
+            if last.value is None or not last.error:
+                failures.append(f"{mode}: value lost or error not reported")
+            if stub.profiles() - before != 1:
+                failures.append(f"{mode}: {stub.profiles() - before} attempts within retry_after")
+            stub.mode = "ok"
+        # Fresh again, so the check below starts no refresh that outlives the temporary directory
+        cache.ttl = 600.0
+        cache.refresh(force=True).result()
+        if cache.get().error:
+            failures.append("recovery did not clear the error")
+
+        # Restart: the saved value is served before any fetch
+        before = stub.profiles()
+        restarted = new_cache(ttl=0.0)
+        start = time.perf_counter()
+        snapshot = restarted.get()
+        print(f"after restart             {(time.perf_counter() - start) * 1e6:>9.1f} us, state {snapshot.state}, "
+              f"stars {snapshot.value.stars if snapshot.value else None}")
+        restarted.refresh().result()
+        if snapshot.value is None or snapshot.value.stars != totals[1]:
+            failures.append("restart did not serve the saved value")
+
+
+ACCOUNT_PROBE = "import json; from portfolio import github; print(json.dumps([github.user(), github.stats() is not None]))"
+
+
+def write_config(path, **github_config):
+    config = toml.load(settings.CONFIG_PATH)
+    config["portfolio"]["github"].update(github_config)
+    path.write_text(toml.dumps(config), encoding="utf-8")
+    return path
+
+
+def accounts(directory, failures):
+    directory = Path(directory)
+    data = json.loads(CONTENT_PATH.read_text(encoding="utf-8"))
+    data["about"]["github"] = f"https://github.com/{USER}-about/"
+    content = directory / "content.json"
+    content.write_text(json.dumps(data), encoding="utf-8")
+    config = write_config(directory / "config.toml", user=f"{USER}-config")
+    base = {name: value for name, value in os.environ.items()
+            if name not in ("PORTFOLIO_GITHUB_USER", "PORTFOLIO_CONFIG", "PORTFOLIO_CONTENT")}
+    for label, env, expected in (
+        ("as shipped", {}, ""),
+        ("About URL", {"PORTFOLIO_CONTENT": str(content)}, f"{USER}-about"),
+        ("config user", {"PORTFOLIO_CONTENT": str(content), "PORTFOLIO_CONFIG": str(config)}, f"{USER}-config"),
+        ("environment", {"PORTFOLIO_CONTENT": str(content), "PORTFOLIO_CONFIG": str(config),
+                         "PORTFOLIO_GITHUB_USER": USER}, USER),
+    ):
+        proc = subprocess.run([sys.executable, "-c", ACCOUNT_PROBE], cwd=ROOT, env=dict(base, **env),
+                              capture_output=True, text=True, check=True)
+        name, has_cache = json.loads(proc.stdout)
+        print(f"account {label:<16}  {name or '(none)':<22} stats cache: {has_cache}")
+        if name != expected or has_cache != bool(expected):
+            failures.append(f"account {label}: got {name or '(none)'}, expected {expected or '(none)'}")
+
+
+class ContactSession(loadgen.AppSession):
+    metrics = ()
+
+    def element(self, element_type, proto):
+        if element_type == "metric":
+            self.metrics = (*self.metrics, proto.label)
+
+
+async def live(stub, args, data_dir, failures):
+    port = loadgen.free_port()
+    stub.latency = args.latency_live
+    # The account and API come from the config file, as a deployment sets them
+    config = write_config(Path(data_dir) / "config.toml", user=USER, api_url=stub.url)
+    env = {name: value for name, value in os.environ.items()
+           if name not in ("PORTFOLIO_GITHUB_USER", "PORTFOLIO_GITHUB_API")}
+    env.update(PORTFOLIO_DATA_DIR=data_dir, PORTFOLIO_METRICS_PORT="0", PORTFOLIO_WARMUP="0",
+               PORTFOLIO_CONFIG=str(config))
+    process = subprocess.Popen(
+        [sys.executable, "-m", "portfolio.serve", "--server.port", str(port), "--server.headless", "true",
+         "--browser.gatherUsageStats", "false"],
+        cwd=ROOT, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+    )
+    sessions = [ContactSession(f"ws://127.0.0.1:{port}") for _ in range(args.users)]
+    try:
+        loadgen.wait_healthy(f"http://127.0.0.1:{port}", process)
+        for session in sessions:
+            await session.connect()
+            await session.run()
+        before = stub.profiles()
+        start = time.perf_counter()
+        results = await asyncio.gather(*(session.goto(CONTACT) for session in sessions))
+        latencies = sorted(result.latency for result in results)
+        shown = sum("Public Repositories" in session.metrics for session in sessions)
+        print(f"{args.users} visitors open Contact   {statistics.median(latencies) * 1000:>7.0f} ms median, "
+              f"{latencies[-1] * 1000:.0f} ms max with {args.latency_live * 1000:.0f} ms API latency; "
+              f"stats shown to {shown}")
+        if latencies[-1] >= args.latency_live:
+            failures.append(f"Contact rerun took {latencies[-1] * 1000:.0f} ms: it waited for the API")
+        # A new visitor every second until the stats show up
+        deadline = time.monotonic() + 30
+        visitors = 0
+        while time.monotonic() < deadline:
+            session = ContactSession(f"ws://127.0.0.1:{port}")
+            await session.connect()
+            await session.run()
+            await session.goto(CONTACT)
+            await session.close()
+            visitors += 1
+            if "Public Repositories" in session.metrics:
+                break
+            await asyncio.sleep(1.0)
+        fetched = stub.profiles() - before
+        print(f"stats shown after {time.perf_counter() - start:.1f} s, {fetched} fetch for "
+              f"{args.users + visitors} visitors")
+        if fetched != 1:
+            failures.append(f"{args.users + visitors} visitors caused {fetched} fetches")
+        if "Public Repositories" not in session.metrics:
+            failures.append("stats were not shown once fetched")
+    finally:
+        for session in sessions:
+            await session.close()
+        process.terminate()
+        process.wait(timeout=30)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--latency", type=float, default=0.3, help="stub latency per request (s)")
+    parser.add_argument("--latency-live", type=float, default=2.0, help="stub latency for the live check (s), under [portfolio.github] timeout")
+    parser.add_argument("--repos", type=int, default=250)
+    parser.add_argument("--threads", type=int, default=200)
+    parser.add_argument("--users", type=int, default=8)
+    parser.add_argument("--retry-after", type=float, default=60.0)
+    args = parser.parse_args()
+
+    failures = []
+    stub = Stub(args.repos, args.latency)
+    try:
+        in_process(stub, args, failures)
+        with tempfile.TemporaryDirectory() as directory:
+            accounts(directory, failures)
+        with tempfile.TemporaryDirectory() as data_dir:
+            asyncio.run(live(stub, args, data_dir, failures))
+    finally:
+        stub.shutdown()
+
+    for failure in failures:
+        print(f"FAIL {failure}")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
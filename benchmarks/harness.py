@@ -0,0 +1,62 @@
+"""Helpers for driving app1.py headlessly through Streamlit's AppTest."""
+import logging
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+APP_SCRIPT = os.path.join(ROOT, "app1.py")
+
+# Benchmarks time cold and warm reruns themselves: no background warm-up in the same
+# process, and no figures read back from the shared render cache of earlier runs
+os.environ.setdefault("PORTFOLIO_WARMUP", "0")
+os.environ.setdefault("PORTFOLIO_RENDER_CACHE", "0")
+
+
+def quiet():
+    # AppTest logs every script run (and deprecation notices) at WARNING
+    logging.disable(logging.WARNING)
+
+
+def new_app(script=APP_SCRIPT, timeout=120):
+    from streamlit.testing.v1 import AppTest
+
+    at = AppTest.from_file(script, default_timeout=timeout)
+    at.run()
+    check(at)
+    return at
+
+
+def check(at):
+    if at.exception:
+        raise RuntimeError(at.exception[0].message)
+
+
+def select_page(at, page):
+    at.sidebar.radio[0].set_value(page)
+    at.run()
+    check(at)
+
+
+def page_labels(at):
+    return list(at.sidebar.radio[0].options)
+
+
+def count_elements(node):
+    children = getattr(node, "children", None) or {}
+    return (0 if children else 1) + sum(count_elements(child) for child in children.values())
+
+
+def clear_caches():
+    """Forget everything the app keeps between reruns in this process."""
+    import streamlit as st
+
+    from portfolio import components, content, figures
+
+    figures.figure_cache.clear()
+    components._render_badges.cache_clear()
+    content.store = content.ContentStore(content.CONTENT_PATH)
+    st.cache_data.clear()
+    st.cache_resource.clear()
+    # Page modules are re-imported on their next render
+    for name in [name for name in sys.modules if name.startswith("portfolio.pages.")]:
+        del sys.modules[name]
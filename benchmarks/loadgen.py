@@ -0,0 +1,267 @@
+"""Concurrent-session load generator for a local Streamlit server.
+
+Each virtual visitor opens its own websocket session (``/_stcore/stream``),
+speaks Streamlit's protobuf protocol like the browser does, and navigates the
+sidebar pages with think time in between, occasionally submitting the contact
+form. Concurrency ramps through the given stages; every stage reports
+throughput, rerun latency percentiles and the error rate.
+
+    python -m benchmarks.loadgen --spawn --stages 1,5,10,25,50 --duration 20
+    python -m benchmarks.loadgen --url ws://127.0.0.1:8501 --stages 10
+
+``--spawn`` starts ``streamlit run app1.py`` on a free port with a throwaway
+data directory and stops it afterwards, so everything runs offline on one box.
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import urllib.request
+
+import websockets
+from streamlit.proto.BackMsg_pb2 import BackMsg
+from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+from streamlit.proto.WidgetStates_pb2 import WidgetState
+
+from benchmarks.harness import APP_SCRIPT, ROOT
+from portfolio.pages import PAGES
+
+# Relative popularity of each sidebar page for a typical visit
+PAGE_WEIGHTS = {
+    "🏠 Home": 25, "👨‍💼 About": 8, "🛠️ Skills": 15, "💼 Experience": 12,
+    "🚀 Projects": 20, "🏆 Achievements": 5, "📜 Certifications": 8, "📞 Contact": 7,
+}
+SUBMIT_SHARE = 0.3  # share of Contact visits that send the form
+
+FINISHED = (ForwardMsg.FINISHED_SUCCESSFULLY, ForwardMsg.FINISHED_FRAGMENT_RUN_SUCCESSFULLY)
+
+
+class RunResult:
+    __slots__ = ("latency", "received", "elements", "error")
+
+    def __init__(self, latency, received, elements, error):
+        self.latency = latency
+        self.received = received
+        self.elements = elements
+        self.error = error
+
+
+class AppSession:
+    """One browser-like session: sends rerun requests, collects the resulting deltas."""
+
+    def __init__(self, url):
+        self.url = url.rstrip("/") + "/_stcore/stream"
+        self.widgets = {}  # (element type, label) -> widget id
+        self.fragments = {}  # (element type, label) -> fragment id, for widgets inside fragments
+        self.ws = None
+
+    async def connect(self):
+        self.ws = await websockets.connect(self.url, subprotocols=["streamlit"], max_size=None)
+
+    async def close(self):
+        if self.ws is not None:
+            await self.ws.close()
+
+    def element(self, element_type, proto):
+        """Called for every new element of a run; subclasses can inspect the content."""
+
+    async def run(self, states=(), fragment_id="", query_string=""):
+        msg = BackMsg()
+        msg.rerun_script.query_string = query_string
+        msg.rerun_script.widget_states.widgets.extend(states)
+        if fragment_id:
+            msg.rerun_script.fragment_id = fragment_id
+
+        start = time.perf_counter()
+        await self.ws.send(msg.SerializeToString())
+        received = elements = 0
+        error = None
+        while True:
+            frame = await self.ws.recv()
+            received += len(frame)
+            forward = ForwardMsg()
+            forward.ParseFromString(frame)
+            kind = forward.WhichOneof("type")
+            if kind == "delta" and forward.delta.WhichOneof("type") == "new_element":
+                elements += 1
+                element = forward.delta.new_element
+                element_type = element.WhichOneof("type")
+                if element_type == "exception":
+                    error = element.exception.message or "exception"
+                proto = getattr(element, element_type)
+                self.element(element_type, proto)
+                if hasattr(proto, "id") and hasattr(proto, "label") and proto.id:
+                    self.widgets[(element_type, proto.label)] = proto.id
+                    if forward.delta.fragment_id:
+                        self.fragments[(element_type, proto.label)] = forward.delta.fragment_id
+            elif kind == "script_finished":
+                if forward.script_finished == ForwardMsg.FINISHED_EARLY_FOR_RERUN:
+                    continue
+                if forward.script_finished not in FINISHED:
+                    error = error or "script failed"
+                break
+        return RunResult(time.perf_counter() - start, received, elements, error)
+
+    def state(self, element_type, label, **value):
+        widget = WidgetState(id=self.widgets[(element_type, label)])
+        for field, field_value in value.items():
+            setattr(widget, field, field_value)
+        return widget
+
+    def page_state(self, page):
+        return self.state("radio", "Go to:", string_value=page)
+
+    async def goto(self, page):
+        return await self.run([self.page_state(page)])
+
+    async def submit_contact(self, name, email, subject, message):
+        return await self.run([
+            self.page_state("📞 Contact"),
+            self.state("text_input", "Your Name", string_value=name),
+            self.state("text_input", "Your Email", string_value=email),
+            self.state("selectbox", "Subject", string_value=subject),
+            self.state("text_area", "Message", string_value=message),
+            self.state("button", "Send Message", trigger_value=True),
+        ])
+
+
+async def visitor(url, deadline, think, results, rng):
+    session = AppSession(url)
+    try:
+        await session.connect()
+        results.append(("connect", await session.run()))
+        pages, weights = list(PAGE_WEIGHTS), list(PAGE_WEIGHTS.values())
+        while time.monotonic() < deadline:
+            page = rng.choices(pages, weights)[0]
+            results.append((page, await session.goto(page)))
+            if page == "📞 Contact" and rng.random() < SUBMIT_SHARE:
+                n = rng.randrange(10 ** 9)
+                results.append(("contact_submit", await session.submit_contact(
+                    f"Load {n}", f"load{n}@example.com", "General Inquiry", f"Load test message {n}")))
+            await asyncio.sleep(rng.expovariate(1 / think) if think else 0)
+    except (OSError, websockets.WebSocketException, KeyError) as exc:
+        results.append(("session", RunResult(0.0, 0, 0, f"{type(exc).__name__}: {exc}")))
+    finally:
+        await session.close()
+
+
+def percentile(ordered, pct):
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct / 100))] if ordered else 0.0
+
+
+async def run_stage(url, users, duration, think, seed):
+    results = []
+    deadline = time.monotonic() + duration
+    start = time.perf_counter()
+    await asyncio.gather(*(
+        visitor(url, deadline, think, results, random.Random(seed * 10_000 + i)) for i in range(users)
+    ))
+    wall = time.perf_counter() - start
+
+    reruns = [r for _, r in results if r.latency]
+    latencies = sorted(r.latency * 1000 for r in reruns if not r.error)
+    errors = [r.error for _, r in results if r.error]
+    return {
+        "users": users,
+        "reruns": len(reruns),
+        "throughput_rps": len(reruns) / wall,
+        "p50_ms": percentile(latencies, 50),
+        "p90_ms": percentile(latencies, 90),
+        "p99_ms": percentile(latencies, 99),
+        "mean_ms": statistics.fmean(latencies) if latencies else 0.0,
+        "error_rate": len(errors) / max(1, len(results)),
+        "submits": sum(1 for action, _ in results if action == "contact_submit"),
+        "mib_received": sum(r.received for _, r in results) / 2 ** 20,
+        "sample_errors": sorted(set(errors))[:3],
+    }
+
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def wait_healthy(http_url, process, timeout=60):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if process is not None and process.poll() is not None:
+            raise RuntimeError("streamlit exited during startup")
+        try:
+            with urllib.request.urlopen(http_url.rstrip("/") + "/_stcore/health", timeout=2) as resp:
+                if resp.status == 200:
+                    return
+        except OSError:
+            time.sleep(0.2)
+    raise TimeoutError(f"{http_url} did not become healthy")
+
+
+def spawn_server(port, data_dir, script=APP_SCRIPT, extra_env=None):
+    """Start ``streamlit run`` headless on ``port``; returns the Popen."""
+    env = dict(os.environ, PORTFOLIO_DATA_DIR=data_dir, PORTFOLIO_METRICS_PORT="0", **(extra_env or {}))
+    process = subprocess.Popen(
+        [sys.executable, "-m", "streamlit", "run", script, "--server.port", str(port),
+         "--server.headless", "true", "--server.enableStaticServing", "true",
+         "--browser.gatherUsageStats", "false"],
+        cwd=ROOT, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+    )
+    wait_healthy(f"http://127.0.0.1:{port}", process)
+    return process
+
+
+def print_stage(row):
+    print(f"{row['users']:>6}{row['reruns']:>9}{row['throughput_rps']:>10.1f}{row['p50_ms']:>9.1f}"
+          f"{row['p90_ms']:>9.1f}{row['p99_ms']:>9.1f}{row['error_rate']:>9.2%}{row['submits']:>9}")
+    for error in row["sample_errors"]:
+        print(f"{'':>6}error: {error}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--url", default="ws://127.0.0.1:8501", help="server to load (ignored with --spawn)")
+    parser.add_argument("--spawn", action="store_true", help="start a local streamlit server for the run")
+    parser.add_argument("--stages", default="1,5,10,25", help="comma-separated concurrent visitors per stage")
+    parser.add_argument("--duration", type=float, default=15.0, help="seconds per stage")
+    parser.add_argument("--think", type=float, default=0.5, help="mean think time between clicks (seconds)")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--json", help="write stage results to this file")
+    args = parser.parse_args()
+
+    assert set(PAGE_WEIGHTS) == set(PAGES), "PAGE_WEIGHTS is out of date with portfolio.pages.PAGES"
+
+    process = tmp = None
+    url = args.url
+    if args.spawn:
+        tmp = tempfile.TemporaryDirectory()
+        port = free_port()
+        process = spawn_server(port, tmp.name)
+        url = f"ws://127.0.0.1:{port}"
+
+    rows = []
+    try:
+        print(f"{'users':>6}{'reruns':>9}{'rerun/s':>10}{'p50 ms':>9}{'p90 ms':>9}{'p99 ms':>9}{'errors':>9}{'submits':>9}")
+        for stage, users in enumerate(int(n) for n in args.stages.split(",")):
+            row = asyncio.run(run_stage(url, users, args.duration, args.think, args.seed + stage))
+            print_stage(row)
+            rows.append(row)
+    finally:
+        if process is not None:
+            process.terminate()
+            process.wait(timeout=30)
+            tmp.cleanup()
+
+    if args.json:
+        with open(args.json, "w") as fh:
+            json.dump(rows, fh, indent=2, ensure_ascii=False)
+    return 1 if any(row["error_rate"] for row in rows) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
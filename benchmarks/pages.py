@@ -0,0 +1,141 @@
+"""Per-page rerun benchmark driven through Streamlit's AppTest harness.
+
+Every sidebar page is selected and re-run N times cold (all app caches
+cleared and page modules re-imported before each run) and N times warm.
+Reports wall time, peak traced memory and the number of emitted elements.
+
+    python -m benchmarks.pages --runs 20 --out bench.json
+    python -m benchmarks.pages --out new.json --compare bench.json --threshold 0.15
+
+With --compare, exits non-zero if any page's median wall time or peak memory
+grew by more than the threshold.
+"""
+import argparse
+import datetime
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+
+from benchmarks import harness
+
+
+def timed_runs(at, runs, cold):
+    times = []
+    for _ in range(runs):
+        if cold:
+            harness.clear_caches()
+        start = time.perf_counter()
+        at.run()
+        times.append((time.perf_counter() - start) * 1000)
+        harness.check(at)
+    return times
+
+
+def traced_peak(at, cold):
+    # Traced separately: tracemalloc slows every allocation down
+    if cold:
+        harness.clear_caches()
+    tracemalloc.start()
+    try:
+        at.run()
+        return tracemalloc.get_traced_memory()[1] / 1024
+    finally:
+        tracemalloc.stop()
+
+
+def summarize(times):
+    ordered = sorted(times)
+    return {
+        "median": statistics.median(ordered),
+        "p90": ordered[min(len(ordered) - 1, int(len(ordered) * 0.9))],
+        "min": ordered[0],
+    }
+
+
+def measure(runs):
+    at = harness.new_app()
+    results = {}
+    for page in harness.page_labels(at):
+        harness.select_page(at, page)
+        row = {"elements": harness.count_elements(at._tree)}
+        for mode, cold in (("cold", True), ("warm", False)):
+            if not cold:
+                at.run()  # prime the caches once before timing warm reruns
+            row[mode] = {"wall_ms": summarize(timed_runs(at, runs, cold)), "peak_kib": traced_peak(at, cold)}
+        results[page] = row
+    return results
+
+
+def git_revision():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=harness.ROOT,
+                              capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(current, baseline, threshold):
+    regressions = []
+    for page, row in current["pages"].items():
+        old = baseline["pages"].get(page)
+        if old is None:
+            continue
+        for mode in ("cold", "warm"):
+            for metric, new_value, old_value in (
+                ("wall_ms", row[mode]["wall_ms"]["median"], old[mode]["wall_ms"]["median"]),
+                ("peak_kib", row[mode]["peak_kib"], old[mode]["peak_kib"]),
+            ):
+                if old_value and (new_value - old_value) / old_value > threshold:
+                    regressions.append((page, mode, metric, old_value, new_value))
+    return regressions
+
+
+def print_table(report):
+    print(f"{'page':<20}{'elements':>9}{'cold ms':>10}{'cold KiB':>11}{'warm ms':>10}{'warm KiB':>11}")
+    for page, row in report["pages"].items():
+        print(f"{page:<20}{row['elements']:>9}"
+              f"{row['cold']['wall_ms']['median']:>10.1f}{row['cold']['peak_kib']:>11.0f}"
+              f"{row['warm']['wall_ms']['median']:>10.1f}{row['warm']['peak_kib']:>11.0f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=10, help="cold and warm reruns per page")
+    parser.add_argument("--out", help="write results as JSON to this file")
+    parser.add_argument("--compare", help="baseline JSON produced by an earlier --out")
+    parser.add_argument("--threshold", type=float, default=0.2, help="allowed relative growth (default 0.2)")
+    args = parser.parse_args()
+
+    harness.quiet()
+    report = {
+        "meta": {
+            "revision": git_revision(),
+            "python": platform.python_version(),
+            "created": datetime.datetime.now(datetime.timezone.utc).isoformat(timespec="seconds"),
+            "runs": args.runs,
+        },
+        "pages": measure(args.runs),
+    }
+    print_table(report)
+    if args.out:
+        with open(args.out, "w") as fh:
+            json.dump(report, fh, indent=2, ensure_ascii=False)
+
+    if args.compare:
+        with open(args.compare) as fh:
+            baseline = json.load(fh)
+        regressions = compare(report, baseline, args.threshold)
+        for page, mode, metric, old, new in regressions:
+            print(f"REGRESSION {page} {mode} {metric}: {old:.1f} -> {new:.1f} ({(new - old) / old:+.0%})")
+        if regressions:
+            return 1
+        print(f"no regressions beyond {args.threshold:.0%} against {baseline['meta'].get('revision')}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,118 @@
+"""Per-page payload bytes against a live server, with a budget check.
+
+Each sidebar page is opened in a fresh websocket session (``?page=<module>``)
+on a spawned local server. A first view costs the protocol messages of that
+rerun, the static files it links (stylesheet, chart snapshots) and, if the
+page shows an interactive Plotly chart, Streamlit's lazily loaded Plotly
+bundle (gzip size); a repeat view costs only the protocol messages, since
+the linked files are cached by the browser.
+
+    python -m benchmarks.payload                          # static chart snapshots (default)
+    python -m benchmarks.payload --mode both --budget-kib 64
+
+Exits non-zero if any page's first view exceeds the budget in a checked mode.
+"""
+import argparse
+import asyncio
+import gzip
+import re
+import sys
+import tempfile
+import urllib.request
+from pathlib import Path
+
+import streamlit
+
+from benchmarks.loadgen import AppSession, free_port, spawn_server
+from portfolio.pages import PAGES
+
+STATIC_LINK = re.compile(r'(?:src|href)="(app/static/[^"]+)"')
+
+
+def plotly_bundle_bytes():
+    bundles = sorted((Path(streamlit.__file__).parent / "static" / "static" / "js").glob("PlotlyChart.*.js"))
+    return len(gzip.compress(bundles[0].read_bytes())) if bundles else 0
+
+
+class PayloadSession(AppSession):
+    def __init__(self, url):
+        super().__init__(url)
+        self.links = set()
+        self.plotly_charts = 0
+
+    def element(self, element_type, proto):
+        if element_type == "markdown":
+            self.links.update(STATIC_LINK.findall(proto.body))
+        elif element_type == "plotly_chart":
+            self.plotly_charts += 1
+
+
+def fetch_size(http_url, path):
+    with urllib.request.urlopen(f"{http_url}/{path}", timeout=10) as resp:
+        return len(resp.read())
+
+
+async def page_payload(port, page, bundle):
+    session = PayloadSession(f"ws://127.0.0.1:{port}")
+    await session.connect()
+    try:
+        result = await session.run(query_string=f"page={PAGES[page]}")
+    finally:
+        await session.close()
+    if result.error:
+        raise RuntimeError(f"{page}: {result.error}")
+    static = sum(fetch_size(f"http://127.0.0.1:{port}", link) for link in sorted(session.links))
+    renderer = bundle if session.plotly_charts else 0
+    return {
+        "protocol": result.received,
+        "static": static,
+        "renderer": renderer,
+        "first_view": result.received + static + renderer,
+        "repeat_view": result.received,
+    }
+
+
+def measure(mode, bundle):
+    with tempfile.TemporaryDirectory() as data_dir:
+        port = free_port()
+        process = spawn_server(port, data_dir, extra_env={"PORTFOLIO_CHART_MODE": mode})
+        try:
+            return {page: asyncio.run(page_payload(port, page, bundle)) for page in PAGES}
+        finally:
+            process.terminate()
+            process.wait(timeout=30)
+
+
+def print_table(mode, rows):
+    print(f"[{mode}]")
+    print(f"{'page':<20}{'protocol':>10}{'static':>10}{'renderer':>11}{'first KiB':>11}{'repeat KiB':>12}")
+    for page, row in rows.items():
+        print(f"{page:<20}{row['protocol']:>10,}{row['static']:>10,}{row['renderer']:>11,}"
+              f"{row['first_view'] / 1024:>11.1f}{row['repeat_view'] / 1024:>12.1f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--mode", choices=("static", "interactive", "both"), default="static",
+                        help="chart mode to measure (PORTFOLIO_CHART_MODE for the spawned server)")
+    parser.add_argument("--budget-kib", type=float, default=64.0, help="allowed first-view KiB per page")
+    parser.add_argument("--check", choices=("static", "interactive", "both"), default="static",
+                        help="which measured mode must stay within the budget")
+    args = parser.parse_args()
+
+    bundle = plotly_bundle_bytes()
+    modes = ("static", "interactive") if args.mode == "both" else (args.mode,)
+    over = []
+    for mode in modes:
+        rows = measure(mode, bundle)
+        print_table(mode, rows)
+        if args.check in (mode, "both"):
+            over += [(mode, page, row["first_view"]) for page, row in rows.items()
+                     if row["first_view"] > args.budget_kib * 1024]
+    for mode, page, size in over:
+        print(f"OVER BUDGET [{mode}] {page}: {size / 1024:.1f} KiB > {args.budget_kib:.1f} KiB")
+    return 1 if over else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
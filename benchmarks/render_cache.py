@@ -0,0 +1,163 @@
+"""Shared render cache: cold start across a restart, hit rate, concurrency, eviction.
+
+Restart: fresh interpreters render every sidebar page once (outside a script
+run, like the boot warm-up) against a temporary data directory:
+
+* ``off``: with the render cache turned off, as before;
+* ``cold``: with an empty cache, which the run fills;
+* ``restart``: a new process over the filled cache.
+
+Reports time to first render per page, figures built and the shared-cache
+hit rate of each run. Chart snapshots in static/charts/ are reused by all
+runs, as they are across restarts of one checkout.
+
+Concurrency: ``--processes`` interpreters write and read ``--entries``
+values each into one cache file at the same time; every value must read
+back intact and no operation may fail. Eviction: ``--entries`` 64 KiB values
+go into a 1 MiB cache; it must stay under budget and keep the most
+recently used ones. Also reports hit and miss lookup time.
+
+    python -m benchmarks.render_cache [--processes 4] [--entries 200]
+
+Fails if the restarted process builds a figure, is not faster than the cold
+one, or on any lost value, failed operation or budget overrun.
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from benchmarks.harness import ROOT
+from portfolio import render_cache
+
+PROBE = """
+import json, logging, sys, time
+logging.disable(logging.WARNING)
+start = time.perf_counter()
+from portfolio import figures, pages
+timings = {"import": time.perf_counter() - start}
+for page in pages.PAGES:
+    t = time.perf_counter()
+    pages.render(page)
+    timings[page] = time.perf_counter() - t
+stats = figures.figure_cache.stats()
+json.dump({"timings": timings, "total": time.perf_counter() - start, "misses": stats["misses"],
+           "shared_hits": stats["shared_hits"], "pandas": "pandas" in sys.modules}, sys.stdout)
+"""
+
+WRITER = """
+import json, sys
+from pathlib import Path
+from portfolio import render_cache
+path, worker, entries = Path(sys.argv[1]), int(sys.argv[2]), int(sys.argv[3])
+cache = render_cache.RenderCache(path)
+for i in range(entries):
+    cache.put("bench", f"{worker}.{i}", f"{worker}.{i}:" + "x" * 2000)
+    cache.get("bench", f"{(worker + 1) % 4}.{i}")
+bad = [i for i in range(entries) if cache.get("bench", f"{worker}.{i}") != f"{worker}.{i}:" + "x" * 2000]
+json.dump({"bad": len(bad), "broken": cache._broken}, sys.stdout)
+"""
+
+
+def probe(data_dir, enabled):
+    env = dict(os.environ, PORTFOLIO_DATA_DIR=data_dir, PORTFOLIO_RENDER_CACHE="1" if enabled else "0",
+               PORTFOLIO_WARMUP="0")
+    proc = subprocess.run([sys.executable, "-c", PROBE], cwd=ROOT, env=env, capture_output=True, text=True,
+                          check=True)
+    return json.loads(proc.stdout)
+
+
+def restart(failures):
+    with tempfile.TemporaryDirectory() as data_dir:
+        probe(data_dir, False)  # fill the OS file cache and static/charts/ first
+        runs = {"off": probe(data_dir, False), "cold": probe(data_dir, True), "restart": probe(data_dir, True)}
+    pages = [page for page in runs["off"]["timings"] if page != "import"]
+    print(f"{'first render ms':<22}" + "".join(f"{name:>10}" for name in runs))
+    for page in ["import", *pages]:
+        print(f"{page:<22}" + "".join(f"{run['timings'][page] * 1000:>10.1f}" for run in runs.values()))
+    print(f"{'total':<22}" + "".join(f"{run['total'] * 1000:>10.1f}" for run in runs.values()))
+    print(f"{'figures built':<22}" + "".join(f"{run['misses'] - run['shared_hits']:>10}" for run in runs.values()))
+    print(f"{'shared hit rate':<22}" + "".join(
+        f"{run['shared_hits'] / run['misses'] if run['misses'] else 0:>10.0%}" for run in runs.values()))
+    print(f"{'pandas imported':<22}" + "".join(f"{str(run['pandas']):>10}" for run in runs.values()))
+
+    cold, warm = runs["cold"], runs["restart"]
+    if warm["misses"] != warm["shared_hits"]:
+        failures.append(f"restart built {warm['misses'] - warm['shared_hits']} figures")
+    if warm["total"] >= cold["total"]:
+        failures.append(f"restart ({warm['total']:.2f} s) was not faster than cold ({cold['total']:.2f} s)")
+
+
+def concurrency(processes, entries, failures):
+    with tempfile.TemporaryDirectory() as directory:
+        path = Path(directory) / "render-cache.sqlite3"
+        start = time.perf_counter()
+        procs = [subprocess.Popen([sys.executable, "-c", WRITER, str(path), str(worker), str(entries)],
+                                  cwd=ROOT, stdout=subprocess.PIPE, text=True) for worker in range(processes)]
+        results = [json.loads(proc.communicate()[0]) for proc in procs]
+        elapsed = time.perf_counter() - start
+        stats = render_cache.RenderCache(path).stats()
+        print(f"{processes} processes x {entries} writes and reads: {elapsed:.1f} s, "
+              f"{stats['entries']} entries, {sum(r['bad'] for r in results)} lost, "
+              f"{sum(r['broken'] for r in results)} processes saw errors")
+        if any(r["bad"] or r["broken"] for r in results) or stats["entries"] != processes * entries:
+            failures.append(f"concurrent writers: {results}, {stats['entries']} entries")
+
+
+def eviction(entries, failures):
+    with tempfile.TemporaryDirectory() as directory:
+        cache = render_cache.RenderCache(Path(directory) / "render-cache.sqlite3", max_bytes=2 ** 20)
+        value = "x" * 64 * 1024
+        touch, render_cache.TOUCH_INTERVAL = render_cache.TOUCH_INTERVAL, 0.0
+        try:
+            cache.put("bench", "keep", value)
+            peak = 0
+            for i in range(entries):
+                cache.put("bench", str(i), value)
+                cache.get("bench", "keep")  # recently used: must survive
+                peak = max(peak, cache.stats()["bytes"])
+                time.sleep(0.001)
+        finally:
+            render_cache.TOUCH_INTERVAL = touch
+        kept = [i for i in range(entries) if cache.get("bench", str(i)) is not None]
+        print(f"{entries} x 64 KiB into 1 MiB: peak {peak / 2 ** 10:.0f} KiB, {len(kept)} kept "
+              f"(newest {kept[0] if kept else None}..{kept[-1] if kept else None}), "
+              f"recently used one kept: {cache.get('bench', 'keep') is not None}")
+        if peak > cache.max_bytes:
+            failures.append(f"cache grew to {peak} bytes over its {cache.max_bytes} budget")
+        if cache.get("bench", "keep") is None or not kept or kept[-1] != entries - 1:
+            failures.append("eviction dropped recently used entries")
+
+        times = {"hit": [], "miss": []}
+        for i in range(2000):
+            for result, key in (("hit", "keep"), ("miss", f"absent{i}")):
+                start = time.perf_counter()
+                cache.get("bench", key)
+                times[result].append(time.perf_counter() - start)
+        print("lookup " + ", ".join(f"{result} {statistics.median(t) * 1e6:.0f} us p50" for result, t in times.items())
+              + " (64 KiB value)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--processes", type=int, default=4)
+    parser.add_argument("--entries", type=int, default=200)
+    args = parser.parse_args()
+
+    failures = []
+    restart(failures)
+    concurrency(args.processes, args.entries, failures)
+    eviction(args.entries, failures)
+
+    for failure in failures:
+        print(f"FAIL {failure}")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,107 @@
+"""Sales demo: slicer queries from the pre-aggregated cube vs. grouping the raw orders.
+
+Generates ``--rows`` synthetic orders, builds the cube, then answers random
+slicer states (regions, categories, month range) both from the cube and the
+way a naive dashboard would -- filtering and grouping the raw rows with
+pandas -- and checks that both agree.
+
+    python -m benchmarks.sales_cube
+    python -m benchmarks.sales_cube --rows 50000000 --queries 500
+
+Fails if a cube query's p99 is over --budget-ms or any answer differs.
+"""
+import argparse
+import random
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+from portfolio.demos import sales
+
+
+def random_slicer(rng):
+    regions = rng.sample(sales.REGIONS, rng.randint(1, len(sales.REGIONS)))
+    categories = rng.sample(sales.CATEGORIES, rng.randint(1, len(sales.CATEGORIES)))
+    first = rng.randrange(sales.MONTHS)
+    return regions, categories, (first, rng.randrange(first, sales.MONTHS))
+
+
+def raw_query(frame, regions, categories, months):
+    # What the page would do without the cube
+    month = sales._DAY_MONTH[frame["day"].to_numpy()]
+    mask = (frame["region"].isin([sales.REGIONS.index(r) for r in regions])
+            & frame["category"].isin([sales.CATEGORIES.index(c) for c in categories])
+            & (month >= months[0]) & (month <= months[1]))
+    selected = frame[mask]
+    return {
+        "revenue": float(selected["amount"].astype(np.float64).sum()),
+        "orders": len(selected),
+        "by_region": selected.groupby("region")["amount"].sum(),
+        "daily": selected.groupby("day")["amount"].sum(),
+    }
+
+
+def percentile(values, q):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(q * len(values)))]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=sales.DEFAULT_ROWS)
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--raw-queries", type=int, default=5, help="slicer states also answered from raw rows")
+    parser.add_argument("--budget-ms", type=float, default=10.0, help="allowed p99 per cube query")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    orders = sales.generate(args.rows, args.seed)
+    print(f"generated {args.rows:,} orders in {time.perf_counter() - start:.1f} s")
+    cube = sales.SalesCube(orders)
+    print(f"built cube in {cube.build_seconds:.1f} s")
+
+    rng = random.Random(args.seed)
+    slicers = [random_slicer(rng) for _ in range(args.queries)]
+    cube_ms, sample_ms = [], []
+    for slicer in slicers:
+        start = time.perf_counter()
+        cube.query(*slicer)
+        cube_ms.append((time.perf_counter() - start) * 1000)
+        start = time.perf_counter()
+        cube.sample_orders(*slicer, sales.SCATTER_POINTS)
+        sample_ms.append((time.perf_counter() - start) * 1000)
+
+    failures = []
+    frame = pd.DataFrame(orders)
+    raw_ms = []
+    for slicer in slicers[:args.raw_queries]:
+        start = time.perf_counter()
+        expected = raw_query(frame, *slicer)
+        raw_ms.append((time.perf_counter() - start) * 1000)
+        got = cube.query(*slicer)
+        if got["orders"] != expected["orders"] or not np.isclose(got["revenue"], expected["revenue"], rtol=1e-6):
+            failures.append(f"{slicer}: cube and raw rows disagree")
+
+    print(f"{'':<26}{'p50 ms':>10}{'p99 ms':>10}")
+    print(f"{'cube query':<26}{percentile(cube_ms, 0.5):>10.2f}{percentile(cube_ms, 0.99):>10.2f}")
+    print(f"{'sampled orders':<26}{percentile(sample_ms, 0.5):>10.2f}{percentile(sample_ms, 0.99):>10.2f}")
+    print(f"{'raw rows (pandas)':<26}{percentile(raw_ms, 0.5):>10.1f}{percentile(raw_ms, 0.99):>10.1f}")
+    print(f"speedup at p50: {percentile(raw_ms, 0.5) / percentile(cube_ms, 0.5):,.0f}x")
+
+    days = np.arange(sales.DAYS)
+    x, y = sales.minmax_downsample(days, cube.revenue.sum(axis=(0, 1)), sales.DEFAULT_WEBGL_THRESHOLD // 2)
+    print(f"daily series: {sales.DAYS:,} points -> {len(x):,} after min/max downsampling")
+
+    p99 = percentile(cube_ms, 0.99)
+    if p99 > args.budget_ms:
+        failures.append(f"cube query p99 {p99:.2f} ms > {args.budget_ms} ms")
+    for failure in failures:
+        print(f"FAIL {failure}")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
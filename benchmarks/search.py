@@ -0,0 +1,120 @@
+"""Sidebar search: index build time and query latency, on the real content and 1000x of it.
+
+The synthetic content repeats every record of content.json ``--scale`` times,
+each copy with a few words from a generated vocabulary added, so common
+words ("data", "python") get posting lists 1000x longer and the vocabulary
+grows too. Queries are timed against the index itself (the per-query cache
+is bypassed), then through the cache.
+
+    python -m benchmarks.search
+    python -m benchmarks.search --scale 5000 --budget-ms 2
+
+Fails if a query's p99 is over --budget-ms, or if reruns rebuild the index.
+"""
+import argparse
+import gc
+import json
+import random
+import sys
+import time
+
+import numpy  # noqa: F401  (loaded up front so build times don't include the import)
+
+from benchmarks import harness
+from portfolio import content, search
+
+QUERIES = ("sql", "power bi", "pyth", "machine learning", "tableau", "data analysis", "c", "excel dash",
+           "certif", "leadership", "python data science", "zzz")
+
+
+def scaled_content(scale, seed):
+    raw = json.loads(content.CONTENT_PATH.read_text(encoding="utf-8"))
+    rng = random.Random(seed)
+    vocabulary = ["".join(rng.choice("abcdefghijklmnopqrstuvwxyz") for _ in range(rng.randint(4, 10)))
+                  for _ in range(20_000)]
+
+    def vary(text, copy):
+        return f"{text} {' '.join(rng.sample(vocabulary, 3))} batch{copy}"
+
+    for key, fields in (("experience", ("description",)), ("projects", ("description", "outcome")),
+                        ("achievements", ("description",)), ("certifications", ("description",))):
+        raw[key] = [dict(item, **{field: vary(item[field], copy) for field in fields})
+                    for copy in range(scale) for item in raw[key]]
+    for key in ("languages", "tech_tools", "core_skills"):
+        raw["skills"][key] = [vary(skill, copy) for copy in range(scale) for skill in raw["skills"][key]]
+    return content.parse_content(raw, f"synthetic-{scale}")
+
+
+def percentile(values, q):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(q * len(values)))]
+
+
+def time_queries(index, repeat):
+    # Like timeit: a collection triggered by other allocations is not the query's cost
+    gc.disable()
+    try:
+        return [time_query(index, query, repeat) for query in QUERIES]
+    finally:
+        gc.enable()
+
+
+def time_query(index, query, repeat):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        hits = index._search(query)
+        times.append((time.perf_counter() - start) * 1000)
+    return query, len(hits), percentile(times, 0.5), percentile(times, 0.99)
+
+
+def report(name, data, repeat, budget_ms, failures):
+    start = time.perf_counter()
+    index = search.SearchIndex(search.documents(data))
+    build = time.perf_counter() - start
+    print(f"\n{name}: {len(index.documents):,} documents, {len(index.terms):,} terms, built in {build * 1000:,.1f} ms")
+    print(f"{'query':<22}{'hits':>6}{'p50 ms':>10}{'p99 ms':>10}")
+    for query, hits, p50, p99 in time_queries(index, repeat):
+        print(f"{query:<22}{hits:>6}{p50:>10.3f}{p99:>10.3f}")
+        if p99 > budget_ms:
+            failures.append(f"{name}: '{query}' p99 {p99:.3f} ms > {budget_ms} ms")
+    index.search("power bi")
+    start = time.perf_counter()
+    for _ in range(1000):
+        index.search("power bi")
+    print(f"{'(cached)':<22}{'':>6}{(time.perf_counter() - start):>10.4f}")
+
+
+def check_reruns(failures):
+    harness.quiet()
+    at = harness.new_app()
+    at.sidebar.text_input(key="search").input("python").run()
+    builds = search.index_builds.value()
+    for query in ("sql", "power", "tableau"):
+        at.sidebar.text_input(key="search").input(query).run()
+        harness.check(at)
+    print(f"\n{search.index_builds.value() - builds} index rebuilds over 3 search reruns")
+    if search.index_builds.value() != builds:
+        failures.append("the index was rebuilt on a rerun")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--scale", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=200)
+    parser.add_argument("--budget-ms", type=float, default=1.0, help="allowed p99 per query")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    failures = []
+    report("content.json", content.get_content(), args.repeat, args.budget_ms, failures)
+    report(f"{args.scale}x synthetic", scaled_content(args.scale, args.seed), args.repeat, args.budget_ms, failures)
+    check_reruns(failures)
+
+    for failure in failures:
+        print(f"FAIL {failure}")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,75 @@
+"""Sentiment demo throughput: documents/sec at 1, 2, 4 and N worker processes.
+
+Builds a synthetic corpus once, then streams it through the demo's pipeline
+(chunked() -> score_stream() -> Trends) inline and with 1, 2, 4 and
+os.cpu_count() workers of the demo's shared pool (sized for the largest
+count). The pool is started before timing; the first chunk of each run
+still pays for warming the workers up.
+
+    python -m benchmarks.sentiment
+    python -m benchmarks.sentiment --docs 1000000 --workers 1,2,4,8,16
+
+Fails if any run scores differently from the inline one, or if speedup falls
+below --min-efficiency x workers for worker counts this machine has cores for.
+"""
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+from portfolio.demos import sentiment
+
+
+def run(corpus, workers, chunk_docs):
+    trends = sentiment.Trends()
+    scores = []
+    start = time.perf_counter()
+    for chunk, chunk_scores in sentiment.score_stream(sentiment.chunked(corpus, chunk_docs), workers):
+        trends.update(chunk, chunk_scores)
+        scores.append(chunk_scores)
+    return time.perf_counter() - start, np.concatenate(scores), trends
+
+
+def main():
+    cores = os.cpu_count() or 1
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--docs", type=int, default=300_000)
+    parser.add_argument("--workers", default=f"1,2,4,{cores}")
+    parser.add_argument("--chunk", type=int, default=sentiment.CHUNK_DOCS, help="documents per chunk")
+    parser.add_argument("--min-efficiency", type=float, default=0.7, help="required speedup / workers")
+    args = parser.parse_args()
+    counts = sorted({int(n) for n in args.workers.split(",")})
+
+    start = time.perf_counter()
+    corpus = list(sentiment.synthetic(args.docs))
+    print(f"generated {args.docs:,} posts in {time.perf_counter() - start:.1f} s on {cores} core(s)")
+
+    failures = []
+    base, expected, _ = run(corpus, 0, args.chunk)
+    print(f"{'workers':>8} {'seconds':>8} {'docs/s':>11} {'speedup':>8}")
+    print(f"{'inline':>8} {base:>8.2f} {args.docs / base:>11,.0f} {1:>7.2f}x")
+    single = None
+    pool = sentiment.start(max(counts))
+    pool.map(sentiment.score_chunk, [["warm up"]] * max(counts), chunksize=1)
+    for workers in counts:
+        elapsed, scores, _ = run(corpus, workers, args.chunk)
+        single = single or elapsed
+        speedup = single / elapsed
+        print(f"{workers:>8} {elapsed:>8.2f} {args.docs / elapsed:>11,.0f} {speedup:>7.2f}x")
+        if not np.array_equal(scores, expected):
+            failures.append(f"{workers} workers: scores differ from the inline run")
+        if workers <= cores and speedup < args.min_efficiency * workers:
+            failures.append(f"{workers} workers: {speedup:.2f}x speedup < {args.min_efficiency:.0%} of linear")
+    sentiment.shutdown()
+    if max(counts) > cores:
+        print(f"(speedup is only checked up to {cores} workers, the number of cores here)")
+
+    for failure in failures:
+        print(f"FAIL {failure}")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
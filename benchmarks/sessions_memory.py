@@ -0,0 +1,87 @@
+"""Memory retained per concurrent session.
+
+Opens hundreds of simulated sessions (one AppTest each, spread over every
+sidebar page) and keeps them alive. Memory is measured after a first and a
+second batch of sessions; the difference between the two is divided by the
+batch size, so one-off costs (imports, figure and content caches) don't count
+against the per-session figure. Fails if that figure exceeds the budget.
+
+    python -m benchmarks.sessions_memory --sessions 200 --budget-kib 128
+    python -m benchmarks.sessions_memory --trace   # also Python-heap bytes (slow)
+
+Both figures include AppTest's client-side copy of each session's element
+tree, so they overstate what the server keeps.
+"""
+import argparse
+import gc
+import resource
+import sys
+import tracemalloc
+
+from benchmarks import harness
+
+
+def rss_kib():
+    try:
+        with open("/proc/self/status") as fh:
+            for line in fh:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1])
+    except OSError:
+        pass
+    # Peak rather than current RSS, but still monotonic while sessions pile up
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+
+def open_sessions(count, labels, sessions):
+    for i in range(count):
+        at = harness.new_app()
+        harness.select_page(at, labels[i % len(labels)])
+        sessions.append(at)
+
+
+def measure(batch, trace):
+    probe = harness.new_app()
+    labels = harness.page_labels(probe)
+    sessions = []
+    # Warm every page and cache before measuring
+    open_sessions(2 * len(labels), labels, sessions)
+
+    if trace:
+        tracemalloc.start()
+    samples = []
+    for _ in range(2):
+        open_sessions(batch, labels, sessions)
+        gc.collect()
+        traced = tracemalloc.get_traced_memory()[0] / 1024 if trace else 0.0
+        samples.append((traced, rss_kib()))
+    tracemalloc.stop()
+
+    (traced_1, rss_1), (traced_2, rss_2) = samples
+    report = {"sessions": len(sessions), "rss_kib_per_session": (rss_2 - rss_1) / batch}
+    if trace:
+        report["traced_kib_per_session"] = (traced_2 - traced_1) / batch
+    return report
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sessions", type=int, default=200, help="sessions in each measured batch")
+    parser.add_argument("--budget-kib", type=float, default=128.0, help="allowed KiB per added session")
+    parser.add_argument("--trace", action="store_true", help="also measure the Python heap with tracemalloc")
+    args = parser.parse_args()
+
+    harness.quiet()
+    report = measure(args.sessions, args.trace)
+    for key, value in report.items():
+        print(f"{key:<24}{value:,.1f}" if isinstance(value, float) else f"{key:<24}{value}")
+
+    over = [key for key in ("traced_kib_per_session", "rss_kib_per_session")
+            if report.get(key, 0.0) > args.budget_kib]
+    for key in over:
+        print(f"OVER BUDGET {key}: {report[key]:.1f} KiB > {args.budget_kib:.1f} KiB")
+    return 1 if over else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
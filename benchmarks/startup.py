@@ -0,0 +1,156 @@
+"""Cold start, import time and first-paint latency per sidebar page.
+
+Every page is measured in a fresh interpreter: the default (Home) run is the
+cold start every new process pays, then the page is selected and rendered for
+the first time. Import time comes from ``python -X importtime`` and is split
+per phase, so it shows which page pulls in which libraries.
+
+    python -m benchmarks.startup                 # working tree
+    python -m benchmarks.startup --ref HEAD~1    # working tree vs. a git ref
+"""
+import argparse
+import json
+import os
+import re
+import statistics
+import subprocess
+import sys
+import tarfile
+import tempfile
+from io import BytesIO
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+PROBE = r"""
+import json, logging, sys, time
+logging.disable(logging.WARNING)
+from streamlit.testing.v1 import AppTest
+
+script, index = sys.argv[1], int(sys.argv[2])
+
+def phase(name):
+    print("@@" + name, file=sys.stderr, flush=True)
+
+def timed_run(at):
+    start = time.perf_counter()
+    at.run()
+    if at.exception:
+        raise SystemExit(at.exception[0].message)
+    return time.perf_counter() - start
+
+at = AppTest.from_file(script, default_timeout=120)
+phase("startup")
+startup = timed_run(at)
+radio = at.sidebar.radio[0]
+label = radio.options[index]
+radio.set_value(label)
+phase("first_paint")
+first_paint = timed_run(at)
+phase("rerun")
+rerun = timed_run(at)
+phase("end")
+print(json.dumps({"page": label, "startup": startup, "first_paint": first_paint, "rerun": rerun}))
+"""
+
+IMPORT_LINE = re.compile(r"import time:\s+\d+ \|\s+(\d+) \|( +)(\S+)")
+
+
+def import_times(stderr):
+    """Sum top-level import time (ms) between the probe's phase markers."""
+    totals, current, depth = {}, None, None
+    for line in stderr.splitlines():
+        if line.startswith("@@"):
+            current = line[2:]
+            totals[current] = 0.0
+            depth = None
+            continue
+        match = IMPORT_LINE.match(line)
+        if current is None or not match:
+            continue
+        # Nested imports are listed before their parent with deeper indentation,
+        # so only the shallowest lines of a phase are counted.
+        indent = len(match.group(2))
+        if depth is None or indent < depth:
+            depth = indent
+            totals[current] = 0.0
+        if indent == depth:
+            totals[current] += int(match.group(1)) / 1000
+    return totals
+
+
+def probe(script, index):
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", PROBE, script, str(index)],
+        capture_output=True, text=True, cwd=os.path.dirname(script),
+        # Measure the cold path; the warm-up thread would also skew the import split, and
+        # figures from the shared render cache would skip the chart libraries
+        env=dict(os.environ, PORTFOLIO_WARMUP="0", PORTFOLIO_RENDER_CACHE="0"),
+    )
+    if proc.returncode:
+        raise RuntimeError(proc.stderr[-2000:])
+    result = json.loads(proc.stdout.strip().splitlines()[-1])
+    imports = import_times(proc.stderr)
+    result["startup_import"] = imports.get("startup", 0.0)
+    result["first_paint_import"] = imports.get("first_paint", 0.0)
+    return result
+
+
+def page_count(script):
+    code = ("import logging; logging.disable(logging.WARNING)\n"
+            "from streamlit.testing.v1 import AppTest\n"
+            "at = AppTest.from_file(%r, default_timeout=120); at.run()\n"
+            "print(len(at.sidebar.radio[0].options))" % script)
+    out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+    return int(out.stdout.strip().splitlines()[-1])
+
+
+def measure(script, repeat):
+    rows = []
+    for index in range(page_count(script)):
+        runs = [probe(script, index) for _ in range(repeat)]
+        row = {"page": runs[0]["page"]}
+        for field in ("startup", "startup_import", "first_paint", "first_paint_import", "rerun"):
+            values = [run[field] for run in runs]
+            # Timings are in seconds except the import sums, which are already ms
+            scale = 1 if field.endswith("_import") else 1000
+            row[field] = statistics.median(values) * scale
+        rows.append(row)
+    return rows
+
+
+def checkout(ref, into):
+    archive = subprocess.run(["git", "archive", ref], cwd=ROOT, capture_output=True, check=True).stdout
+    with tarfile.open(fileobj=BytesIO(archive)) as tar:
+        tar.extractall(into)
+    return os.path.join(into, "app1.py")
+
+
+def print_table(title, rows):
+    print(f"\n{title}")
+    print(f"{'page':<20}{'startup ms':>12}{'import ms':>11}{'1st paint ms':>14}{'import ms':>11}{'rerun ms':>10}")
+    for row in rows:
+        print(f"{row['page']:<20}{row['startup']:>12.1f}{row['startup_import']:>11.1f}"
+              f"{row['first_paint']:>14.1f}{row['first_paint_import']:>11.1f}{row['rerun']:>10.1f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--ref", help="git ref to compare against (e.g. HEAD~1)")
+    parser.add_argument("--repeat", type=int, default=3, help="fresh processes per page (median is reported)")
+    parser.add_argument("--json", help="write results to this file")
+    args = parser.parse_args()
+
+    results = {"current": measure(os.path.join(ROOT, "app1.py"), args.repeat)}
+    if args.ref:
+        with tempfile.TemporaryDirectory() as tmp:
+            results[args.ref] = measure(checkout(args.ref, tmp), args.repeat)
+
+    for name, rows in results.items():
+        print_table(name, rows)
+    if args.json:
+        with open(args.json, "w") as fh:
+            json.dump(results, fh, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+"""First-visitor latency after a restart, with and without the boot warm-up.
+
+Each trial starts a fresh ``python -m portfolio.serve`` process -- once with
+``PORTFOLIO_WARMUP=0`` and once with the warm-up on -- and waits until the
+host would route traffic to it: Streamlit's health check, plus ``/ready``
+on the metrics port when warming up. One visitor then opens the app and
+every sidebar page in turn; the latency of each first view is recorded.
+Reports the median per page over ``--trials`` restarts and the time until
+the process was routable.
+
+    python -m benchmarks.warmup [--trials 3]
+
+Chart snapshots already in static/charts/ are reused by both modes, as they
+are across restarts of one checkout. Fails if the warmed first visit is not
+faster than the cold one.
+"""
+import argparse
+import asyncio
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import urllib.error
+import urllib.request
+
+from benchmarks import loadgen
+from benchmarks.harness import ROOT
+from portfolio.pages import PAGES
+
+
+def spawn(port, metrics_port, data_dir, warmup):
+    env = dict(os.environ, PORTFOLIO_DATA_DIR=data_dir, PORTFOLIO_METRICS_PORT=str(metrics_port),
+               PORTFOLIO_WARMUP="1" if warmup else "0")
+    return subprocess.Popen(
+        [sys.executable, "-m", "portfolio.serve", "--server.port", str(port), "--server.headless", "true",
+         "--server.enableStaticServing", "true", "--browser.gatherUsageStats", "false"],
+        cwd=ROOT, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+    )
+
+
+def wait_ready(metrics_port, process, timeout=120):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError("server exited during warm-up")
+        try:
+            with urllib.request.urlopen(f"http://127.0.0.1:{metrics_port}/ready", timeout=2) as resp:
+                if resp.status == 200:
+                    return
+        except (urllib.error.HTTPError, OSError):
+            time.sleep(0.05)
+    raise TimeoutError("warm-up did not finish")
+
+
+async def first_visit(url):
+    """Latency (s) of the first view of every page, Home (the initial run) first."""
+    session = loadgen.AppSession(url)
+    await session.connect()
+    try:
+        result = await session.run()
+        latencies = {"🏠 Home": result.latency}
+        for page in list(PAGES)[1:]:
+            result = await session.goto(page)
+            if result.error:
+                raise RuntimeError(f"{page}: {result.error}")
+            latencies[page] = result.latency
+        return latencies
+    finally:
+        await session.close()
+
+
+def trial(warmup):
+    port, metrics_port = loadgen.free_port(), loadgen.free_port()
+    with tempfile.TemporaryDirectory() as data_dir:
+        start = time.perf_counter()
+        process = spawn(port, metrics_port, data_dir, warmup)
+        try:
+            loadgen.wait_healthy(f"http://127.0.0.1:{port}", process)
+            if warmup:
+                wait_ready(metrics_port, process)
+            routable = time.perf_counter() - start
+            return routable, asyncio.run(first_visit(f"ws://127.0.0.1:{port}"))
+        finally:
+            process.terminate()
+            process.wait(timeout=30)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--trials", type=int, default=3, help="server restarts per mode")
+    args = parser.parse_args()
+
+    results = {}
+    for mode, warmup in (("cold", False), ("warm", True)):
+        runs = [trial(warmup) for _ in range(args.trials)]
+        results[mode] = {
+            "routable": statistics.median(routable for routable, _ in runs),
+            "pages": {page: statistics.median(latencies[page] for _, latencies in runs) for page in PAGES},
+        }
+
+    print(f"{'first view':<20}{'cold ms':>10}{'warm ms':>10}")
+    for page in PAGES:
+        print(f"{page:<20}{results['cold']['pages'][page] * 1000:>10.1f}{results['warm']['pages'][page] * 1000:>10.1f}")
+    totals = {mode: sum(result["pages"].values()) for mode, result in results.items()}
+    print(f"{'all pages':<20}{totals['cold'] * 1000:>10.1f}{totals['warm'] * 1000:>10.1f}")
+    print(f"{'start -> routable':<20}{results['cold']['routable'] * 1000:>10.0f}"
+          f"{results['warm']['routable'] * 1000:>10.0f}")
+
+    if totals["warm"] >= totals["cold"]:
+        print(f"FAIL warmed first visit {totals['warm'] * 1000:.0f} ms >= cold {totals['cold'] * 1000:.0f} ms")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,353 @@
+"""Visitor page-view log with incrementally maintained aggregates.
+
+``EventLog.page_view`` is called from script threads and only drops the event
+into a ``RingBuffer`` -- no lock, no I/O. A background writer thread drains
+the buffer every ``flush_interval`` seconds and appends the batch to a
+columnar on-disk log (one raw little-endian file per column), then folds the
+same batch into per-day, per-page counts. The counts are saved next to the
+log together with the number of rows they cover, so a restart only reads
+rows written after the last save and the dashboard never scans the log.
+
+Layout of the log directory::
+
+    ts.f8        float64 Unix time of each view
+    page.u1      uint8 index into pages.json
+    session.u4   uint32 hash of the visitor's session id
+    pages.json   page labels, in code order
+    aggregates.json   {"rows": covered rows, "days": {day number: [views per page code]}}
+"""
+import atexit
+import datetime
+import hmac
+import itertools
+import json
+import os
+import threading
+import time
+import zlib
+
+from portfolio import metrics, settings
+
+COLUMNS = (("ts", "<f8"), ("page", "u1"), ("session", "<u4"))
+DAY = 86400
+# Rows aggregated per step when catching up after a crash
+CHUNK_ROWS = 1 << 20
+
+
+class RingBuffer:
+    """Fixed-size multi-producer, single-consumer ring of events.
+
+    push() takes no lock: its sequence number comes from ``itertools.count``
+    (a single atomic call under the GIL) and the slot is filled with one
+    assignment. When producers lap the consumer the oldest events are
+    overwritten and counted in ``dropped``.
+    """
+
+    def __init__(self, capacity):
+        self.capacity = capacity
+        self._slots = [None] * capacity
+        self._seq = itertools.count()
+        self._read = 0
+        self.dropped = 0
+
+    def push(self, event):
+        seq = next(self._seq)
+        self._slots[seq % self.capacity] = (seq, event)
+
+    def drain(self, limit=None):
+        """Return the events pushed since the last drain, oldest first (consumer only)."""
+        events = []
+        while limit is None or len(events) < limit:
+            slot = self._slots[self._read % self.capacity]
+            if slot is None or slot[0] < self._read:
+                break  # not written yet
+            if slot[0] > self._read:
+                # Lapped: everything between our position and this slot was overwritten
+                self.dropped += slot[0] - self._read
+                self._read = slot[0]
+            events.append(slot[1])
+            self._read += 1
+        return events
+
+
+def _atomic_write(path, text):
+    tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    tmp.write_text(text, encoding="utf-8")
+    tmp.replace(path)
+
+
+class EventLog:
+    """Ring buffer in front of a columnar page-view log and its aggregates."""
+
+    def __init__(self, directory, capacity=65536, flush_interval=1.0):
+        self.directory = directory
+        self.flush_interval = flush_interval
+        self._ring = RingBuffer(capacity)
+
+        self._lock = threading.Lock()  # aggregates and page labels, never taken by page_view()
+        self._write_lock = threading.Lock()  # one appender at a time
+        self._labels = []
+        self._codes = {}
+        self._days = {}  # day number -> [views per page code]
+        self.rows = 0
+
+        self._wake = threading.Event()
+        self._flushed = threading.Condition()
+        self._generation = 0
+        self._stopping = False
+        self.counts = {"written": 0, "batches": 0, "dropped": 0}
+        self.error = None
+
+        # Opening (and catching up on) the log happens on the writer thread
+        self._ready = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="analytics-writer", daemon=True)
+        self._thread.start()
+
+    # Called on the script thread: no lock, no I/O
+    def page_view(self, page, session_id):
+        self._ring.push((time.time(), page, session_id))
+
+    def _path(self, name):
+        return self.directory / name
+
+    def _open(self):
+        import numpy as np
+
+        self.directory.mkdir(parents=True, exist_ok=True)
+        labels_path = self._path("pages.json")
+        if labels_path.exists():
+            self._labels = json.loads(labels_path.read_text(encoding="utf-8"))
+            self._codes = {label: code for code, label in enumerate(self._labels)}
+
+        # Columns are appended one after another; a crash can leave some longer
+        sizes = []
+        for name, dtype in COLUMNS:
+            path = self._path(f"{name}.{dtype[-2:]}")
+            sizes.append((path.stat().st_size if path.exists() else 0) // np.dtype(dtype).itemsize)
+        rows = min(sizes)
+        for (name, dtype), size in zip(COLUMNS, sizes):
+            if size > rows:
+                os.truncate(self._path(f"{name}.{dtype[-2:]}"), rows * np.dtype(dtype).itemsize)
+        self.rows = rows
+
+        covered = 0
+        aggregates_path = self._path("aggregates.json")
+        if aggregates_path.exists():
+            saved = json.loads(aggregates_path.read_text(encoding="utf-8"))
+            if saved["rows"] <= rows:
+                covered = saved["rows"]
+                self._days = {int(day): counts for day, counts in saved["days"].items()}
+
+        # Catch up on rows written after the last save
+        if covered < rows:
+            ts = np.memmap(self._path("ts.f8"), dtype="<f8", mode="r", shape=(rows,))
+            pages = np.memmap(self._path("page.u1"), dtype="u1", mode="r", shape=(rows,))
+            for start in range(covered, rows, CHUNK_ROWS):
+                self._aggregate(ts[start:start + CHUNK_ROWS], pages[start:start + CHUNK_ROWS])
+            del ts, pages
+            self._save_aggregates()
+
+    def _aggregate(self, ts, pages):
+        import numpy as np
+
+        keys = (np.asarray(ts) // DAY).astype(np.int64) * 256 + np.asarray(pages, dtype=np.int64)
+        unique, counts = np.unique(keys, return_counts=True)
+        with self._lock:
+            width = len(self._labels)
+            for key, count in zip(unique.tolist(), counts.tolist()):
+                day, code = divmod(key, 256)
+                row = self._days.setdefault(day, [0] * width)
+                if len(row) < width:
+                    row.extend([0] * (width - len(row)))
+                row[code] += count
+
+    def _save_aggregates(self):
+        with self._lock:
+            state = {"rows": self.rows, "days": {str(day): row for day, row in sorted(self._days.items())}}
+        _atomic_write(self._path("aggregates.json"), json.dumps(state, separators=(",", ":")))
+
+    def page_codes(self, labels):
+        """Codes for ``labels``, registering new pages (labels are saved before any row uses them)."""
+        new = [label for label in dict.fromkeys(labels) if label not in self._codes]
+        if new:
+            with self._lock:
+                for label in new:
+                    self._codes[label] = len(self._labels)
+                    self._labels.append(label)
+                snapshot = list(self._labels)
+            if len(snapshot) > 256:
+                raise ValueError("more than 256 distinct pages")
+            _atomic_write(self._path("pages.json"), json.dumps(snapshot, ensure_ascii=False))
+        return [self._codes[label] for label in labels]
+
+    def append_columns(self, ts, pages, sessions):
+        """Append one batch of rows (array-likes of equal length) and fold it into the aggregates.
+
+        ``pages`` are codes from page_codes(). The writer thread uses this for
+        buffered events; bulk loaders (see benchmarks/analytics_events.py) may call it directly.
+        """
+        import numpy as np
+
+        arrays = [np.asarray(column, dtype=dtype) for column, (_, dtype) in zip((ts, pages, sessions), COLUMNS)]
+        with self._write_lock:
+            for array, (name, dtype) in zip(arrays, COLUMNS):
+                with open(self._path(f"{name}.{dtype[-2:]}"), "ab") as fh:
+                    array.tofile(fh)
+            self._aggregate(arrays[0], arrays[1])
+            with self._lock:
+                self.rows += len(arrays[0])
+            self._save_aggregates()
+
+    def _write(self, events):
+        ts = [event[0] for event in events]
+        pages = self.page_codes([event[1] for event in events])
+        sessions = [zlib.crc32(event[2].encode("utf-8")) for event in events]
+        self.append_columns(ts, pages, sessions)
+
+    def _run(self):
+        try:
+            self._open()
+        except (OSError, ValueError) as exc:
+            self.error = exc
+        finally:
+            self._ready.set()
+        while True:
+            self._wake.wait(self.flush_interval)
+            self._wake.clear()
+            stopping = self._stopping
+            events = self._ring.drain()
+            try:
+                if events:
+                    self._write(events)
+                    self.counts["written"] += len(events)
+                    self.counts["batches"] += 1
+            except (OSError, ValueError) as exc:
+                self.counts["dropped"] += len(events)
+                self.error = exc
+            with self._flushed:
+                self._generation += 1
+                self._flushed.notify_all()
+            if stopping:
+                return
+
+    def flush(self, timeout=None):
+        """Block until events pushed before this call are on disk."""
+        with self._flushed:
+            target = self._generation + 2  # the pass in progress may have drained before our events
+            self._wake.set()
+            while self._generation < target:
+                if not self._flushed.wait(timeout):
+                    return False
+                self._wake.set()
+        return True
+
+    def close(self):
+        self._stopping = True
+        self._wake.set()
+        self._thread.join()
+
+    def summary(self, others=()):
+        """Views per page and per day from the aggregates; cost independent of the log size.
+
+        ``others`` are log directories of other worker processes (see ``worker_logs``),
+        counted as last saved by their writers.
+        """
+        self._ready.wait()
+        with self._lock:
+            sources = [(list(self._labels), {day: list(row) for day, row in self._days.items()}, self.rows)]
+        sources.extend(_saved(directory) for directory in others)
+        labels = list(dict.fromkeys(label for source_labels, _, _ in sources for label in source_labels))
+        totals = dict.fromkeys(labels, 0)
+        days = {}
+        for source_labels, source_days, _ in sources:
+            for day, row in source_days.items():
+                counts = days.setdefault(day, dict.fromkeys(labels, 0))
+                for label, count in zip(source_labels, row):
+                    counts[label] += count
+                    totals[label] += count
+        per_day = [(datetime.date(1970, 1, 1) + datetime.timedelta(days=day), days[day]) for day in sorted(days)]
+        return {
+            "rows": sum(rows for _, _, rows in sources),
+            "pages": totals,
+            "days": per_day,
+            "dropped": self._ring.dropped + self.counts["dropped"],
+        }
+
+
+def _saved(directory):
+    """(labels, days, rows) of a log as last saved by its writer, e.g. another worker's."""
+    try:
+        labels = json.loads((directory / "pages.json").read_text(encoding="utf-8"))
+        saved = json.loads((directory / "aggregates.json").read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return [], {}, 0
+    return labels, {int(day): counts for day, counts in saved["days"].items()}, saved["rows"]
+
+
+def log_directory():
+    # Under portfolio.launch every worker process appends to its own log
+    root = settings.DATA_DIR / "analytics"
+    worker = os.environ.get("PORTFOLIO_WORKER")
+    return root / worker if worker else root
+
+
+def worker_logs():
+    """Log directories written by other processes: the other workers', and a single-process log."""
+    own = log_directory()
+    root = settings.DATA_DIR / "analytics"
+    if own == root:
+        return []
+    others = [root] + sorted(path for path in root.iterdir() if path.is_dir() and path != own)
+    return [path for path in others if (path / "aggregates.json").exists()]
+
+
+def _analytics_metrics():
+    log = _log
+    if log is None:
+        return []
+    return [
+        "# HELP portfolio_analytics_events_total Page-view events by outcome.",
+        "# TYPE portfolio_analytics_events_total counter",
+        f'portfolio_analytics_events_total{{outcome="written"}} {log.counts["written"]}',
+        f'portfolio_analytics_events_total{{outcome="dropped"}} {log.summary()["dropped"]}',
+    ]
+
+
+metrics.COLLECTORS.append(_analytics_metrics)
+
+_log = None
+_log_lock = threading.Lock()
+
+
+def event_log():
+    """The process-wide EventLog from ``[portfolio.analytics]``, or None when disabled."""
+    global _log
+    if _log is not None:
+        return _log
+    config = settings.portfolio_config().get("analytics", {})
+    if not config.get("enabled", False):
+        return None
+    with _log_lock:
+        if _log is None:
+            _log = EventLog(
+                log_directory(),
+                capacity=int(config.get("capacity", 65536)),
+                flush_interval=float(config.get("flush_interval", 1.0)),
+            )
+            # Write out whatever is still buffered when the server shuts down
+            atexit.register(_log.close)
+        return _log
+
+
+def page_view(page, session_id):
+    log = event_log()
+    if log is not None:
+        log.page_view(page, session_id)
+
+
+def is_admin(token):
+    """True if ``token`` (the ``?admin=`` query parameter) opens the dashboard."""
+    config = settings.portfolio_config().get("analytics", {})
+    expected = os.environ.get("PORTFOLIO_ADMIN_TOKEN", config.get("admin_token", ""))
+    return bool(expected) and bool(token) and hmac.compare_digest(
+        str(token).encode("utf-8"), str(expected).encode("utf-8"))
@@ -0,0 +1,34 @@
+"""HTML snippets shared by several pages."""
+import functools
+
+BADGE_OPEN = '<span class="skill-badge">'
+BADGE_SEP = '</span><span class="skill-badge">'
+
+
+@functools.lru_cache(maxsize=256)
+def _render_badges(skills):
+    if not skills:
+        return ""
+    joined = "\0".join(skills)
+    has_nul = joined.count("\0") != len(skills) - 1
+    if not has_nul and not any(char in joined for char in "&<>"):
+        # Nothing to escape, as for ordinary skill names: join the names
+        # straight into the tags
+        names = list(skills)
+        names[0] = BADGE_OPEN + names[0]
+        names[-1] += "</span>"
+        return BADGE_SEP.join(names)
+    # Escape every name in one pass over the NUL-joined string (element text
+    # only needs &, < and >), then turn the separators into tag boundaries:
+    # linear and a handful of allocations.
+    if has_nul:
+        joined = "\0".join(skill.replace("\0", "") for skill in skills)
+    for char, entity in (("&", "&amp;"), ("<", "&lt;"), (">", "&gt;")):
+        if char in joined:
+            joined = joined.replace(char, entity)
+    return BADGE_OPEN + joined.replace("\0", BADGE_SEP) + "</span>"
+
+
+# Skill badges for a list of skill names, memoized per skill tuple
+def skill_badges(skills):
+    return _render_badges(tuple(skills))
@@ -0,0 +1,190 @@
+"""Portfolio content loaded from content.json.
+
+The file is parsed once per process into immutable, slotted records shared by
+every session. ``get_content()`` re-checks the file's mtime on each call and
+only re-parses when the bytes actually changed, so content can be edited on a
+running server without a restart. An edit that doesn't parse (half-written,
+or missing a field) is logged and the previous content kept serving.
+"""
+import hashlib
+import json
+import logging
+import os
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from types import MappingProxyType
+
+_LOGGER = logging.getLogger(__name__)
+
+CONTENT_PATH = Path(os.environ.get("PORTFOLIO_CONTENT", Path(__file__).with_name("content.json")))
+
+
+@dataclass(frozen=True, slots=True)
+class Education:
+    period: str
+    degree: str
+    field: str  # may be empty
+    school: str
+    grade: str
+
+
+@dataclass(frozen=True, slots=True)
+class About:
+    name: str
+    headline: str
+    location: str
+    email: str
+    phone: str
+    linkedin: str  # profile URLs, may be empty
+    github: str
+    summary: str  # Markdown
+    drivers: tuple  # (title, description) pairs
+    objective: str
+    education: tuple
+    interests: tuple
+
+
+@dataclass(frozen=True, slots=True)
+class Experience:
+    task: str
+    description: str
+    skills: tuple
+
+
+@dataclass(frozen=True, slots=True)
+class Project:
+    title: str
+    description: str
+    dataset: str
+    outcome: str
+
+
+@dataclass(frozen=True, slots=True)
+class Achievement:
+    title: str
+    date: str
+    description: str
+    category: str
+
+
+@dataclass(frozen=True, slots=True)
+class Certification:
+    title: str
+    issuer: str
+    description: str
+    skills: tuple
+
+
+@dataclass(frozen=True, slots=True)
+class Content:
+    version: str  # sha256 of content.json
+    about: About
+    languages: tuple
+    tech_tools: tuple
+    core_skills: tuple
+    skills_proficiency: MappingProxyType
+    skills_radar: MappingProxyType
+    experience: tuple
+    timeline: MappingProxyType
+    projects: tuple
+    project_impact: MappingProxyType
+    achievements: tuple
+    achievement_categories: MappingProxyType
+    certifications: tuple
+    cert_timeline: MappingProxyType
+    stats: MappingProxyType
+
+
+# Column-oriented chart data, e.g. {"Year": (2021, ...), "Event": (...)}
+def _table(columns):
+    return MappingProxyType({name: tuple(values) for name, values in columns.items()})
+
+
+def parse_content(raw, version):
+    skills = raw["skills"]
+    about = raw["about"]
+    return Content(
+        version=version,
+        about=About(
+            about["name"], about["headline"], about["location"], about["email"], about["phone"],
+            about["linkedin"], about["github"], about["summary"], tuple((d["title"], d["description"]) for d in about["drivers"]), about["objective"],
+            tuple(Education(e["period"], e["degree"], e["field"], e["school"], e["grade"]) for e in about["education"]),
+            tuple(about["interests"]),
+        ),
+        languages=tuple(skills["languages"]),
+        tech_tools=tuple(skills["tech_tools"]),
+        core_skills=tuple(skills["core_skills"]),
+        skills_proficiency=_table(skills["proficiency"]),
+        skills_radar=_table(skills["radar"]),
+        experience=tuple(
+            Experience(e["task"], e["description"], tuple(e["skills"])) for e in raw["experience"]
+        ),
+        timeline=_table(raw["timeline"]),
+        projects=tuple(
+            Project(p["title"], p["description"], p["dataset"], p["outcome"]) for p in raw["projects"]
+        ),
+        project_impact=_table(raw["project_impact"]),
+        achievements=tuple(
+            Achievement(a["title"], a["date"], a["description"], a["category"]) for a in raw["achievements"]
+        ),
+        achievement_categories=_table(raw["achievement_categories"]),
+        certifications=tuple(
+            Certification(c["title"], c["issuer"], c["description"], tuple(c["skills"]))
+            for c in raw["certifications"]
+        ),
+        cert_timeline=_table(raw["cert_timeline"]),
+        stats=_table(raw["stats"]),
+    )
+
+
+class ContentStore:
+    """Parse-once loader invalidated by the file's mtime and content hash."""
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self.loads = 0
+        self._lock = threading.Lock()
+        self._stamp = None
+        self._content = None
+
+    def get(self):
+        try:
+            stat = self.path.stat()
+        except OSError:
+            # Briefly missing while an editor replaces it; keep the last good records
+            if self._content is None:
+                raise
+            return self._content
+        stamp = (stat.st_mtime_ns, stat.st_size)
+        # Fast path: one stat() per rerun, no lock
+        if stamp == self._stamp:
+            return self._content
+
+        with self._lock:
+            if stamp != self._stamp:
+                try:
+                    self._reload()
+                except (OSError, ValueError, KeyError, TypeError, AttributeError) as exc:
+                    # Half-written or invalid: only the first load fails, later edits
+                    # keep serving the last good content until the file is fixed
+                    if self._content is None:
+                        raise
+                    _LOGGER.warning("%s not reloaded, serving the previous content: %r", self.path, exc)
+                self._stamp = stamp
+            return self._content
+
+    def _reload(self):
+        raw = self.path.read_bytes()
+        version = hashlib.sha256(raw).hexdigest()
+        # A touched but unchanged file keeps the existing records
+        if self._content is None or self._content.version != version:
+            self._content = parse_content(json.loads(raw), version)
+            self.loads += 1
+
+
+store = ContentStore(CONTENT_PATH)
+
+
+def get_content():
+    return store.get()
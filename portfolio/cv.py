@@ -0,0 +1,195 @@
+"""Downloadable CV built from content.json, cached on disk by content hash.
+
+``render_html(content)`` lays out the same records the About, Experience,
+Projects and Certifications pages show as one self-contained, print-ready
+HTML page (the browser's "Save as PDF" gives the PDF). Rendering happens
+on a background worker thread, never on a script thread: ``CVBuilder.get``
+returns the cached bytes -- from memory, else from
+``<data dir>/cv/cv-<key>.html`` -- or queues a build and returns None. The
+key hashes the content version and ``FORMAT``, so the file is rebuilt only
+when content.json or the template changes, and survives restarts.
+
+    python -m portfolio.cv --out cv.html   # write the CV for the current content.json
+"""
+import argparse
+import concurrent.futures
+import hashlib
+import html
+import logging
+import os
+import sys
+import threading
+from pathlib import Path
+
+from portfolio import metrics, settings
+from portfolio.content import get_content
+
+_LOGGER = logging.getLogger(__name__)
+
+# Bump when render_html's output changes, so cached files are rebuilt
+FORMAT = 1
+CV_DIR = settings.DATA_DIR / "cv"
+
+cv_renders = metrics.Counter("portfolio_cv_renders_total", "CV documents rendered (cache misses).")
+metrics.METRICS.append(cv_renders)
+
+STYLE = """
+body { font-family: "Source Sans Pro", Helvetica, Arial, sans-serif; color: #2c3e50; max-width: 50rem;
+       margin: 2rem auto; padding: 0 1.5rem; line-height: 1.45; }
+h1 { margin: 0; color: #1f77b4; } .headline { font-size: 1.2rem; margin: 0.2rem 0; }
+.contact { color: #666; margin-bottom: 1.5rem; }
+h2 { border-bottom: 2px solid #1f77b4; padding-bottom: 0.2rem; margin-top: 1.6rem; font-size: 1.25rem; }
+h3 { margin: 0.9rem 0 0.2rem; font-size: 1.05rem; } p { margin: 0.2rem 0; } .meta { color: #666; }
+.skills { color: #1f77b4; font-size: 0.9rem; }
+@media print { body { margin: 0; max-width: none; } h2 { break-after: avoid; } section > div { break-inside: avoid; } }
+"""
+
+
+def cv_key(content):
+    return hashlib.sha256(f"{FORMAT}:{content.version}".encode()).hexdigest()[:16]
+
+
+def filename(content):
+    return f"{content.about.name.replace(' ', '_')}_CV.html"
+
+
+def _section(title, items):
+    return f"<section><h2>{html.escape(title)}</h2>{''.join(items)}</section>"
+
+
+def render_html(content):
+    import markdown
+
+    about = content.about
+    e = html.escape
+    summary = markdown.markdown(about.summary)
+    experience = (
+        f"<div><h3>{e(item.task)}</h3><p>{e(item.description)}</p>"
+        f"<p class=skills>{e(' · '.join(item.skills))}</p></div>"
+        for item in content.experience
+    )
+    projects = (
+        f"<div><h3>{e(item.title)}</h3><p>{e(item.description)}</p>"
+        f"<p class=meta>Dataset: {e(item.dataset)} · Outcome: {e(item.outcome)}</p></div>"
+        for item in content.projects
+    )
+    certifications = (
+        f"<div><h3>{e(item.title)}</h3><p class=meta>{e(item.issuer)}</p><p>{e(item.description)}</p></div>"
+        for item in content.certifications
+    )
+    education = (
+        f"<div><h3>{e(item.degree)}{f' - {e(item.field)}' if item.field else ''}</h3>"
+        f"<p class=meta>{e(item.school)} · {e(item.period)} · Grade: {e(item.grade)}</p></div>"
+        for item in about.education
+    )
+    skills = (
+        f"<p><strong>{e(group)}:</strong> {e(', '.join(values))}</p>"
+        for group, values in (("Languages", content.languages), ("Tools & Technologies", content.tech_tools),
+                              ("Core Skills", content.core_skills))
+    )
+    return (
+        "<!DOCTYPE html>\n"
+        '<html lang="en"><head><meta charset="utf-8">'
+        '<meta name="viewport" content="width=device-width, initial-scale=1">'
+        f"<title>{e(about.name)} - CV</title><style>{STYLE}</style></head><body>"
+        f"<header><h1>{e(about.name)}</h1><p class=headline>{e(about.headline)}</p>"
+        f"<p class=contact>{e(about.location)} · {e(about.email)} · {e(about.phone)}</p></header>"
+        + _section("Summary", [summary, f"<p>{e(about.objective)}</p>"])
+        + _section("Experience", experience)
+        + _section("Projects", projects)
+        + _section("Certifications", certifications)
+        + _section("Education", education)
+        + _section("Skills", skills)
+        + "</body></html>\n"
+    )
+
+
+class CVBuilder:
+    """Cached CV bytes per content version; misses are rendered by one worker thread."""
+
+    def __init__(self, directory):
+        self.directory = Path(directory)
+        self._lock = threading.Lock()
+        self._cached = (None, None)  # (key, bytes) of the newest CV
+        self._pending = {}  # key -> Future
+        self._executor = concurrent.futures.ThreadPoolExecutor(max_workers=1, thread_name_prefix="cv-builder")
+
+    def path(self, key):
+        return self.directory / f"cv-{key}.html"
+
+    def get(self, content):
+        """The CV for ``content``, or None while the worker builds it."""
+        key = cv_key(content)
+        cached_key, data = self._cached
+        if cached_key == key:
+            return data
+        self.build(content)
+        return None
+
+    def build(self, content):
+        """Future for the CV bytes of ``content``, resolved immediately when they are on disk."""
+        key = cv_key(content)
+        with self._lock:
+            future = self._pending.get(key)
+            if future is None:
+                future = self._pending[key] = self._executor.submit(self._load, content, key)
+            return future
+
+    def _load(self, content, key):
+        path = self.path(key)
+        try:
+            try:
+                data = path.read_bytes()
+            except OSError:
+                data = render_html(content).encode("utf-8")
+                cv_renders.inc()
+                try:
+                    self._write(path, data)
+                except OSError as exc:
+                    _LOGGER.warning("CV not cached on disk: %s", exc)
+            with self._lock:
+                self._cached = (key, data)
+            return data
+        finally:
+            with self._lock:
+                self._pending.pop(key, None)
+
+    def _write(self, path, data):
+        self.directory.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+        tmp.write_bytes(data)
+        tmp.replace(path)
+        # Only the newest CV is served
+        for old in self.directory.glob("cv-*.html"):
+            if old != path:
+                old.unlink(missing_ok=True)
+
+
+_builder = None
+_builder_lock = threading.Lock()
+
+
+def builder():
+    """The process-wide CVBuilder over CV_DIR."""
+    global _builder
+    if _builder is None:
+        with _builder_lock:
+            if _builder is None:
+                _builder = CVBuilder(CV_DIR)
+    return _builder
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--out", default=None, help="output file (default: the name offered for download)")
+    args = parser.parse_args(argv)
+
+    content = get_content()
+    out = Path(args.out or filename(content))
+    out.write_bytes(builder().build(content).result())
+    print(f"{out}: {out.stat().st_size:,} bytes")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,19 @@
+"""Live demos of the internship projects, shown at the bottom of the Projects page.
+
+Like the pages, each demo is a module with a ``render()`` and is imported only
+when a visitor opens it.
+"""
+import importlib
+
+# Label shown on the Projects page -> module in this package
+DEMOS = {
+    "📊 Sales & Business Insights": "sales",
+    "🧠 Decision Tree Classifier": "bank_tree",
+    "😊 Sentiment Analysis Engine": "sentiment",
+    "🚗 Traffic Accident Analysis": "accidents",
+    "🔍 Exploratory Data Analysis": "eda",
+}
+
+
+def render(demo):
+    importlib.import_module(f"{__name__}.{DEMOS[demo]}").render()
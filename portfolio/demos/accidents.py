@@ -0,0 +1,339 @@
+"""Traffic Accident Analysis demo: out-of-core aggregation of a large accident CSV.
+
+The CSV (US-Accidents-style columns, see COLUMNS) is read in chunks of
+``CHUNK_ROWS`` rows, so memory stays flat whatever the file size. Each chunk
+is folded into fixed-size NumPy accumulators with vectorized operations:
+accidents per hour of day, per weather condition, per severity and per cell
+of a 0.1-degree grid over the continental US (hotspots). One ingestion per
+file version runs in a background thread shared by every session; the demo
+shows its progress, rows/sec and memory while it runs and the charts once it
+is done.
+
+    python -m portfolio.demos.accidents --rows 20000000   # write synthetic data (~1.6 GB)
+"""
+import argparse
+import os
+import resource
+import sys
+import threading
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from portfolio import settings
+
+COLUMNS = ["ID", "Severity", "Start_Time", "Start_Lat", "Start_Lng", "Weather_Condition", "Visibility(mi)"]
+USECOLS = ["Severity", "Start_Time", "Start_Lat", "Start_Lng", "Weather_Condition"]
+WEATHER = ("Clear", "Fair", "Cloudy", "Overcast", "Light Rain", "Rain", "Heavy Rain", "Snow", "Fog", "Thunderstorm")
+CHUNK_ROWS = 250_000
+
+# Hotspot grid over the continental US, 0.1 degree cells
+LAT_MIN, LAT_MAX, LON_MIN, LON_MAX = 24.0, 50.0, -125.0, -66.0
+CELL = 0.1
+LAT_CELLS = round((LAT_MAX - LAT_MIN) / CELL)
+LON_CELLS = round((LON_MAX - LON_MIN) / CELL)
+# Grid cells merged per heatmap cell (1 degree)
+HEATMAP_FACTOR = 10
+
+# Centres of the synthetic hotspots
+CITIES = {
+    "Los Angeles": (34.05, -118.24), "New York": (40.71, -74.01), "Houston": (29.76, -95.37),
+    "Miami": (25.76, -80.19), "Chicago": (41.88, -87.63), "Dallas": (32.78, -96.80),
+    "Atlanta": (33.75, -84.39), "Charlotte": (35.23, -80.84), "Seattle": (47.61, -122.33),
+    "Phoenix": (33.45, -112.07), "Denver": (39.74, -104.99), "Minneapolis": (44.98, -93.27),
+}
+
+
+def data_path():
+    configured = settings.portfolio_config().get("demos", {}).get("accidents_csv")
+    return settings.ROOT / configured if configured else settings.DATA_DIR / "accidents.csv"
+
+
+def rss_kib():
+    try:
+        with open("/proc/self/status") as fh:
+            for line in fh:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1])
+    except OSError:
+        pass
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+
+def generate(path, rows, seed=0, chunk_rows=CHUNK_ROWS, progress=None):
+    """Write ``rows`` synthetic accidents to ``path`` in chunks (memory stays flat)."""
+    rng = np.random.default_rng(seed)
+    centres = np.array(list(CITIES.values()))
+    weather_p = np.array([18, 22, 14, 10, 10, 7, 3, 5, 5, 3, 3], dtype=float)  # last: unlisted conditions
+    weather_p /= weather_p.sum()
+    weather_names = np.array(WEATHER + ("Haze",), dtype=object)
+    # Rush-hour peaks
+    hour_p = np.array([2, 1, 1, 1, 2, 4, 7, 10, 9, 6, 5, 5, 6, 6, 7, 8, 10, 11, 8, 5, 4, 3, 3, 2], dtype=float)
+    hour_p /= hour_p.sum()
+    first_day = np.datetime64("2016-01-01", "D").astype(np.int64)
+
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    # Unique per writer, so concurrent generators never share a temporary file
+    tmp = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    with open(tmp, "w", newline="") as fh:
+        fh.write(",".join(COLUMNS) + "\n")
+        for start in range(0, rows, chunk_rows):
+            n = min(chunk_rows, rows - start)
+            near_city = rng.random(n) < 0.8
+            city = centres[rng.integers(0, len(centres), n)]
+            lat = np.where(near_city, city[:, 0] + rng.normal(0, 0.25, n), rng.uniform(LAT_MIN, LAT_MAX, n))
+            lon = np.where(near_city, city[:, 1] + rng.normal(0, 0.3, n), rng.uniform(LON_MIN, LON_MAX, n))
+            weather = rng.choice(len(weather_names), n, p=weather_p)
+            bad_weather = np.isin(weather, (5, 6, 7, 9))
+            severity = np.clip(rng.choice(4, n, p=[0.05, 0.7, 0.2, 0.05]) + 1 + (bad_weather & (rng.random(n) < 0.3)),
+                               1, 4)
+            seconds = ((first_day + rng.integers(0, 8 * 365, n)) * 86400
+                       + rng.choice(24, n, p=hour_p) * 3600 + rng.integers(0, 3600, n))
+            frame = pd.DataFrame({
+                "ID": np.char.add("A-", (np.arange(start, start + n) + 1).astype(str)),
+                "Severity": severity,
+                "Start_Time": np.char.replace(np.datetime_as_string(seconds.astype("datetime64[s]")), "T", " "),
+                "Start_Lat": lat.round(5),
+                "Start_Lng": lon.round(5),
+                "Weather_Condition": weather_names[weather],
+                "Visibility(mi)": np.where(bad_weather, rng.uniform(0.5, 5, n), 10.0).round(1),
+            })
+            frame.to_csv(fh, header=False, index=False)
+            if progress is not None:
+                progress(start + n, rows)
+    tmp.replace(path)
+    return path
+
+
+_generate_lock = threading.Lock()
+
+
+def ensure_sample(path, rows):
+    """Generate ``rows`` sample rows at ``path`` unless it exists; one generator at a time."""
+    with _generate_lock:
+        if not path.exists():
+            generate(path, rows)
+    return path
+
+
+class AccidentStats:
+    """Fixed-size accumulators; update() folds one chunk in."""
+
+    def __init__(self):
+        self.rows = 0
+        self.hours = np.zeros(24, dtype=np.int64)
+        self.weather = np.zeros(len(WEATHER) + 1, dtype=np.int64)  # last slot: other/unknown
+        self.severity = np.zeros(5, dtype=np.int64)  # 1-4, 0 for unknown
+        self.grid = np.zeros((LAT_CELLS, LON_CELLS), dtype=np.int64)
+
+    def update(self, chunk):
+        self.rows += len(chunk)
+
+        # "YYYY-MM-DD HH:..." (space or "T"); slicing is much cheaper than parsing dates
+        hour = pd.to_numeric(chunk["Start_Time"].str.slice(11, 13), errors="coerce").to_numpy()
+        hour = hour[(hour >= 0) & (hour < 24)].astype(np.int64)
+        self.hours += np.bincount(hour, minlength=24)
+
+        codes = pd.Categorical(chunk["Weather_Condition"], categories=WEATHER).codes.astype(np.int64)
+        codes[codes < 0] = len(WEATHER)
+        self.weather += np.bincount(codes, minlength=len(WEATHER) + 1)
+
+        severity = pd.to_numeric(chunk["Severity"], errors="coerce").fillna(0).to_numpy().astype(np.int64)
+        severity[(severity < 1) | (severity > 4)] = 0
+        self.severity += np.bincount(severity, minlength=5)
+
+        lat = pd.to_numeric(chunk["Start_Lat"], errors="coerce").to_numpy(dtype=float, na_value=np.nan)
+        lon = pd.to_numeric(chunk["Start_Lng"], errors="coerce").to_numpy(dtype=float, na_value=np.nan)
+        inside = (lat >= LAT_MIN) & (lat < LAT_MAX) & (lon >= LON_MIN) & (lon < LON_MAX)
+        row = ((lat[inside] - LAT_MIN) / CELL).astype(np.int64)
+        col = ((lon[inside] - LON_MIN) / CELL).astype(np.int64)
+        cells = np.bincount(row * LON_CELLS + col, minlength=LAT_CELLS * LON_CELLS)
+        self.grid += cells.reshape(LAT_CELLS, LON_CELLS)
+
+    def copy(self):
+        other = AccidentStats()
+        other.rows = self.rows
+        for name in ("hours", "weather", "severity", "grid"):
+            setattr(other, name, getattr(self, name).copy())
+        return other
+
+    def hotspots(self, count=10):
+        flat = self.grid.ravel()
+        top = np.argpartition(flat, -count)[-count:]
+        top = top[np.argsort(flat[top])[::-1]]
+        rows, cols = np.divmod(top, LON_CELLS)
+        return pd.DataFrame({
+            "Latitude": (LAT_MIN + (rows + 0.5) * CELL).round(2),
+            "Longitude": (LON_MIN + (cols + 0.5) * CELL).round(2),
+            "Accidents": flat[top],
+        })
+
+    def heatmap(self):
+        """Grid summed into HEATMAP_FACTOR x HEATMAP_FACTOR blocks: ``(z, latitudes, longitudes)``."""
+        f = HEATMAP_FACTOR
+        z = self.grid.reshape(LAT_CELLS // f, f, LON_CELLS // f, f).sum(axis=(1, 3))
+        lats = LAT_MIN + (np.arange(LAT_CELLS // f) + 0.5) * CELL * f
+        lons = LON_MIN + (np.arange(LON_CELLS // f) + 0.5) * CELL * f
+        return z, lats, lons
+
+
+class IngestJob:
+    """Streams one CSV through AccidentStats on a background thread."""
+
+    def __init__(self, path, chunk_rows=CHUNK_ROWS):
+        self.path = Path(path)
+        self.size = self.path.stat().st_size
+        self.chunk_rows = chunk_rows
+        self.stats = AccidentStats()
+        self.bytes_read = 0
+        self.elapsed = 0.0
+        self.rss_start_kib = rss_kib()
+        self.rss_peak_kib = self.rss_start_kib
+        self.done = False
+        self.error = None
+        self._lock = threading.Lock()
+
+    def start(self):
+        threading.Thread(target=self.run, name="accidents-ingest", daemon=True).start()
+        return self
+
+    def run(self):
+        start = time.perf_counter()
+        try:
+            with open(self.path, "rb") as fh:
+                reader = pd.read_csv(fh, usecols=USECOLS, chunksize=self.chunk_rows,
+                                     dtype={"Start_Time": str, "Weather_Condition": str})
+                for chunk in reader:
+                    with self._lock:
+                        self.stats.update(chunk)
+                        self.bytes_read = fh.tell()
+                        self.elapsed = time.perf_counter() - start
+                        self.rss_peak_kib = max(self.rss_peak_kib, rss_kib())
+        except (OSError, ValueError, pd.errors.ParserError) as exc:
+            self.error = exc
+        finally:
+            with self._lock:
+                self.elapsed = time.perf_counter() - start
+                self.bytes_read = self.size if self.error is None else self.bytes_read
+                self.done = True
+
+    def snapshot(self):
+        """A consistent copy of the progress and partial results."""
+        with self._lock:
+            return {
+                "stats": self.stats.copy(),
+                "fraction": min(1.0, self.bytes_read / self.size) if self.size else 1.0,
+                "rows_per_second": self.stats.rows / self.elapsed if self.elapsed else 0.0,
+                "elapsed": self.elapsed,
+                "rss_growth_kib": self.rss_peak_kib - self.rss_start_kib,
+                "done": self.done,
+                "error": self.error,
+            }
+
+
+_jobs = {}
+_jobs_lock = threading.Lock()
+
+
+def job_for(path):
+    """The ingestion job for the current version of ``path``, started on first use."""
+    stat = Path(path).stat()
+    key = (str(path), stat.st_size, stat.st_mtime_ns)
+    with _jobs_lock:
+        job = _jobs.get(key)
+        if job is None:
+            # One job per file: forget results for older versions of it
+            for old in [old for old in _jobs if old[0] == key[0]]:
+                del _jobs[old]
+            job = _jobs[key] = IngestJob(path).start()
+        return job
+
+
+def render():
+    import streamlit as st
+
+    from portfolio import figures, ui
+
+    st.markdown("#### 🚗 Traffic Accident Analysis")
+    path = data_path()
+    if not path.exists():
+        st.info(f"No accident data at `{path}`. Create a large synthetic file with "
+                "`python -m portfolio.demos.accidents --rows 20000000`, or a small one here.")
+        if not st.button("Generate 500,000 sample rows"):
+            return
+        with st.spinner("Generating sample data..."):
+            ensure_sample(path, 500_000)
+
+    snap = job_for(path).snapshot()
+    stats = snap["stats"]
+    col1, col2, col3, col4 = st.columns(4)
+    with col1:
+        st.metric("Rows processed", f"{stats.rows:,}")
+    with col2:
+        st.metric("Rows / sec", f"{snap['rows_per_second']:,.0f}")
+    with col3:
+        st.metric("File size", f"{path.stat().st_size / 2 ** 20:,.0f} MiB")
+    with col4:
+        st.metric("Memory growth", f"{snap['rss_growth_kib'] / 1024:,.0f} MiB")
+
+    if snap["error"] is not None:
+        st.error(f"Ingestion failed: {snap['error']}")
+        return
+    if not snap["done"]:
+        st.progress(snap["fraction"], text=f"Streaming {path.name} in {CHUNK_ROWS:,}-row chunks...")
+        st.button("🔄 Refresh")
+        st.dataframe(pd.DataFrame({"Accidents so far": stats.weather}, index=list(WEATHER) + ["Other"]))
+        return
+
+    col1, col2 = st.columns(2)
+    with col1:
+        chart = figures.timeline({"Hour": tuple(range(24)), "Accidents": tuple(stats.hours.tolist())},
+                                 x="Hour", y="Accidents", title="Accidents by Hour of Day", height=350)
+        ui.show_chart(chart, "accidents_by_hour")
+    with col2:
+        chart = figures.horizontal_bar(
+            {"Weather": WEATHER + ("Other",), "Accidents": tuple(stats.weather.tolist())},
+            x="Accidents", y="Weather", title="Accidents by Weather", color_scale="Reds", height=350)
+        ui.show_chart(chart, "accidents_by_weather")
+
+    z, lats, lons = stats.heatmap()
+    chart = figures.heatmap({"z": tuple(map(tuple, np.log10(1 + z).round(2).tolist())),
+                             "x": tuple(lons.round(1).tolist()), "y": tuple(lats.round(1).tolist())},
+                            title="Accident Density (log10, 1° cells)", color_scale="YlOrRd", height=420)
+    ui.show_chart(chart, "accidents_heatmap")
+
+    col1, col2 = st.columns(2)
+    with col1:
+        chart = figures.pie({"Severity": ("Unknown", "1", "2", "3", "4"),
+                             "Accidents": tuple(stats.severity.tolist())},
+                            values="Accidents", names="Severity", title="Severity",
+                            colors=("#cccccc", "#fee08b", "#fdae61", "#f46d43", "#d73027"))
+        ui.show_chart(chart, "accidents_by_severity")
+    with col2:
+        st.markdown("**🔥 Top hotspots (0.1° cells)**")
+        st.dataframe(stats.hotspots(), hide_index=True)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=5_000_000)
+    parser.add_argument("--out", type=Path, default=None, help="CSV to write (default: the demo's data file)")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    out = args.out or data_path()
+    start = time.perf_counter()
+
+    def progress(done, total):
+        print(f"\r{done:,}/{total:,} rows", end="", flush=True)
+
+    generate(out, args.rows, args.seed, progress=progress)
+    print(f"\nwrote {out} ({out.stat().st_size / 2 ** 20:,.0f} MiB) in {time.perf_counter() - start:.0f} s")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,321 @@
+"""Decision Tree Classifier demo on the UCI Bank Marketing schema.
+
+The tree is trained at most once per process for a given (training data,
+hyperparameters) pair and saved as a joblib artifact named after a hash of
+both (and the scikit-learn version), so restarts and other worker processes
+load it instead of retraining. The process keeps the ``MAX_MODELS`` most
+recently used models in memory and the ``MAX_ARTIFACTS`` most recently used
+artifacts on disk.
+Predictions -- a single record from the form or an uploaded CSV -- go
+through one vectorized ``encode()`` and one ``predict_proba`` call for the
+whole batch.
+
+Training data is ``[portfolio.demos] bank_csv`` (UCI ``bank-full.csv``,
+``;``-separated) when present, otherwise synthetic rows with the same schema.
+"""
+import hashlib
+import io
+import json
+import os
+import threading
+import time
+from collections import OrderedDict, namedtuple
+
+import numpy as np
+import pandas as pd
+
+from portfolio import settings
+
+# Categorical columns and their levels, in UCI order; the codes are the tree's inputs
+CATEGORIES = {
+    "job": ("admin.", "blue-collar", "entrepreneur", "housemaid", "management", "retired", "self-employed",
+            "services", "student", "technician", "unemployed", "unknown"),
+    "marital": ("divorced", "married", "single"),
+    "education": ("primary", "secondary", "tertiary", "unknown"),
+    "default": ("no", "yes"),
+    "housing": ("no", "yes"),
+    "loan": ("no", "yes"),
+    "contact": ("cellular", "telephone", "unknown"),
+    "month": ("jan", "feb", "mar", "apr", "may", "jun", "jul", "aug", "sep", "oct", "nov", "dec"),
+    "poutcome": ("failure", "other", "success", "unknown"),
+}
+# bank-full.csv column order
+FEATURES = ("age", "job", "marital", "education", "default", "balance", "housing", "loan", "contact", "day",
+            "month", "duration", "campaign", "pdays", "previous", "poutcome")
+TARGET = "y"
+UCI_ROWS = 45211
+
+DEFAULT_PARAMS = {"max_depth": 6, "min_samples_leaf": 20, "criterion": "gini"}
+MAX_MODELS = 16
+MAX_ARTIFACTS = 64
+
+# model: fitted DecisionTreeClassifier; key: hash of data + hyperparameters
+TrainedModel = namedtuple("TrainedModel", ["key", "model", "params", "accuracy", "rows", "seconds", "source"])
+
+
+def synthetic(rows, seed=0):
+    """``rows`` Bank-Marketing-like records; ``y`` follows a fixed logistic rule (about 12% "yes")."""
+    rng = np.random.default_rng(seed)
+    pick = {
+        "job": [11, 22, 3, 3, 21, 5, 3, 9, 2, 17, 3, 1],
+        "marital": [12, 60, 28], "education": [15, 51, 29, 5], "default": [98, 2],
+        "housing": [44, 56], "loan": [84, 16], "contact": [65, 6, 29],
+        "month": [3, 6, 1, 6, 30, 12, 15, 14, 1, 2, 9, 1], "poutcome": [11, 4, 3, 82],
+    }
+    frame = {}
+    frame["age"] = np.clip(rng.normal(41, 10.6, rows), 18, 95).astype(np.int64)
+    for name, weights in pick.items():
+        p = np.array(weights, dtype=float)
+        frame[name] = rng.choice(len(p), rows, p=p / p.sum())
+    frame["balance"] = np.round(rng.lognormal(6.5, 1.4, rows) - 400).astype(np.int64)
+    frame["day"] = rng.integers(1, 32, rows)
+    frame["duration"] = np.clip(rng.exponential(258, rows), 0, 4918).astype(np.int64)
+    frame["campaign"] = 1 + rng.geometric(0.38, rows) - 1
+    contacted = frame["poutcome"] != 3
+    frame["pdays"] = np.where(contacted, rng.integers(1, 400, rows), -1)
+    frame["previous"] = np.where(contacted, 1 + rng.poisson(1.5, rows), 0)
+
+    logit = (-3.0 + 0.0045 * np.minimum(frame["duration"], 1000) + 2.4 * (frame["poutcome"] == 2)
+             + 1.2 * np.isin(frame["month"], (2, 8, 9, 11)) - 0.7 * frame["housing"] - 0.5 * frame["loan"]
+             - 0.9 * (frame["contact"] == 2) + 0.8 * (frame["age"] > 60) + 0.6 * (frame["job"] == 8)
+             - 0.08 * np.minimum(frame["campaign"], 10))
+    y = rng.random(rows) < 1 / (1 + np.exp(-logit))
+
+    out = pd.DataFrame({name: frame[name] for name in FEATURES})
+    for name, levels in CATEGORIES.items():
+        out[name] = pd.Categorical.from_codes(frame[name], categories=levels)
+    out[TARGET] = np.where(y, "yes", "no")
+    return out
+
+
+def encode(frame):
+    """Feature matrix (float32, FEATURES order) for a whole frame; unknown levels become -1."""
+    missing = [name for name in FEATURES if name not in frame.columns]
+    if missing:
+        raise ValueError(f"missing columns: {', '.join(missing)}")
+    X = np.empty((len(frame), len(FEATURES)), dtype=np.float32)
+    for i, name in enumerate(FEATURES):
+        column = frame[name]
+        if name in CATEGORIES:
+            dtype = pd.CategoricalDtype(CATEGORIES[name])
+            if column.dtype != dtype:
+                column = column.astype(str).str.strip().str.lower().astype(dtype)
+            X[:, i] = column.cat.codes
+        else:
+            X[:, i] = pd.to_numeric(column, errors="coerce").fillna(0).to_numpy(dtype=np.float32)
+    return X
+
+
+def training_data():
+    """(frame, description) from the configured CSV, or synthetic UCI-sized data."""
+    configured = settings.portfolio_config().get("demos", {}).get("bank_csv")
+    path = settings.ROOT / configured if configured else settings.DATA_DIR / "bank-full.csv"
+    if path.exists():
+        return pd.read_csv(path, sep=None, engine="python"), f"{path.name}"
+    return synthetic(UCI_ROWS), f"synthetic ({UCI_ROWS:,} rows)"
+
+
+def model_key(X, y, params):
+    import sklearn
+
+    digest = hashlib.sha256(sklearn.__version__.encode("utf-8"))
+    digest.update(np.ascontiguousarray(X).tobytes())
+    digest.update(np.ascontiguousarray(y).tobytes())
+    digest.update(json.dumps(params, sort_keys=True).encode("utf-8"))
+    return digest.hexdigest()[:20]
+
+
+def train(frame, params, source=""):
+    """Fit (or load from disk) the tree for ``frame`` and ``params``."""
+    import joblib
+    from sklearn.model_selection import train_test_split
+    from sklearn.tree import DecisionTreeClassifier
+
+    X = encode(frame)
+    y = (frame[TARGET].astype(str).str.strip().str.lower() == "yes").to_numpy()
+    key = model_key(X, y, params)
+    path = settings.DATA_DIR / "models" / f"bank_tree-{key}.joblib"
+    if path.exists():
+        try:
+            trained = joblib.load(path)
+        except (OSError, ValueError, EOFError):
+            pass  # unreadable artifact: retrain
+        else:
+            _touch(path)
+            return trained
+
+    start = time.perf_counter()
+    X_train, X_test, y_train, y_test = train_test_split(X, y, test_size=0.2, random_state=0, stratify=y)
+    model = DecisionTreeClassifier(random_state=0, **params).fit(X_train, y_train)
+    accuracy = float((model.predict(X_test) == y_test).mean())
+    trained = TrainedModel(key, model, dict(params), accuracy, len(frame), time.perf_counter() - start, source)
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    joblib.dump(trained, tmp)
+    tmp.replace(path)
+    _prune(path.parent)
+    return trained
+
+
+def _touch(path):
+    try:
+        os.utime(path)
+    except OSError:
+        pass
+
+
+def _mtime(path):
+    try:
+        return path.stat().st_mtime
+    except OSError:
+        return 0.0
+
+
+def _prune(directory):
+    """Delete all but the ``MAX_ARTIFACTS`` most recently used artifacts (other writers' tmp files are dot files)."""
+    artifacts = sorted(directory.glob("bank_tree-*.joblib"), key=_mtime, reverse=True)
+    for old in artifacts[MAX_ARTIFACTS:]:
+        old.unlink(missing_ok=True)
+
+
+class ModelRegistry:
+    """LRU of trained models per hyperparameter set, shared by every session of the process."""
+
+    def __init__(self, max_models=MAX_MODELS):
+        self.max_models = max_models
+        self._models = OrderedDict()
+        self._training = {}  # key -> lock held while that model is trained or loaded
+        self._lock = threading.Lock()
+        self._data = None
+        self._data_lock = threading.Lock()
+
+    def _training_data(self):
+        with self._data_lock:
+            if self._data is None:
+                self._data = training_data()
+            return self._data
+
+    def get(self, params):
+        key = json.dumps(params, sort_keys=True)
+        with self._lock:
+            model = self._models.get(key)
+            if model is not None:
+                self._models.move_to_end(key)
+                return model
+            key_lock = self._training.setdefault(key, threading.Lock())
+        # A lock per key: concurrent visitors wait for the first training of the same
+        # hyperparameters instead of repeating it, and never for other ones
+        with key_lock:
+            with self._lock:
+                model = self._models.get(key)
+            if model is not None:
+                return model
+            try:
+                frame, source = self._training_data()
+                model = train(frame, params, source)
+                with self._lock:
+                    self._models[key] = model
+                    while len(self._models) > self.max_models:
+                        self._models.popitem(last=False)
+            finally:
+                with self._lock:
+                    self._training.pop(key, None)
+            return model
+
+
+registry = ModelRegistry()
+
+
+def predict(trained, frame):
+    """Probability of "yes" for every row of ``frame`` in one vectorized call."""
+    return trained.model.predict_proba(encode(frame))[:, 1]
+
+
+def importances(trained):
+    order = np.argsort(trained.model.feature_importances_)[::-1][:8]
+    return {"Feature": tuple(FEATURES[i] for i in order[::-1]),
+            "Importance": tuple(round(float(trained.model.feature_importances_[i]), 4) for i in order[::-1])}
+
+
+def render():
+    import streamlit as st
+
+    from portfolio import figures, ui
+
+    st.markdown("#### 🧠 Decision Tree Classifier")
+    try:
+        import sklearn  # noqa: F401
+    except ImportError:
+        st.info("This demo needs scikit-learn (`pip install -r requirements.txt`).")
+        return
+
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        max_depth = st.slider("Max depth", 2, 16, DEFAULT_PARAMS["max_depth"], key="bank_max_depth")
+    with col2:
+        min_leaf = st.slider("Min samples per leaf", 1, 200, DEFAULT_PARAMS["min_samples_leaf"], key="bank_min_leaf")
+    with col3:
+        criterion = st.selectbox("Criterion", ["gini", "entropy"], key="bank_criterion")
+    params = {"max_depth": max_depth, "min_samples_leaf": min_leaf, "criterion": criterion}
+
+    with st.spinner("Training..."):
+        trained = registry.get(params)
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        st.metric("Holdout accuracy", f"{trained.accuracy:.1%}")
+    with col2:
+        st.metric("Training rows", f"{trained.rows:,}")
+    with col3:
+        st.metric("Leaves", trained.model.get_n_leaves())
+    st.caption(f"Data: {trained.source} · model {trained.key} · trained in {trained.seconds * 1000:,.0f} ms")
+
+    chart = figures.horizontal_bar(importances(trained), x="Importance", y="Feature",
+                                   title="Feature Importance", color_scale="Blues", height=350)
+    ui.show_chart(chart, "bank_importance")
+
+    st.markdown("**Score one customer**")
+    with st.form("bank_record"):
+        col1, col2, col3, col4 = st.columns(4)
+        record = {}
+        with col1:
+            record["age"] = st.number_input("Age", 18, 95, 40)
+            record["job"] = st.selectbox("Job", CATEGORIES["job"], index=4)
+            record["marital"] = st.selectbox("Marital", CATEGORIES["marital"], index=1)
+            record["education"] = st.selectbox("Education", CATEGORIES["education"], index=2)
+        with col2:
+            record["balance"] = st.number_input("Balance (€)", -10000, 100000, 1500)
+            record["default"] = st.selectbox("Credit in default", CATEGORIES["default"])
+            record["housing"] = st.selectbox("Housing loan", CATEGORIES["housing"])
+            record["loan"] = st.selectbox("Personal loan", CATEGORIES["loan"])
+        with col3:
+            record["contact"] = st.selectbox("Contact", CATEGORIES["contact"])
+            record["month"] = st.selectbox("Last contact month", CATEGORIES["month"], index=4)
+            record["day"] = st.number_input("Last contact day", 1, 31, 15)
+            record["duration"] = st.number_input("Call duration (s)", 0, 5000, 300)
+        with col4:
+            record["campaign"] = st.number_input("Contacts this campaign", 1, 60, 2)
+            record["pdays"] = st.number_input("Days since last campaign (-1: never)", -1, 900, -1)
+            record["previous"] = st.number_input("Previous contacts", 0, 300, 0)
+            record["poutcome"] = st.selectbox("Previous outcome", CATEGORIES["poutcome"], index=3)
+        if st.form_submit_button("Predict"):
+            probability = predict(trained, pd.DataFrame([record]))[0]
+            st.success(f"Subscribes to a term deposit: **{'yes' if probability >= 0.5 else 'no'}** "
+                       f"(p = {probability:.2f})")
+
+    upload = st.file_uploader("Or score a CSV batch (Bank Marketing columns, `,` or `;` separated)", type="csv")
+    if upload is not None:
+        try:
+            batch = pd.read_csv(upload, sep=None, engine="python")
+            start = time.perf_counter()
+            batch["p_yes"] = predict(trained, batch)
+            elapsed = time.perf_counter() - start
+        except (ValueError, pd.errors.ParserError) as exc:
+            st.error(f"Could not score the file: {exc}")
+            return
+        st.caption(f"Scored {len(batch):,} rows in {elapsed * 1000:,.1f} ms "
+                   f"({len(batch) / max(elapsed, 1e-9):,.0f} rows/s)")
+        st.dataframe(batch.head(100), hide_index=True)
+        buffer = io.StringIO()
+        batch.to_csv(buffer, index=False)
+        st.download_button("Download predictions", buffer.getvalue(), file_name="predictions.csv", mime="text/csv")
@@ -0,0 +1,826 @@
+"""Exploratory Data Analysis demo: summary statistics of a CSV or Parquet file of any size.
+
+Files are read with pyarrow one record batch at a time (16 MiB CSV blocks,
+Parquet row batches), converting only the columns being profiled -- Parquet
+does not even read the others -- so memory stays flat whatever the file
+size. One scan per file and column set runs on a background thread shared
+by every session, and folds each batch into:
+
+* exact per-column counts, missing values, minimum and maximum, and mean
+  and variance (merged batch by batch with Chan's formula);
+* a uniform reservoir sample of ``SAMPLE_ROWS`` rows (Algorithm R,
+  vectorized per batch).
+
+Quartiles, histograms, distinct and top values and the correlation matrix
+are estimated from the sample, so a first summary is shown after the first
+batch and sharpens while the scan runs. "Exact" re-reads the numeric columns
+only, to count the histograms and correlations exactly. Results are saved
+to ``<data dir>/eda/results/`` under the file's ``fingerprint()`` and the
+column set, so each version of a file is scanned once; the ``MAX_RESULTS``
+most recently used are kept.
+
+Uploads (up to Streamlit's ``server.maxUploadSize``) are stored under
+``<eda dir>/uploads/`` by content hash; larger files are picked from the eda
+directory (``[portfolio.demos] eda_dir``, default ``<data dir>/eda``).
+
+    python -m portfolio.demos.eda --size-mb 1000 --format parquet   # write synthetic data
+"""
+import argparse
+import collections
+import functools
+import hashlib
+import json
+import math
+import os
+import sys
+import threading
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pa_csv
+import pyarrow.parquet as pq
+
+from portfolio import settings
+from portfolio.demos.accidents import rss_kib
+
+SUFFIXES = (".csv", ".parquet")
+SAMPLE_ROWS = 50_000
+BLOCK_BYTES = 16 * 2 ** 20
+BATCH_ROWS = 256 * 1024
+HIST_BINS = 30
+# Columns profiled unless the visitor picks others, and at most in the correlation matrix
+DEFAULT_COLUMNS = 24
+MAX_CORRELATION = 16
+# Bytes hashed at each end of a file by fingerprint()
+FINGERPRINT_BYTES = 2 ** 20
+# Finished scans kept in memory; running ones are never dropped
+MAX_JOBS = 8
+MAX_UPLOADS = 10
+MAX_RESULTS = 200
+# Part of every results key: bump when the summary format changes
+FORMAT = 1
+# Seconds between the partial summaries of a running scan
+PUBLISH_INTERVAL = 0.5
+
+RESULTS_DIR = settings.DATA_DIR / "eda" / "results"
+
+
+def eda_dir():
+    configured = settings.portfolio_config().get("demos", {}).get("eda_dir")
+    return settings.ROOT / configured if configured else settings.DATA_DIR / "eda"
+
+
+def local_files():
+    directory = eda_dir()
+    if not directory.is_dir():
+        return []
+    return sorted(path for path in directory.iterdir() if path.suffix.lower() in SUFFIXES and path.is_file())
+
+
+def save_upload(upload):
+    """Store an uploaded file under its content hash and return the path."""
+    digest = hashlib.sha256()
+    upload.seek(0)
+    for block in iter(lambda: upload.read(BLOCK_BYTES), b""):
+        digest.update(block)
+    directory = eda_dir() / "uploads"
+    path = directory / f"{digest.hexdigest()[:32]}{Path(upload.name).suffix.lower()}"
+    if path.exists():
+        _touch(path)
+        return path
+    directory.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    upload.seek(0)
+    with open(tmp, "wb") as fh:
+        for block in iter(lambda: upload.read(BLOCK_BYTES), b""):
+            fh.write(block)
+    tmp.replace(path)
+    # Keep the most recently used uploads; in-flight writes are hidden dot files
+    _prune(directory, "*.*", MAX_UPLOADS)
+    return path
+
+
+def _touch(path):
+    try:
+        os.utime(path)
+    except OSError:
+        pass
+
+
+def _mtime(path):
+    try:
+        return path.stat().st_mtime
+    except OSError:
+        return 0.0
+
+
+def _prune(directory, pattern, keep):
+    """Delete all but the ``keep`` newest ``pattern`` files of ``directory``, skipping dot (temporary) files."""
+    files = [path for path in directory.glob(pattern) if not path.name.startswith(".")]
+    for old in sorted(files, key=_mtime, reverse=True)[keep:]:
+        old.unlink(missing_ok=True)
+
+
+@functools.lru_cache(maxsize=64)
+def _fingerprint(path, size, mtime_ns):
+    digest = hashlib.sha256(f"{size}:{mtime_ns}".encode())
+    with open(path, "rb") as fh:
+        digest.update(fh.read(FINGERPRINT_BYTES))
+        if size > FINGERPRINT_BYTES:
+            fh.seek(max(FINGERPRINT_BYTES, size - FINGERPRINT_BYTES))
+            digest.update(fh.read(FINGERPRINT_BYTES))
+    return digest.hexdigest()[:24]
+
+
+def fingerprint(path):
+    """Hash of the file's size, mtime and first and last MiB: names a version without reading all of it."""
+    stat = Path(path).stat()
+    return _fingerprint(str(path), stat.st_size, stat.st_mtime_ns)
+
+
+def _csv_chunks(fh):
+    """The header line plus whole lines of about BLOCK_BYTES, one piece at a time."""
+    header = fh.readline()
+    rest, pieces = b"", 0
+    while block := fh.read(BLOCK_BYTES):
+        cut = block.rfind(b"\n") + 1
+        if not cut:
+            rest += block  # a line longer than a block
+            continue
+        pieces += 1
+        # One copy per block: memory is a few blocks whatever the file size
+        yield b"".join((header, rest, memoryview(block)[:cut]))
+        rest = block[cut:]
+    if rest.strip() or not pieces:
+        yield header + rest
+
+
+@functools.lru_cache(maxsize=64)
+def _schema(path, key):
+    if path.endswith(".parquet"):
+        return pq.read_schema(path)
+    with open(path, "rb") as fh:
+        first = next(_csv_chunks(fh), b"")
+    convert = pa_csv.ConvertOptions(strings_can_be_null=True)
+    return pa_csv.read_csv(pa.py_buffer(first), convert_options=convert).schema
+
+
+def read_schema(path):
+    """Column names and types, from the Parquet footer or the first CSV block."""
+    return _schema(str(path), fingerprint(path))
+
+
+def column_kind(dtype):
+    if pa.types.is_integer(dtype) or pa.types.is_floating(dtype) or pa.types.is_boolean(dtype):
+        return "numeric"
+    if pa.types.is_string(dtype) or pa.types.is_large_string(dtype) or pa.types.is_dictionary(dtype):
+        return "text"
+    return "other"
+
+
+def batches(path, schema, columns):
+    """Yield ``(record batch of columns, fraction of the file read)``."""
+    path = Path(path)
+    if path.suffix.lower() == ".parquet":
+        parquet = pq.ParquetFile(path)
+        groups = parquet.metadata.num_row_groups
+        # One row group at a time: a single iter_batches() over the file buffers ever more of it
+        for group in range(groups):
+            for batch in parquet.iter_batches(batch_size=BATCH_ROWS, row_groups=[group], columns=list(columns)):
+                yield batch, (group + 1) / groups
+        return
+    # pyarrow's streaming CSV reader reads ahead without bound (hundreds of MiB on a big file), so
+    # blocks are cut here and parsed one by one, with the types inferred from the first block
+    # (integers as float64: a later block may hold decimals). As by default, no newlines in values.
+    types = {}
+    for name in columns:
+        dtype = schema.field(name).type
+        types[name] = pa.float64() if pa.types.is_integer(dtype) else pa.string() if pa.types.is_null(dtype) else dtype
+    convert = pa_csv.ConvertOptions(column_types=types, include_columns=list(columns), strings_can_be_null=True)
+    size = path.stat().st_size or 1
+    with open(path, "rb") as fh:
+        for chunk in _csv_chunks(fh):
+            table = pa_csv.read_csv(pa.py_buffer(chunk), convert_options=convert)
+            del chunk
+            for batch in table.to_batches():
+                yield batch, min(1.0, fh.tell() / size)
+            table = batch = None  # not alive while the next block is parsed
+
+
+def _floats(column):
+    return column.cast(pa.float64()).to_numpy(zero_copy_only=False)
+
+
+def _texts(column):
+    if pa.types.is_dictionary(column.type):
+        column = column.cast(column.type.value_type)
+    return column.to_numpy(zero_copy_only=False)
+
+
+def _edges(low, high):
+    if low == high:
+        low, high = low - 0.5, high + 0.5
+    return np.linspace(low, high, HIST_BINS + 1)
+
+
+def _correlation(frame):
+    """Pairwise Pearson correlation as ``{"columns": [...], "matrix": rows}``, NaN as None."""
+    matrix = frame.corr().to_numpy()
+    return {"columns": list(frame.columns),
+            "matrix": [[None if math.isnan(r) else round(r, 6) for r in row] for row in matrix.tolist()]}
+
+
+class Profile:
+    """Exact per-column counts and moments plus a uniform reservoir sample; fold() adds one batch."""
+
+    def __init__(self, schema, columns, sample_rows=SAMPLE_ROWS, seed=0):
+        self.columns = list(columns)
+        self.types = {name: schema.field(name).type for name in self.columns}
+        self.kinds = {name: column_kind(dtype) for name, dtype in self.types.items()}
+        self.sample_rows = sample_rows
+        self.rows = 0
+        self.missing = dict.fromkeys(self.columns, 0)
+        self.moments = {}  # numeric column -> (count, mean, sum of squared deviations)
+        self.low = dict.fromkeys(self.columns)
+        self.high = dict.fromkeys(self.columns)
+        self.sample = {name: np.full(sample_rows, np.nan) if kind == "numeric" else np.empty(sample_rows, object)
+                       for name, kind in self.kinds.items() if kind != "other"}
+        self.preview = None
+        self._rng = np.random.default_rng(seed)
+
+    def _reservoir(self, n):
+        """Rows of the next ``n`` that enter the sample, and the slots they take."""
+        index = np.arange(n)
+        slots = self.rows + index
+        later = slots >= self.sample_rows
+        # Row i (counting from 0) draws a slot in [0, i]; floats are much cheaper than integers() here
+        slots[later] = (self._rng.random(int(later.sum())) * (slots[later] + 1)).astype(np.int64)
+        keep = slots < self.sample_rows
+        rows, slots = index[keep], slots[keep]
+        # A slot drawn twice in one batch keeps the later row, as row-at-a-time sampling would
+        slots, last = np.unique(slots[::-1], return_index=True)
+        return rows[::-1][last], slots
+
+    def _extend(self, name, low, high):
+        if self.low[name] is None or low < self.low[name]:
+            self.low[name] = low
+        if self.high[name] is None or high > self.high[name]:
+            self.high[name] = high
+
+    def fold(self, batch):
+        n = batch.num_rows
+        if self.preview is None:
+            self.preview = batch.slice(0, 5).to_pylist()
+        rows, slots = self._reservoir(n)
+        take = pa.array(rows)
+        for name in self.columns:
+            column = batch.column(name)
+            kind = self.kinds[name]
+            if kind == "numeric":
+                values = _floats(column)
+                values = values[~np.isnan(values)]
+                self.missing[name] += n - len(values)
+                if len(values):
+                    self._merge(name, len(values), values.mean(), values.var() * len(values))
+                    self._extend(name, float(values.min()), float(values.max()))
+                self.sample[name][slots] = _floats(column.take(take))
+            elif kind == "text":
+                self.missing[name] += column.null_count
+                self.sample[name][slots] = _texts(column.take(take))
+            else:
+                self.missing[name] += column.null_count
+                bounds = pc.min_max(column)
+                if bounds["min"].is_valid:
+                    self._extend(name, bounds["min"].as_py(), bounds["max"].as_py())
+        self.rows += n
+
+    def _merge(self, name, count, mean, m2):
+        n_a, mean_a, m2_a = self.moments.get(name, (0, 0.0, 0.0))
+        total = n_a + count
+        delta = mean - mean_a
+        self.moments[name] = (total, mean_a + delta * count / total, m2_a + m2 + delta * delta * n_a * count / total)
+
+    def summary(self):
+        """JSON-able summary: exact counts and moments, the rest estimated from the sample."""
+        filled = min(self.rows, self.sample_rows)
+        columns, histograms, numeric = [], {}, {}
+        for name in self.columns:
+            kind = self.kinds[name]
+            entry = {"name": name, "type": str(self.types[name]), "kind": kind, "count": self.rows - self.missing[name],
+                     "missing": self.missing[name], "min": self.low[name], "max": self.high[name]}
+            if kind == "numeric":
+                count, mean, m2 = self.moments.get(name, (0, None, 0.0))
+                entry["mean"] = mean
+                entry["std"] = math.sqrt(m2 / (count - 1)) if count > 1 else None
+                sample = self.sample[name][:filled]
+                values = sample[~np.isnan(sample)]
+                if len(values):
+                    entry["quartiles"] = np.percentile(values, [25, 50, 75]).tolist()
+                    edges = _edges(self.low[name], self.high[name])
+                    counts = np.histogram(values, edges)[0] * (count / len(values))
+                    histograms[name] = {"edges": edges.tolist(), "counts": counts.round().tolist()}
+                    if len(numeric) < MAX_CORRELATION and self.low[name] != self.high[name]:
+                        numeric[name] = sample
+            elif kind == "text":
+                values = self.sample[name][:filled]
+                values = values[pd.notna(values)]
+                top = collections.Counter(values.tolist())
+                entry["distinct"] = len(top)
+                entry["top"] = [[value, hits / len(values)] for value, hits in top.most_common(3)]
+            columns.append(entry)
+        return {
+            "rows": self.rows,
+            "sample_rows": filled,
+            "columns": columns,
+            "histograms": histograms,
+            "correlation": _correlation(pd.DataFrame(numeric)),
+            "preview": self.preview or [],
+        }
+
+
+class Refinement:
+    """Exact histograms (over a summary's bins) and pairwise correlations of its numeric columns."""
+
+    def __init__(self, summary):
+        self.edges = {name: np.asarray(hist["edges"]) for name, hist in summary["histograms"].items()}
+        self.counts = {name: np.zeros(HIST_BINS, dtype=np.int64) for name in self.edges}
+        self.correlated = summary["correlation"]["columns"]
+        means = {entry["name"]: entry.get("mean") for entry in summary["columns"]}
+        # Sums are taken around the exact means, which keeps them well-conditioned
+        self.centre = np.array([means[name] for name in self.correlated])
+        size = len(self.correlated)
+        self.n, self.sx, self.sxx, self.sxy = (np.zeros((size, size)) for _ in range(4))
+        self.columns = list(dict.fromkeys([*self.edges, *self.correlated]))
+
+    def fold(self, batch):
+        values = {name: _floats(batch.column(name)) for name in self.columns}
+        for name, edges in self.edges.items():
+            column = values[name]
+            self.counts[name] += np.histogram(column[~np.isnan(column)], edges)[0]
+        if self.correlated:
+            x = np.column_stack([values[name] for name in self.correlated]) - self.centre
+            present = ~np.isnan(x)
+            z, m = np.where(present, x, 0.0), present.astype(np.float64)
+            # [i, j] sums run over the rows where both column i and column j are present
+            self.n += m.T @ m
+            self.sx += z.T @ m
+            self.sxx += (z * z).T @ m
+            self.sxy += z.T @ z
+
+    def result(self):
+        with np.errstate(divide="ignore", invalid="ignore"):
+            n = self.n
+            cov = self.sxy / n - (self.sx / n) * (self.sx.T / n)
+            var_i = self.sxx / n - (self.sx / n) ** 2
+            var_j = self.sxx.T / n - (self.sx.T / n) ** 2
+            matrix = cov / np.sqrt(var_i * var_j)
+        return {
+            "histograms": {name: {"edges": edges.tolist(), "counts": self.counts[name].tolist()}
+                           for name, edges in self.edges.items()},
+            "correlation": {"columns": self.correlated,
+                            "matrix": [[None if math.isnan(r) else round(r, 6) for r in row]
+                                       for row in matrix.tolist()]},
+        }
+
+
+class ScanJob:
+    """Streams ``columns`` of one file through ``fold()`` on a background thread.
+
+    Only the scan thread touches the accumulators; every ``PUBLISH_INTERVAL``
+    it publishes ``partial()`` for snapshot(), which so never waits for a
+    batch or computes a summary itself. A result saved at ``result_path`` by
+    an earlier scan is loaded instead.
+    """
+
+    def __init__(self, path, schema, columns, result_path=None):
+        self.path = Path(path)
+        self.schema = schema
+        self.columns = list(columns)
+        self.result_path = result_path
+        self.rows = 0
+        self.fraction = 0.0
+        self.elapsed = 0.0
+        self.first_result_at = None
+        self.rss_start_kib = rss_kib()
+        self.rss_peak_kib = self.rss_start_kib
+        self.error = None
+        self.result = self._read()
+        self.partial_result = None
+        self.cached = self.done = self.result is not None
+        self._lock = threading.Lock()
+
+    def _read(self):
+        try:
+            result = json.loads(self.result_path.read_text(encoding="utf-8"))
+        except (AttributeError, OSError, ValueError):
+            return None
+        _touch(self.result_path)  # used: pruned last
+        return result
+
+    def _save(self, result):
+        self.result_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.result_path.with_name(f".{self.result_path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        tmp.write_text(json.dumps(result, default=str), encoding="utf-8")
+        tmp.replace(self.result_path)
+        _prune(self.result_path.parent, "*.json", MAX_RESULTS)
+
+    def start(self):
+        threading.Thread(target=self.run, name="eda-scan", daemon=True).start()
+        return self
+
+    def partial(self):
+        return None
+
+    def run(self):
+        start = time.perf_counter()
+        published = None
+        try:
+            for batch, fraction in batches(self.path, self.schema, self.columns):
+                self.fold(batch)
+                partial = None
+                if published is None or time.perf_counter() - published >= PUBLISH_INTERVAL:
+                    partial, published = self.partial(), time.perf_counter()
+                with self._lock:
+                    self.rows += batch.num_rows
+                    self.fraction = fraction
+                    self.elapsed = time.perf_counter() - start
+                    if partial is not None:
+                        self.partial_result = partial
+                        if self.first_result_at is None:
+                            self.first_result_at = self.elapsed
+                    self.rss_peak_kib = max(self.rss_peak_kib, rss_kib())
+                del batch  # lets batches() free the block before parsing the next one
+            result = self.finish()
+            if self.result_path is not None:
+                try:
+                    self._save(result)
+                except OSError:
+                    pass  # shown anyway; scanned again after a restart
+            with self._lock:
+                self.result = result
+        except (OSError, ValueError, pa.ArrowException) as exc:
+            self.error = exc
+        finally:
+            with self._lock:
+                self.elapsed = time.perf_counter() - start
+                self.done = True
+
+    def progress(self):
+        return {
+            "rows": self.rows,
+            "fraction": 1.0 if self.cached else self.fraction,
+            "rows_per_second": self.rows / self.elapsed if self.elapsed else 0.0,
+            "elapsed": self.elapsed,
+            "first_result_at": self.first_result_at,
+            "rss_growth_kib": self.rss_peak_kib - self.rss_start_kib,
+            "cached": self.cached,
+            "done": self.done,
+            "error": self.error,
+        }
+
+
+class ProfileJob(ScanJob):
+    """The first scan: a Profile of every selected column, summarized while it runs."""
+
+    def __init__(self, path, schema, columns, result_path=None):
+        super().__init__(path, schema, columns, result_path)
+        self.profile = None if self.done else Profile(schema, columns)
+
+    def fold(self, batch):
+        self.profile.fold(batch)
+
+    def partial(self):
+        return self.profile.summary()
+
+    def finish(self):
+        summary = self.profile.summary()
+        self.profile = None  # frees the sample
+        return summary
+
+    def snapshot(self):
+        """Progress plus the latest summary (None before the first batch)."""
+        with self._lock:
+            return {**self.progress(), "summary": self.result or self.partial_result}
+
+
+class RefineJob(ScanJob):
+    """The exact pass over the numeric columns of a finished summary."""
+
+    def __init__(self, path, schema, summary, result_path=None):
+        self.refinement = Refinement(summary)
+        super().__init__(path, schema, self.refinement.columns, result_path)
+
+    def fold(self, batch):
+        self.refinement.fold(batch)
+
+    def finish(self):
+        return self.refinement.result()
+
+    def snapshot(self):
+        with self._lock:
+            return {**self.progress(), "result": self.result}
+
+
+_jobs = collections.OrderedDict()
+_jobs_lock = threading.Lock()
+
+
+def _key(path, columns):
+    digest = hashlib.sha256(json.dumps([FORMAT, fingerprint(path), list(columns)]).encode("utf-8"))
+    return digest.hexdigest()[:24]
+
+
+def _remember(key, job):
+    _jobs[key] = job
+    finished = [old for old, other in _jobs.items() if other.done and old != key]
+    for old in finished[:max(0, len(_jobs) - MAX_JOBS)]:
+        del _jobs[old]
+
+
+def job_for(path, columns):
+    """The ProfileJob of ``columns`` of the current version of ``path``; started (or loaded) on first use."""
+    key = _key(path, columns)
+    with _jobs_lock:
+        job = _jobs.get(key)
+        if job is None:
+            job = ProfileJob(path, read_schema(path), columns, RESULTS_DIR / f"{key}.json")
+            _remember(key, job)
+            if not job.done:
+                job.start()
+        return job
+
+
+def refine_job_for(path, columns, summary, start=False):
+    """The RefineJob of a finished profile: a running or saved one, else a new one if ``start``."""
+    key = _key(path, columns) + ".exact"
+    with _jobs_lock:
+        job = _jobs.get(key)
+        if job is None:
+            job = RefineJob(path, read_schema(path), summary, RESULTS_DIR / f"{key}.json")
+            if not job.done and not start:
+                return None
+            _remember(key, job)
+            if not job.done:
+                job.start()
+        return job
+
+
+# Synthetic passengers, Titanic-style (the dataset the EDA internship project used)
+def synthetic_batch(rng, start, n):
+    pclass = rng.choice([1, 2, 3], n, p=[0.24, 0.21, 0.55])
+    female = rng.random(n) < 0.35
+    age = rng.normal(30, 14, n).clip(0.4, 80).round(1)
+    age_missing = rng.random(n) < 0.2
+    fare = np.exp(rng.normal(4.2 - 0.8 * (pclass - 1), 0.6)).round(2)
+    sibsp = rng.poisson(0.5, n)
+    embarked = np.array(["S", "C", "Q"])[rng.choice(3, n, p=[0.72, 0.19, 0.09])]
+    logit = 2.4 * female - 0.9 * (pclass - 2) - 0.02 * np.where(age_missing, 30, age) - 0.2 * sibsp
+    survived = (rng.random(n) < 1 / (1 + np.exp(-logit))).astype(np.int64)
+    ids = pa.array(np.arange(start, start + n) + 1)
+    return pa.RecordBatch.from_pydict({
+        "passenger_id": ids,
+        "survived": survived,
+        "pclass": pclass,
+        "sex": np.where(female, "female", "male"),
+        "age": pa.array(age, mask=age_missing),
+        "sibsp": sibsp,
+        "fare": fare,
+        "ticket": pc.binary_join_element_wise("PC", ids.cast(pa.string()), "-"),
+        "embarked": pa.array(embarked, mask=rng.random(n) < 0.002),
+        "boarded": pa.array(rng.integers(0, 365, n) + 15_400, pa.int32()).cast(pa.date32()),
+    })
+
+
+def generate(path, size_mb, fmt="csv", seed=0, progress=None):
+    """Write synthetic passengers to ``path`` until it holds ``size_mb`` MiB (memory stays flat)."""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    target = size_mb * 2 ** 20
+    rng = np.random.default_rng(seed)
+    rows, size, chunk = 0, 0, 10_000
+    schema = synthetic_batch(rng, 0, 1).schema
+    with open(tmp, "wb") as fh:
+        writer = pq.ParquetWriter(fh, schema) if fmt == "parquet" else pa_csv.CSVWriter(fh, schema)
+        try:
+            while size < target:
+                writer.write_batch(synthetic_batch(rng, rows, chunk))
+                rows += chunk
+                size = fh.tell()
+                # Size the next chunk from the bytes per row so far
+                chunk = int(min(1_000_000, max(1000, (target - size) / max(size, 1) * rows)))
+                if progress is not None:
+                    progress(size, target)
+        finally:
+            writer.close()
+    tmp.replace(path)
+    return path
+
+
+_generate_lock = threading.Lock()
+
+
+def ensure_sample(path, size_mb):
+    """Generate a ``size_mb`` MiB sample at ``path`` unless it exists; one generator at a time."""
+    with _generate_lock:
+        if not path.exists():
+            generate(path, size_mb)
+    return path
+
+
+def _format(value):
+    if value is None:
+        return "—"
+    if isinstance(value, float):
+        return f"{value:,.4g}"
+    return f"{value:,}" if isinstance(value, int) else str(value)
+
+
+def summary_frame(summary):
+    """The summary table, one row per column; estimated cells are marked ≈ unless the sample is the file."""
+    mark = "" if summary["sample_rows"] == summary["rows"] else " ≈"
+    table = []
+    for entry in summary["columns"]:
+        quartiles = entry.get("quartiles", [None] * 3)
+        top = entry.get("top")
+        table.append({
+            "Column": entry["name"],
+            "Type": entry["type"],
+            "Non-null": f"{entry['count']:,}",
+            "Missing": f"{entry['missing'] / summary['rows']:.1%}" if summary["rows"] else "—",
+            "Mean": _format(entry.get("mean")),
+            "Std": _format(entry.get("std")),
+            "Min": _format(entry["min"]),
+            f"25%{mark}": _format(quartiles[0]),
+            f"Median{mark}": _format(quartiles[1]),
+            f"75%{mark}": _format(quartiles[2]),
+            "Max": _format(entry["max"]),
+            f"Distinct{mark}": _format(entry.get("distinct")),
+            f"Top values{mark}": ", ".join(f"{value} ({share:.0%})" for value, share in top) if top else "—",
+        })
+    return pd.DataFrame(table)
+
+
+def scan_metrics(st, snap, path):
+    col1, col2, col3, col4 = st.columns(4)
+    with col1:
+        st.metric("Rows scanned", f"{snap['rows']:,}")
+    with col2:
+        first = snap["first_result_at"]
+        st.metric("First summary", "cached" if snap["cached"] else f"{first:.2f} s" if first is not None else "…")
+    with col3:
+        st.metric("File size", f"{path.stat().st_size / 2 ** 20:,.1f} MiB")
+    with col4:
+        st.metric("Memory growth", f"{snap['rss_growth_kib'] / 1024:,.0f} MiB")
+
+
+# Polls a running scan and redraws the partial summary; re-runs the demo once it is done
+def scan_progress(job):
+    import streamlit as st
+
+    snap = job.snapshot()
+    if snap["done"]:
+        st.rerun()
+    scan_metrics(st, snap, job.path)
+    st.progress(snap["fraction"], text=f"Scanning {job.path.name}: {snap['rows_per_second']:,.0f} rows/s...")
+    if snap["summary"] is not None:
+        summary = snap["summary"]
+        st.caption(f"Estimated from a uniform sample of {summary['sample_rows']:,} of the "
+                   f"{summary['rows']:,} rows read so far")
+        st.dataframe(summary_frame(summary), hide_index=True)
+
+
+def refine_progress(job):
+    import streamlit as st
+
+    snap = job.snapshot()
+    if snap["done"]:
+        st.rerun()
+    st.progress(snap["fraction"], text=f"Exact pass over {len(job.columns)} numeric columns...")
+
+
+def pick_file(st):
+    """The uploaded or chosen file, or None."""
+    upload = st.file_uploader("Upload a CSV or Parquet file", type=["csv", "parquet"], key="eda_upload")
+    if upload is not None:
+        saved = st.session_state.setdefault("eda_uploads", {})
+        # Another session's uploads may have pruned it since: store it again
+        if upload.file_id not in saved or not saved[upload.file_id].exists():
+            saved[upload.file_id] = save_upload(upload)
+        else:
+            _touch(saved[upload.file_id])
+        return saved[upload.file_id]
+    files = local_files()
+    if files:
+        name = st.selectbox(f"Or pick a file from `{eda_dir()}` (any size)", [path.name for path in files],
+                            key="eda_file")
+        return eda_dir() / name
+    st.info(f"Upload a file, or put CSV or Parquet files of any size in `{eda_dir()}`. Create a large synthetic "
+            "one with `python -m portfolio.demos.eda --size-mb 1000`, or a small one here.")
+    if st.button("Generate a 50 MB sample"):
+        with st.spinner("Generating sample data..."):
+            return ensure_sample(eda_dir() / "passengers-sample.csv", 50)
+    return None
+
+
+def render():
+    import streamlit as st
+
+    from portfolio import figures, ui
+
+    st.markdown("#### 🔍 Exploratory Data Analysis")
+    path = pick_file(st)
+    if path is None:
+        return
+    try:
+        names = read_schema(path).names
+    except (OSError, ValueError, pa.ArrowException) as exc:
+        st.error(f"Could not read {path.name}: {exc}")
+        return
+    version = fingerprint(path)
+    columns = st.multiselect("Columns to profile", names, default=names[:DEFAULT_COLUMNS],
+                             key=f"eda_columns.{version}")
+    if not columns:
+        return
+
+    job = job_for(path, columns)
+    snap = job.snapshot()
+    if snap["error"] is not None:
+        st.error(f"Scan failed: {snap['error']}")
+        return
+    if not snap["done"]:
+        st.fragment(run_every=1.0)(scan_progress)(job)
+        return
+
+    summary = snap["summary"]
+    scan_metrics(st, snap, path)
+    exact_rows = summary["sample_rows"] == summary["rows"]
+    st.caption(f"{summary['rows']:,} rows. Counts, missing values, min, max, mean and std are exact"
+               + ("; so is the rest: the file fits in the sample." if exact_rows else
+                  f"; ≈ marks estimates from a uniform sample of {summary['sample_rows']:,} rows."))
+    st.dataframe(summary_frame(summary), hide_index=True)
+    with st.expander("First rows"):
+        st.dataframe(pd.DataFrame(summary["preview"]), hide_index=True)
+
+    histograms, correlation = summary["histograms"], summary["correlation"]
+    refine = None if exact_rows else refine_job_for(path, columns, summary)
+    if refine is not None and refine.snapshot()["error"] is not None:
+        st.error(f"Exact pass failed: {refine.snapshot()['error']}")
+    elif refine is not None and not refine.snapshot()["done"]:
+        st.fragment(run_every=1.0)(refine_progress)(refine)
+    elif refine is not None:
+        exact = refine.snapshot()["result"]
+        histograms, correlation = exact["histograms"], exact["correlation"]
+        estimated = np.array(summary["correlation"]["matrix"], dtype=float)
+        change = np.nanmax(np.abs(np.array(correlation["matrix"], dtype=float) - estimated), initial=0.0)
+        st.caption(f"🎯 Histograms and correlations counted exactly; the sample estimates were off by "
+                   f"at most {change:.3f} in r.")
+    elif not exact_rows and histograms:
+        numeric = len(summary["histograms"])
+        if st.button(f"🎯 Exact histograms & correlations (re-reads {numeric} numeric columns)",
+                     key=f"eda_exact.{version}"):
+            refine_job_for(path, columns, summary, start=True)
+            st.rerun()
+
+    col1, col2 = st.columns(2)
+    if histograms:
+        with col1:
+            name = st.selectbox("Histogram of", list(histograms), key=f"eda_histogram.{version}")
+            chart = figures.histogram(histograms[name], title=f"Distribution of {name}", x_title=name,
+                                      color="#1f77b4", height=380)
+            ui.show_chart(chart, "eda_histogram")
+    if len(correlation["columns"]) > 1:
+        with col2:
+            chart = figures.heatmap({"z": tuple(map(tuple, correlation["matrix"])), "x": tuple(correlation["columns"]),
+                                     "y": tuple(correlation["columns"])},
+                                    title="Correlation (Pearson r)", color_scale="RdBu", height=420,
+                                    z_range=(-1, 1))
+            ui.show_chart(chart, "eda_correlation")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--size-mb", type=float, default=1000)
+    parser.add_argument("--format", choices=("csv", "parquet"), default="csv")
+    parser.add_argument("--out", type=Path, default=None,
+                        help="file to write (default: passengers-<size>mb.<format> in the eda directory)")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    out = args.out or eda_dir() / f"passengers-{args.size_mb:g}mb.{args.format}"
+    start = time.perf_counter()
+
+    def progress(done, total):
+        print(f"\r{done / 2 ** 20:,.0f}/{total / 2 ** 20:,.0f} MiB", end="", flush=True)
+
+    generate(out, args.size_mb, args.format, args.seed, progress=progress)
+    print(f"\nwrote {out} ({out.stat().st_size / 2 ** 20:,.0f} MiB) in {time.perf_counter() - start:.0f} s")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
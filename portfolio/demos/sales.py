@@ -0,0 +1,245 @@
+"""Sales & Business Insights demo: slicers answered from a pre-aggregated cube.
+
+A synthetic order table (``[portfolio.demos] sales_rows``, 10M by default,
+Blinkit-style item categories) is generated once per process. Building the
+dataset aggregates it into a region x category x day cube of revenue, units
+and order counts with one ``np.bincount`` per measure, and sorts the raw
+orders by (region, category, day) so any slice of them is a handful of
+contiguous ranges.
+
+Every slicer change is then answered from the cube -- a few thousand cells
+summed with NumPy -- rather than by grouping 10M rows. The only chart that
+needs raw orders samples them through the sorted ranges. Series longer than
+``webgl_threshold`` points are downsampled on the server and drawn with
+WebGL (``Scattergl``) in interactive mode.
+"""
+import datetime
+import threading
+import time
+
+import numpy as np
+
+from portfolio import settings
+
+REGIONS = ("North", "South", "East", "West", "Central", "North-East")
+CATEGORIES = ("Fruits and Vegetables", "Snack Foods", "Household", "Frozen Foods", "Dairy", "Canned",
+              "Baking Goods", "Health and Hygiene", "Soft Drinks", "Meat", "Breads", "Hard Drinks", "Others",
+              "Starchy Foods", "Breakfast", "Seafood")
+START = datetime.date(2022, 1, 1)
+DAYS = (datetime.date(2025, 1, 1) - START).days
+MONTHS = 36
+DEFAULT_ROWS = 10_000_000
+# Points per chart above which series are downsampled and drawn with WebGL
+DEFAULT_WEBGL_THRESHOLD = 1000
+# Orders drawn in the order-value scatter
+SCATTER_POINTS = 2000
+
+# Month index (0-35) of every day
+_DAY_MONTH = np.array([(d.year - START.year) * 12 + d.month - 1
+                       for d in (START + datetime.timedelta(days=i) for i in range(DAYS))], dtype=np.int64)
+MONTH_LABELS = tuple(datetime.date(START.year + m // 12, m % 12 + 1, 1).strftime("%b %Y") for m in range(MONTHS))
+
+
+def config():
+    return settings.portfolio_config().get("demos", {})
+
+
+def generate(rows, seed=0, chunk_rows=2_000_000):
+    """Synthetic orders as columns: region, category, day (since START), units, amount."""
+    rng = np.random.default_rng(seed)
+    region_p = np.array([24, 22, 15, 20, 12, 7], dtype=float)
+    category_p = rng.dirichlet(np.full(len(CATEGORIES), 2.0))
+    base_price = rng.uniform(40, 400, len(CATEGORIES))
+    peak = rng.uniform(0, 2 * np.pi, len(CATEGORIES))
+    day = np.arange(DAYS)
+    # Growth through the three years, weekend bump, per-category seasonality
+    day_p = (1 + day / DAYS) * np.where((day + START.weekday()) % 7 >= 5, 1.25, 1.0)
+
+    columns = {name: [] for name in ("region", "category", "day", "units", "amount")}
+    for start in range(0, rows, chunk_rows):
+        n = min(chunk_rows, rows - start)
+        category = rng.choice(len(CATEGORIES), n, p=category_p)
+        days = rng.choice(DAYS, n, p=day_p / day_p.sum())
+        season = 1 + 0.3 * np.sin(2 * np.pi * days / 365.25 + peak[category])
+        units = 1 + rng.poisson(1.5 * season)
+        columns["region"].append(rng.choice(len(REGIONS), n, p=region_p / region_p.sum()).astype(np.uint8))
+        columns["category"].append(category.astype(np.uint8))
+        columns["day"].append(days.astype(np.uint16))
+        columns["units"].append(units.astype(np.uint16))
+        columns["amount"].append((units * base_price[category] * rng.lognormal(0, 0.25, n)).astype(np.float32))
+    return {name: np.concatenate(parts) for name, parts in columns.items()}
+
+
+class SalesCube:
+    """Region x category x day aggregates plus the orders sorted by that key."""
+
+    def __init__(self, orders):
+        start = time.perf_counter()
+        self.rows = len(orders["day"])
+        shape = (len(REGIONS), len(CATEGORIES), DAYS)
+        key = (orders["region"].astype(np.int64) * len(CATEGORIES) + orders["category"]) * DAYS + orders["day"]
+        size = int(np.prod(shape))
+        self.revenue = np.bincount(key, weights=orders["amount"], minlength=size).reshape(shape)
+        self.units = np.bincount(key, weights=orders["units"], minlength=size).reshape(shape)
+        self.orders = np.bincount(key, minlength=size).reshape(shape)
+
+        # Raw orders grouped by cube cell: cell i's orders are amounts[bounds[i]:bounds[i + 1]]
+        order = np.argsort(key, kind="stable")
+        self.amounts = orders["amount"][order]
+        self.days = orders["day"][order]
+        self.bounds = np.concatenate(([0], np.cumsum(self.orders.ravel())))
+        self.build_seconds = time.perf_counter() - start
+
+    def select(self, regions, categories, months):
+        """Index arrays for the slicer values; ``months`` is an inclusive (first, last) pair."""
+        r = np.array([REGIONS.index(name) for name in regions], dtype=np.int64)
+        c = np.array([CATEGORIES.index(name) for name in categories], dtype=np.int64)
+        d = np.flatnonzero((_DAY_MONTH >= months[0]) & (_DAY_MONTH <= months[1]))
+        return r, c, d
+
+    def query(self, regions, categories, months):
+        """Everything the dashboard shows for one slicer state, from the cube alone."""
+        r, c, d = self.select(regions, categories, months)
+        revenue = self.revenue[np.ix_(r, c, d)]
+        units = self.units[np.ix_(r, c, d)]
+        orders = self.orders[np.ix_(r, c, d)]
+        daily = revenue.sum(axis=(0, 1))
+        month_of_day = _DAY_MONTH[d] - months[0]
+        return {
+            "revenue": float(revenue.sum()),
+            "units": int(units.sum()),
+            "orders": int(orders.sum()),
+            "by_region": revenue.sum(axis=(1, 2)),
+            "by_category": revenue.sum(axis=(0, 2)),
+            "by_month": np.bincount(month_of_day, weights=daily, minlength=months[1] - months[0] + 1),
+            "daily": daily,
+            "days": d,
+        }
+
+    def sample_orders(self, regions, categories, months, limit, seed=0):
+        """Up to ``limit`` (day, amount) orders from the slice, sampled uniformly without gathering it."""
+        r, c, d = self.select(regions, categories, months)
+        if not len(d):
+            return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.float32)
+        cells = (r[:, None] * len(CATEGORIES) + c[None, :]).ravel()
+        # Orders in a cell are sorted by day, so the month range is one sub-range of each cell
+        first = self.bounds[cells * DAYS + d[0]]
+        last = self.bounds[cells * DAYS + d[-1] + 1]
+        sizes = last - first
+        total = int(sizes.sum())
+        if total == 0:
+            return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.float32)
+        picks = np.arange(total) if total <= limit else np.sort(
+            np.random.default_rng(seed).choice(total, limit, replace=False))
+        ends = np.cumsum(sizes)
+        segment = np.searchsorted(ends, picks, side="right")
+        rows = first[segment] + picks - (ends[segment] - sizes[segment])
+        return self.days[rows].astype(np.int64), self.amounts[rows]
+
+
+def minmax_downsample(x, y, buckets):
+    """At most ``2 * buckets`` points keeping each bucket's minimum and maximum (peaks survive)."""
+    if len(x) <= 2 * buckets:
+        return x, y
+    edges = np.linspace(0, len(x), buckets + 1).astype(np.int64)
+    keep = []
+    for lo, hi in zip(edges[:-1], edges[1:]):
+        segment = y[lo:hi]
+        keep.extend(sorted({lo + int(np.argmin(segment)), lo + int(np.argmax(segment))}))
+    keep = np.array(keep)
+    return x[keep], y[keep]
+
+
+def year_fraction(days):
+    """Days since START as fractional years (numeric x axis for the static snapshots)."""
+    return START.year + np.asarray(days) / 365.25
+
+
+_cube = None
+_cube_lock = threading.Lock()
+
+
+def cube():
+    """The process-wide SalesCube, generated and aggregated on first use."""
+    global _cube
+    if _cube is None:
+        with _cube_lock:
+            if _cube is None:
+                _cube = SalesCube(generate(int(config().get("sales_rows", DEFAULT_ROWS))))
+    return _cube
+
+
+def render():
+    import streamlit as st
+
+    from portfolio import figures, ui
+
+    st.markdown("#### 📊 Sales & Business Insights")
+    with st.spinner("Generating and aggregating the sales data (first visit only)..."):
+        data = cube()
+    threshold = int(config().get("webgl_threshold", DEFAULT_WEBGL_THRESHOLD))
+
+    col1, col2, col3 = st.columns([2, 2, 3])
+    with col1:
+        regions = st.multiselect("Region", REGIONS, default=list(REGIONS), key="sales_regions")
+    with col2:
+        categories = st.multiselect("Category", CATEGORIES, default=list(CATEGORIES), key="sales_categories")
+    with col3:
+        first, last = st.select_slider("Months", MONTH_LABELS, value=(MONTH_LABELS[0], MONTH_LABELS[-1]),
+                                       key="sales_months")
+    months = (MONTH_LABELS.index(first), MONTH_LABELS.index(last))
+    if not regions or not categories:
+        st.info("Pick at least one region and one category.")
+        return
+
+    start = time.perf_counter()
+    result = data.query(regions, categories, months)
+    elapsed = time.perf_counter() - start
+
+    col1, col2, col3, col4 = st.columns(4)
+    with col1:
+        st.metric("Revenue", f"₹{result['revenue'] / 1e7:,.2f} Cr")
+    with col2:
+        st.metric("Orders", f"{result['orders']:,}")
+    with col3:
+        st.metric("Units", f"{result['units']:,}")
+    with col4:
+        st.metric("Avg order value", f"₹{result['revenue'] / max(result['orders'], 1):,.0f}")
+    st.caption(f"Answered from the {len(REGIONS)}×{len(CATEGORIES)}×{DAYS:,} cube in {elapsed * 1000:.2f} ms · "
+               f"{data.rows:,} orders aggregated once in {data.build_seconds:.1f} s")
+
+    col1, col2 = st.columns(2)
+    with col1:
+        chart = figures.timeline(
+            {"Month": MONTH_LABELS[months[0]:months[1] + 1],
+             "Revenue (₹ lakh)": tuple((result["by_month"] / 1e5).round(1).tolist())},
+            x="Month", y="Revenue (₹ lakh)", title="Monthly Revenue", height=350)
+        ui.show_chart(chart, "sales_by_month")
+    with col2:
+        chart = figures.horizontal_bar(
+            {"Region": tuple(regions), "Revenue (₹ lakh)": tuple((result["by_region"] / 1e5).round(1).tolist())},
+            x="Revenue (₹ lakh)", y="Region", title="Revenue by Region", color_scale="Blues", height=350)
+        ui.show_chart(chart, "sales_by_region")
+
+    top = np.argsort(result["by_category"])[-8:]
+    chart = figures.horizontal_bar(
+        {"Category": tuple(categories[i] for i in top),
+         "Revenue (₹ lakh)": tuple((result["by_category"][top] / 1e5).round(1).tolist())},
+        x="Revenue (₹ lakh)", y="Category", title="Top Categories", color_scale="Greens", height=350)
+    ui.show_chart(chart, "sales_top_categories")
+
+    x, y = year_fraction(result["days"]), result["daily"] / 1e5
+    webgl = len(x) > threshold
+    if webgl:
+        x, y = minmax_downsample(x, y, threshold // 2)
+    chart = figures.series({"Year": tuple(x.round(4).tolist()), "Revenue (₹ lakh)": tuple(y.round(2).tolist())},
+                           x="Year", y="Revenue (₹ lakh)", title="Daily Revenue", mode="lines", webgl=webgl,
+                           height=350)
+    ui.show_chart(chart, "sales_daily")
+
+    days, amounts = data.sample_orders(regions, categories, months, SCATTER_POINTS)
+    chart = figures.series({"Year": tuple(year_fraction(days).round(4).tolist()),
+                            "Order value (₹)": tuple(amounts.round(0).tolist())},
+                           x="Year", y="Order value (₹)", title=f"Order Values ({len(days):,} sampled orders)",
+                           mode="markers", webgl=len(days) > threshold, height=350)
+    ui.show_chart(chart, "sales_orders")
@@ -0,0 +1,346 @@
+"""Sentiment Analysis Engine demo: brand perception over a stream of social posts.
+
+Posts flow through a generator pipeline -- uploads are read ``CSV_ROWS``
+rows at a time by ``from_csv()``, ``chunked()`` groups posts, then
+``score_stream()`` fans the chunks out to the process pool and yields scored
+chunks back in order, with one chunk per worker in flight so memory stays
+bounded however large the corpus. ``Trends`` folds each scored chunk into
+per-day, per-brand sums as it arrives, and the page redraws the rolling
+average while the stream is still running.
+
+Every session shares one pool of ``PROCESSES`` workers, started by
+``start()`` -- at boot by ``python -m portfolio.serve``, otherwise on first
+use.
+
+Scoring is a small VADER-style lexicon model (word valences, negation,
+intensifiers, exclamation marks); it is pure Python, so it is CPU-bound and
+scales with worker processes rather than threads.
+"""
+import atexit
+import itertools
+import math
+import multiprocessing
+import os
+import re
+import sys
+import threading
+import time
+import types
+from collections import deque
+
+import numpy as np
+import pandas as pd
+
+CHUNK_DOCS = 2000
+CSV_ROWS = 50_000
+PROCESSES = os.cpu_count() or 1
+
+LEXICON = {
+    "love": 3.2, "loved": 2.9, "loving": 2.9, "amazing": 2.8, "awesome": 3.1, "excellent": 3.2, "great": 3.1,
+    "fantastic": 2.6, "wonderful": 2.7, "perfect": 2.7, "best": 3.2, "brilliant": 2.8, "happy": 2.7,
+    "glad": 2.0, "good": 1.9, "nice": 1.8, "cool": 1.3, "fast": 1.1, "easy": 1.9, "helpful": 1.8,
+    "recommend": 1.5, "recommended": 1.5, "reliable": 1.8, "smooth": 1.4, "friendly": 2.2, "fun": 2.3,
+    "impressed": 2.1, "pleased": 2.0, "satisfied": 1.8, "solid": 1.4, "thanks": 1.9, "thank": 1.5,
+    "worth": 0.9, "win": 2.8, "wow": 2.1, "beautiful": 2.9, "quality": 1.4, "affordable": 1.3, "fixed": 1.0,
+    "like": 1.5, "liked": 1.8, "enjoy": 2.2, "enjoyed": 2.3, "superb": 3.1, "delighted": 3.1, "ok": 0.9,
+    "okay": 0.9, "fine": 0.8, "works": 0.7, "upgrade": 0.6,
+    "hate": -2.7, "hated": -3.2, "awful": -2.0, "terrible": -2.1, "horrible": -2.5, "worst": -3.1,
+    "bad": -2.5, "poor": -2.1, "slow": -1.1, "broken": -2.1, "broke": -1.8, "bug": -1.2, "buggy": -1.9,
+    "crash": -1.6, "crashed": -1.7, "crashes": -1.6, "disappointed": -1.9, "disappointing": -2.2,
+    "annoying": -1.7, "angry": -2.3, "useless": -1.8, "waste": -1.8, "expensive": -0.9, "overpriced": -1.9,
+    "refund": -0.8, "scam": -2.6, "rude": -2.0, "fail": -2.5, "failed": -2.3, "fails": -2.3, "problem": -1.7,
+    "problems": -1.7, "issue": -0.8, "issues": -0.9, "sucks": -1.5, "lag": -1.0, "laggy": -1.5,
+    "cancel": -0.9, "cancelled": -1.1, "delay": -1.3, "delayed": -1.4, "never": -0.3, "sad": -2.1,
+    "regret": -1.6, "dislike": -1.6, "unhappy": -1.8, "frustrated": -2.0, "frustrating": -1.9, "ugly": -2.3,
+    "dirty": -1.9, "wrong": -2.1, "lost": -1.3, "missing": -1.2, "complaint": -1.6, "meh": -0.6, "boring": -1.3,
+}
+NEGATIONS = {"not", "no", "never", "nobody", "nothing", "neither", "nor", "none", "without", "cannot",
+             "isn't", "wasn't", "don't", "doesn't", "didn't", "can't", "won't", "aren't", "couldn't", "shouldn't"}
+BOOSTERS = {"very": 0.293, "really": 0.293, "so": 0.293, "extremely": 0.293, "super": 0.293, "totally": 0.293,
+            "absolutely": 0.293, "incredibly": 0.293, "slightly": -0.293, "somewhat": -0.293, "barely": -0.293,
+            "kinda": -0.293, "little": -0.293}
+TOKEN = re.compile(r"[a-z']+|!")
+# Scores above/below these count as positive/negative
+THRESHOLD = 0.05
+
+
+def score(text):
+    """Compound sentiment in [-1, 1] for one text."""
+    tokens = TOKEN.findall(text.lower())
+    total = 0.0
+    exclamations = 0
+    for i, token in enumerate(tokens):
+        if token == "!":
+            exclamations += 1
+            continue
+        valence = LEXICON.get(token)
+        if valence is None:
+            continue
+        for back, previous in enumerate(reversed(tokens[max(0, i - 3):i])):
+            if previous in NEGATIONS:
+                valence *= -0.74
+            elif back == 0 and previous in BOOSTERS:
+                boost = BOOSTERS[previous]
+                valence += boost if valence > 0 else -boost
+        total += valence
+    if total:
+        total += math.copysign(min(exclamations, 4) * 0.292, total)
+    return total / math.sqrt(total * total + 15)
+
+
+def score_chunk(texts):
+    """Scores for a list of texts, as float32 (runs in the worker processes)."""
+    return np.fromiter((score(text) for text in texts), dtype=np.float32, count=len(texts))
+
+
+def chunked(records, size=CHUNK_DOCS):
+    """Group an iterable of ``(timestamp, brand, text)`` into lists of ``size``."""
+    records = iter(records)
+    while True:
+        chunk = list(itertools.islice(records, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def start(processes=None):
+    """Start the process-wide pool of ``processes`` (default ``PROCESSES``) workers, once.
+
+    forkserver: workers don't inherit the server's threads and sockets. New
+    processes re-import ``__main__``, which is app1.py inside a script run,
+    so it is hidden while Pool starts its workers (all of them, here). Call
+    this at boot, before any session runs; ``pool()`` falls back to it.
+    """
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            context = multiprocessing.get_context("forkserver")
+            main = sys.modules["__main__"]
+            sys.modules["__main__"] = types.ModuleType("__main__")
+            try:
+                _pool = context.Pool(processes or PROCESSES)
+            finally:
+                sys.modules["__main__"] = main
+        return _pool
+
+
+def pool():
+    """The pool shared by every session."""
+    return _pool or start()
+
+
+def shutdown():
+    """Terminate the pool; the next ``pool()`` starts a new one."""
+    global _pool
+    with _pool_lock:
+        closing, _pool = _pool, None
+    if closing is not None:
+        closing.terminate()
+        closing.join()
+
+
+atexit.register(shutdown)
+
+
+def score_stream(chunks, workers):
+    """Yield ``(chunk, scores)`` in input order, keeping ``workers`` pool processes busy.
+
+    ``workers=0`` scores inline in this process.
+    """
+    chunks = iter(chunks)
+    if workers == 0:
+        for chunk in chunks:
+            yield chunk, score_chunk([record[2] for record in chunk])
+        return
+    workers_pool = pool()
+    pending = deque()
+
+    def submit(chunk):
+        pending.append((chunk, workers_pool.apply_async(score_chunk, ([record[2] for record in chunk],))))
+
+    # Backpressure: one chunk per worker in flight, and the next one is
+    # submitted before the finished one is handed on
+    for chunk in itertools.islice(chunks, workers):
+        submit(chunk)
+    while pending:
+        chunk, result = pending.popleft()
+        scores = result.get()
+        for following in itertools.islice(chunks, 1):
+            submit(following)
+        yield chunk, scores
+
+
+class Trends:
+    """Per-day, per-brand sentiment sums, folded in one scored chunk at a time."""
+
+    def __init__(self):
+        self.documents = 0
+        self.labels = np.zeros(3, dtype=np.int64)  # negative, neutral, positive
+        self._sums = {}  # (day, brand) -> [sum of scores, count]
+
+    def update(self, chunk, scores):
+        self.documents += len(scores)
+        self.labels += np.bincount(np.digitize(scores, (-THRESHOLD, THRESHOLD)), minlength=3)
+        days = np.fromiter((record[0] for record in chunk), dtype=np.float64, count=len(chunk)) // 86400
+        frame = pd.DataFrame({"day": days.astype(np.int64), "brand": [record[1] for record in chunk],
+                              "score": scores})
+        grouped = frame.groupby(["day", "brand"])["score"].agg(["sum", "count"])
+        for key, total, count in zip(grouped.index, grouped["sum"].tolist(), grouped["count"].tolist()):
+            entry = self._sums.setdefault(key, [0.0, 0])
+            entry[0] += total
+            entry[1] += count
+
+    def rolling(self, window=7):
+        """Mean score per brand (columns) and day (index), averaged over the last ``window`` calendar days."""
+        if not self._sums:
+            return pd.DataFrame()
+        index = pd.MultiIndex.from_tuples(list(self._sums), names=["day", "brand"])
+        sums = pd.DataFrame(list(self._sums.values()), index=index, columns=["sum", "count"]).unstack("brand")
+        sums.index = pd.to_datetime(sums.index, unit="D")
+        # A time window: days without posts don't stretch it
+        sums = sums.sort_index().rolling(f"{window}D", min_periods=1).sum()
+        return sums["sum"] / sums["count"]
+
+
+BRANDS = ("Acme Mobile", "Globex Air", "Initech Cloud", "Umbrella Foods")
+TEMPLATES = (
+    "I {adverb} {verb} the new {product} from {brand}{punct}",
+    "{brand} {product} is {adjective}{punct}",
+    "just tried {brand}'s {product} and it was {adjective}",
+    "why is {brand} {product} so {adjective} lately",
+    "{brand} support was {adjective}, {adverb} {adjective2}",
+    "not {adjective} at all, {brand} {product}",
+)
+POSITIVE = {"adjective": ("great", "amazing", "excellent", "good", "fast", "reliable", "awesome", "easy"),
+            "verb": ("love", "enjoy", "like", "recommend")}
+NEGATIVE = {"adjective": ("terrible", "slow", "buggy", "awful", "disappointing", "overpriced", "broken", "poor"),
+            "verb": ("hate", "regret", "returned", "dislike")}
+NEUTRAL_WORDS = ("app", "update", "service", "flight", "order", "plan", "release", "delivery")
+
+
+def synthetic(documents, days=180, seed=0, start=None):
+    """Yield ``documents`` synthetic posts ``(timestamp, brand, text)`` in time order.
+
+    Each brand's share of positive posts drifts along a sine curve, so the
+    trend chart has something to show.
+    """
+    rng = np.random.default_rng(seed)
+    start = time.time() - days * 86400 if start is None else start
+    phases = rng.uniform(0, 2 * math.pi, len(BRANDS))
+    block = 10_000
+    for offset in range(0, documents, block):
+        n = min(block, documents - offset)
+        ts = start + (offset + np.arange(n)) / documents * days * 86400
+        brand = rng.integers(0, len(BRANDS), n)
+        day = (ts - start) / 86400
+        p_positive = 0.55 + 0.3 * np.sin(2 * math.pi * day / 60 + phases[brand])
+        positive = rng.random(n) < p_positive
+        template = rng.integers(0, len(TEMPLATES), n)
+        picks = rng.integers(0, 8, (n, 4))
+        for i in range(n):
+            words = POSITIVE if positive[i] else NEGATIVE
+            text = TEMPLATES[template[i]].format(
+                brand=BRANDS[brand[i]], product=NEUTRAL_WORDS[picks[i, 0]],
+                adjective=words["adjective"][picks[i, 1]], adjective2=words["adjective"][picks[i, 2]],
+                verb=words["verb"][picks[i, 3] % 4], adverb="really" if picks[i, 3] < 4 else "so",
+                punct="!" * (picks[i, 2] % 3))
+            yield float(ts[i]), BRANDS[brand[i]], text
+
+
+def from_frame(frame, first_row=0):
+    """``(timestamp, brand, text)`` records from a frame of an uploaded CSV with a ``text`` column.
+
+    Optional ``date``/``timestamp`` and ``brand`` columns; without a date,
+    rows are spread one per minute in file order, ``first_row`` being the
+    frame's first row in the file.
+    """
+    columns = {name.lower(): name for name in frame.columns}
+    if "text" not in columns:
+        raise ValueError("the CSV needs a 'text' column")
+    texts = frame[columns["text"]].fillna("").astype(str)
+    date_column = columns.get("date") or columns.get("timestamp") or columns.get("created_at")
+    if date_column:
+        ts = pd.to_datetime(frame[date_column], errors="coerce", utc=True)
+        # Whole seconds whatever unit pandas parsed to (ns before 3.0, us since)
+        ts = ((ts - pd.Timestamp(0, tz="UTC")) // pd.Timedelta("1s")).fillna(0).to_numpy(dtype=float)
+    else:
+        ts = (first_row + np.arange(len(frame), dtype=float)) * 60
+    brands = frame[columns["brand"]].astype(str) if "brand" in columns else pd.Series(["All"] * len(frame))
+    return zip(ts.tolist(), brands.tolist(), texts.tolist())
+
+
+def from_csv(source, rows=CSV_ROWS):
+    """Records of a CSV, read ``rows`` rows at a time; the first block is read (and checked) up front."""
+    reader = pd.read_csv(source, chunksize=rows)
+    first = next(reader, None)
+    if first is None:
+        raise ValueError("the CSV has no rows")
+    records = from_frame(first)
+
+    def stream():
+        yield from records
+        read = len(first)
+        for frame in reader:
+            yield from from_frame(frame, read)
+            read += len(frame)
+
+    return stream()
+
+
+def render():
+    import streamlit as st
+
+    st.markdown("#### 😊 Sentiment Analysis Engine")
+    col1, col2 = st.columns(2)
+    with col1:
+        size = st.select_slider("Synthetic posts", [10_000, 100_000, 500_000, 1_000_000], value=100_000,
+                                key="sentiment_size")
+    with col2:
+        workers = st.select_slider("Worker processes", sorted({n for n in (1, 2, 4, PROCESSES) if n <= PROCESSES}),
+                                   value=PROCESSES, key="sentiment_workers")
+    upload = st.file_uploader("Or upload a CSV with a `text` column (optional `date`, `brand`)", type="csv",
+                              key="sentiment_upload")
+    if not st.button("▶️ Analyze", key="sentiment_run"):
+        return
+
+    try:
+        records = from_csv(upload) if upload is not None else synthetic(size)
+    except (ValueError, pd.errors.ParserError) as exc:
+        st.error(f"Could not read the file: {exc}")
+        return
+
+    trends = Trends()
+    metrics_slot, chart_slot = st.empty(), st.empty()
+    start = last_draw = time.perf_counter()
+    try:
+        for chunk, scores in score_stream(chunked(records), workers):
+            trends.update(chunk, scores)
+            now = time.perf_counter()
+            if now - last_draw > 0.5:
+                last_draw = now
+                metrics_slot.caption(f"{trends.documents:,} posts scored, {trends.documents / (now - start):,.0f}/s")
+                chart_slot.line_chart(trends.rolling())
+    except (ValueError, pd.errors.ParserError) as exc:
+        # A later block of the upload is malformed
+        metrics_slot.empty()
+        st.error(f"Could not read the file after {trends.documents:,} posts: {exc}")
+        return
+    elapsed = time.perf_counter() - start
+
+    metrics_slot.empty()
+    chart_slot.line_chart(trends.rolling())
+    negative, neutral, positive = trends.labels.tolist()
+    col1, col2, col3, col4 = st.columns(4)
+    with col1:
+        st.metric("Posts", f"{trends.documents:,}")
+    with col2:
+        st.metric("Posts / sec", f"{trends.documents / elapsed:,.0f}")
+    with col3:
+        st.metric("Positive", f"{positive / max(trends.documents, 1):.0%}")
+    with col4:
+        st.metric("Negative", f"{negative / max(trends.documents, 1):.0%}")
+    st.caption(f"7-day rolling mean sentiment per brand · {workers} worker process(es) · {neutral:,} neutral posts")
@@ -0,0 +1,273 @@
+"""Static HTML export of every sidebar page.
+
+Each page is rendered through Streamlit's AppTest harness, i.e. by the same
+code the live app runs, and its element tree is converted to plain HTML with
+the app's CSS and the Plotly figure JSON embedded. The result is a directory
+any static file server can host. Interactive parts (the contact form and the
+Contact page buttons) link to the live app instead, link buttons keep their
+URL, and the CV download button links to a copy of the CV written next to
+the pages.
+
+    python -m portfolio.export --out dist --live-url https://example.com
+    python -m portfolio.export --out dist --check   # verify against the live render
+
+Every exported page records a digest of the element tree it was built from;
+``--check`` re-renders the app and reports pages whose digest or HTML differs.
+"""
+import argparse
+import hashlib
+import html
+import json
+import logging
+import os
+import shutil
+import sys
+from pathlib import Path
+
+from portfolio.pages import PAGES
+
+ROOT = Path(__file__).resolve().parent.parent
+APP_SCRIPT = ROOT / "app1.py"
+
+DIGEST_META = "portfolio-render-digest"
+
+# Minimal stand-ins for the Streamlit layout primitives the pages use
+BASE_CSS = """
+body { margin: 0; font-family: "Source Sans Pro", sans-serif; color: #2c3e50; display: flex; }
+nav.sidebar { width: 16rem; min-height: 100vh; padding: 2rem 1rem; background: #f8f9fa; box-sizing: border-box; }
+nav.sidebar a { display: block; padding: 0.3rem 0; color: #2c3e50; text-decoration: none; }
+nav.sidebar a.active { font-weight: 700; color: #1f77b4; }
+main { flex: 1; max-width: 73rem; margin: 0 auto; padding: 3rem 4rem; }
+.st-row { display: flex; gap: 1rem; flex-wrap: wrap; }
+.st-column { min-width: 0; }
+details.st-expander { border: 1px solid #e9ecef; border-radius: 0.5rem; padding: 0.5rem 1rem; margin: 0.5rem 0; }
+details.st-expander > summary { cursor: pointer; font-weight: 600; }
+.st-alert { padding: 0.75rem 1rem; border-radius: 0.5rem; margin: 0.5rem 0; }
+.st-alert.success { background: #d4edda; } .st-alert.info { background: #d1ecf1; }
+.st-alert.warning { background: #fff3cd; } .st-alert.error { background: #f8d7da; }
+.st-caption { font-size: 0.875rem; color: #6c757d; }
+.st-metric { margin: 0.5rem 0; } .st-metric .label { font-size: 0.9rem; } .st-metric .value { font-size: 2rem; }
+.st-live { display: inline-block; margin: 0.3rem 0; padding: 0.4rem 0.9rem; border: 1px solid #1f77b4;
+           border-radius: 0.5rem; color: #1f77b4; text-decoration: none; }
+"""
+
+PLOTLY_BOOTSTRAP = """
+document.querySelectorAll("script.plotly-spec").forEach(function (spec) {
+  var fig = JSON.parse(spec.textContent);
+  var target = document.getElementById(spec.dataset.target);
+  Plotly.newPlot(target, fig.data, fig.layout, {responsive: true, displaylogo: false});
+});
+"""
+
+
+def page_filename(page):
+    slug = PAGES[page]
+    return "index.html" if slug == "home" else f"{slug}.html"
+
+
+def render_trees(script=APP_SCRIPT):
+    """Run the app once per sidebar page and yield ``(page, main_block)``."""
+    from streamlit.testing.v1 import AppTest
+
+    at = AppTest.from_file(str(script), default_timeout=120)
+    at.run()
+    for page in PAGES:
+        at.sidebar.radio[0].set_value(page)
+        at.run()
+        if at.exception:
+            raise RuntimeError(f"{page} raised: {at.exception[0].message}")
+        yield page, at.main
+
+
+class PageWriter:
+    """Converts one page's element tree to HTML and a content digest."""
+
+    def __init__(self, page, live_url):
+        self.page = page
+        self.live_url = live_url
+        self.charts = 0
+        self._digest = hashlib.sha256()
+
+    def _record(self, kind, *values):
+        self._digest.update(json.dumps([kind, *values], ensure_ascii=False).encode("utf-8"))
+
+    def _live_link(self, label):
+        href = f"{self.live_url}?page={PAGES[self.page]}"
+        return f'<a class="st-live" href="{html.escape(href)}">{html.escape(label)}</a>'
+
+    def node(self, node):
+        import markdown
+
+        kind = node.type
+        if kind == "markdown":
+            self._record(kind, node.value)
+            return markdown.markdown(node.value, extensions=["extra", "sane_lists"])
+        if kind == "caption":
+            self._record(kind, node.value)
+            return f'<div class="st-caption">{markdown.markdown(node.value, extensions=["extra"])}</div>'
+        if kind == "title":
+            self._record(kind, node.value)
+            return f"<h1>{html.escape(node.value)}</h1>"
+        if kind == "plotly_chart":
+            spec = node.proto.spec
+            self._record(kind, spec)
+            self.charts += 1
+            target = f"chart-{self.charts}"
+            # "</" must not appear inside a <script> element
+            payload = spec.replace("</", "<\\/")
+            return (f'<div class="st-chart" id="{target}"></div>'
+                    f'<script type="application/json" class="plotly-spec" data-target="{target}">'
+                    f'{payload}</script>')
+        if kind in ("image", "imgs"):  # chart snapshots; "imgs" before AppTest had an Image element
+            urls = [img.url for img in node.proto.imgs]
+            self._record("image", *urls)
+            return "".join(f'<img class="chart-snapshot" src="{html.escape(url)}" alt="">' for url in urls)
+        if kind == "toggle":
+            # Interactive-chart switches need the live app; the snapshot stands in
+            return ""
+        if kind in ("success", "info", "warning", "error"):
+            self._record(kind, node.value)
+            body = markdown.markdown(node.value, extensions=["extra"])
+            return f'<div class="st-alert {kind}">{body}</div>'
+        if kind == "metric":
+            self._record(kind, node.label, node.value)
+            return (f'<div class="st-metric"><div class="label">{html.escape(node.label)}</div>'
+                    f'<div class="value">{html.escape(str(node.value))}</div></div>')
+        if kind == "form":
+            self._record(kind, node.proto.form.form_id)
+            return self._live_link("📝 Send me a message on the live site")
+        if kind == "button":
+            self._record(kind, node.label)
+            return self._live_link(node.label)
+        if kind == "link_button":
+            self._record(kind, node.proto.label, node.proto.url)
+            return f'<a class="st-live" href="{html.escape(node.proto.url)}">{html.escape(node.proto.label)}</a>'
+        if kind == "download_button":
+            from portfolio import cv
+            from portfolio.content import get_content
+
+            self._record(kind, node.label)
+            href = html.escape(cv.filename(get_content()))
+            return f'<a class="st-live" href="{href}" download>{html.escape(node.label)}</a>'
+        if kind == "radio":
+            # Demo picker: the demos run on the live site only
+            self._record(kind, node.label, *node.options)
+            return self._live_link(f"▶️ {node.label} on the live site")
+        if kind == "column":
+            self._record(kind, node.weight)
+            return f'<div class="st-column" style="flex: {node.weight:.4f}">{self.children(node)}</div>'
+        if kind == "expander":
+            self._record(kind, node.label)
+            return (f'<details class="st-expander" open><summary>{html.escape(node.label)}</summary>'
+                    f'{self.children(node)}</details>')
+
+        children = list(node.children.values())
+        if children and all(child.type == "column" for child in children):
+            self._record("row")
+            return f'<div class="st-row">{self.children(node)}</div>'
+        if children:
+            self._record("block")
+            return f"<div>{self.children(node)}</div>"
+
+        logging.getLogger(__name__).warning("%s: %s elements are not exported", self.page, kind)
+        return ""
+
+    def children(self, node):
+        return "".join(self.node(child) for child in node.children.values())
+
+    def document(self, main):
+        body = self.children(main)
+        digest = self._digest.hexdigest()
+        nav = "".join(
+            f'<a href="{page_filename(page)}"{" class=active" if page == self.page else ""}>{html.escape(page)}</a>'
+            for page in PAGES
+        )
+        script = f'<script src="plotly.min.js"></script><script>{PLOTLY_BOOTSTRAP}</script>' if self.charts else ""
+        return (
+            "<!DOCTYPE html>\n"
+            '<html lang="en"><head><meta charset="utf-8">'
+            '<meta name="viewport" content="width=device-width, initial-scale=1">'
+            f'<meta name="{DIGEST_META}" content="{digest}">'
+            f"<title>Arka Sain - Data Analyst Portfolio | {html.escape(self.page)}</title>"
+            f"<style>{BASE_CSS}</style></head>"
+            f'<body><nav class="sidebar"><h1>🧭 Navigation</h1>{nav}</nav>'
+            f"<main>{body}</main>{script}</body></html>\n"
+        ), digest
+
+
+def build(live_url, script=APP_SCRIPT):
+    """Return ``{filename: (html, digest)}`` for every page."""
+    from portfolio import cv
+    from portfolio.content import get_content
+
+    # The About page shows the download button only once the CV is built
+    cv.builder().build(get_content()).result()
+    pages = {}
+    for page, main in render_trees(script):
+        pages[page_filename(page)] = PageWriter(page, live_url).document(main)
+    return pages
+
+
+def export(out_dir, live_url):
+    import plotly
+
+    from portfolio import cv
+    from portfolio.content import get_content
+
+    out = Path(out_dir)
+    out.mkdir(parents=True, exist_ok=True)
+    pages = build(live_url)
+    for filename, (document, _) in pages.items():
+        (out / filename).write_text(document, encoding="utf-8")
+    content = get_content()
+    (out / cv.filename(content)).write_bytes(cv.builder().build(content).result())
+    shutil.copyfile(Path(plotly.__file__).parent / "package_data" / "plotly.min.js", out / "plotly.min.js")
+    return pages
+
+
+def read_digest(document):
+    marker = f'<meta name="{DIGEST_META}" content="'
+    start = document.find(marker)
+    if start < 0:
+        return None
+    start += len(marker)
+    return document[start:document.index('"', start)]
+
+
+def check(out_dir, live_url):
+    """Compare an exported bundle with a fresh render; return the stale files."""
+    out = Path(out_dir)
+    stale = []
+    for filename, (document, digest) in build(live_url).items():
+        path = out / filename
+        exported = path.read_text(encoding="utf-8") if path.exists() else ""
+        if read_digest(exported) != digest:
+            stale.append((filename, "content differs from the live app"))
+        elif exported != document:
+            stale.append((filename, "HTML was modified after export"))
+    return stale
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--out", default="dist", help="output directory (default: dist)")
+    parser.add_argument("--live-url", default=os.environ.get("PORTFOLIO_LIVE_URL", "http://localhost:8501/"),
+                        help="URL of the running Streamlit app, used for interactive parts")
+    parser.add_argument("--check", action="store_true", help="verify an existing export instead of writing one")
+    args = parser.parse_args(argv)
+
+    if args.check:
+        stale = check(args.out, args.live_url)
+        for filename, reason in stale:
+            print(f"{filename}: {reason}")
+        print(f"{len(PAGES) - len(stale)}/{len(PAGES)} pages match the live app")
+        return 1 if stale else 0
+
+    pages = export(args.out, args.live_url)
+    for filename, (document, _) in pages.items():
+        print(f"{filename:<22}{len(document.encode('utf-8')):>10,} bytes")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
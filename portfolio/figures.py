@@ -0,0 +1,290 @@
+"""Plotly figure factories shared by every session.
+
+Streamlit re-runs app1.py on every widget interaction, so each chart used to be
+rebuilt for every visitor on every rerun. The factories below key the built
+figure (and its serialized JSON) by a hash of the input data and layout, and
+keep them in one process-wide, size-bounded cache. Behind it, the figure JSON
+goes into the shared render cache (portfolio.render_cache), so other
+processes and restarts read it back instead of building the figure; the
+Plotly figure object is then only rebuilt from the JSON when a chart is
+drawn interactively or its snapshot is rendered. pandas and Plotly Express
+are imported by the first figure actually built.
+"""
+import base64
+import functools
+import hashlib
+import importlib.metadata
+import json
+import threading
+from collections import OrderedDict
+from collections.abc import Mapping
+from pathlib import Path
+
+from portfolio import metrics, render_cache
+
+# Figures in the shared cache are only valid for this module and Plotly version
+CODE_VERSION = hashlib.sha1(
+    Path(__file__).read_bytes() + importlib.metadata.version("plotly").encode()).hexdigest()[:12]
+
+
+def _typed_array(obj):
+    # Plotly writes NumPy arrays as {"dtype", "bdata"[, "shape"]}; read them
+    # back as arrays, which svgchart can iterate and Plotly re-encodes as sent
+    if "bdata" not in obj or "dtype" not in obj:
+        return obj
+    import numpy as np
+
+    array = np.frombuffer(base64.b64decode(obj["bdata"]), dtype=obj["dtype"])
+    if "shape" in obj:
+        array = array.reshape([int(n) for n in str(obj["shape"]).split(",")])
+    return array
+
+
+class CachedFigure:
+    """key: hash of factory name + data + layout, json: what st.plotly_chart sends."""
+
+    __slots__ = ("key", "json", "_figure", "_title")
+
+    def __init__(self, key, json_text, figure=None):
+        self.key = key
+        self.json = json_text
+        self._figure = figure
+        self._title = None
+
+    @property
+    def figure(self):
+        if self._figure is None:
+            import plotly.graph_objects as go
+
+            self._figure = go.Figure(json.loads(self.json, object_hook=_typed_array), skip_invalid=True)
+        return self._figure
+
+    @property
+    def title(self):
+        if self._title is None:
+            title = json.loads(self.json).get("layout", {}).get("title", {})
+            self._title = title.get("text", "") if isinstance(title, dict) else str(title)
+        return self._title
+
+
+class FigureCache:
+    """Thread-safe LRU of built figures with hit/miss counters, over an optional shared ``store``."""
+
+    def __init__(self, max_entries=64, store=None):
+        self.max_entries = max_entries
+        self.store = store
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.shared_hits = 0
+        self.evictions = 0
+
+    def get_or_build(self, key, build):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry
+            self.misses += 1
+
+        # Build outside the lock so one slow figure doesn't stall other sessions
+        stored = self.store.get("figure", f"{CODE_VERSION}:{key}") if self.store is not None else None
+        if stored is not None:
+            entry = CachedFigure(key, stored)
+            with self._lock:
+                self.shared_hits += 1
+        else:
+            import plotly.io as pio
+
+            figure = build()
+            entry = CachedFigure(key, pio.to_json(figure, validate=False), figure)
+            if self.store is not None:
+                self.store.put("figure", f"{CODE_VERSION}:{key}", entry.json)
+
+        with self._lock:
+            entry = self._entries.setdefault(key, entry)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+        return entry
+
+    def stats(self):
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "shared_hits": self.shared_hits,
+                "evictions": self.evictions,
+                "size": len(self._entries),
+                "max_entries": self.max_entries,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+            }
+
+    def entries(self):
+        with self._lock:
+            return list(self._entries.values())
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = self.shared_hits = self.evictions = 0
+
+
+figure_cache = FigureCache(store=render_cache.shared())
+
+
+def _cache_metrics():
+    stats = figure_cache.stats()
+    return [
+        "# HELP portfolio_figure_cache_lookups_total Figure cache lookups by result.",
+        "# TYPE portfolio_figure_cache_lookups_total counter",
+        f'portfolio_figure_cache_lookups_total{{result="hit"}} {stats["hits"]}',
+        f'portfolio_figure_cache_lookups_total{{result="miss"}} {stats["misses"]}',
+        "# HELP portfolio_figure_builds_total Figures built (misses not found in the shared render cache).",
+        "# TYPE portfolio_figure_builds_total counter",
+        f"portfolio_figure_builds_total {stats['misses'] - stats['shared_hits']}",
+        "# HELP portfolio_figure_cache_entries Figures currently cached.",
+        "# TYPE portfolio_figure_cache_entries gauge",
+        f"portfolio_figure_cache_entries {stats['size']}",
+    ]
+
+
+metrics.COLLECTORS.append(_cache_metrics)
+
+
+# Chart data may arrive as read-only mappings (see portfolio.content)
+def _jsonable(value):
+    if isinstance(value, Mapping):
+        return dict(value)
+    return str(value)
+
+
+def figure_key(name, data, layout):
+    payload = json.dumps([name, data, layout], sort_keys=True, separators=(",", ":"), default=_jsonable)
+    return hashlib.sha1(payload.encode("utf-8")).hexdigest()
+
+
+def cached_figure(build):
+    """Decorator turning ``build(data, **layout)`` into a cached factory."""
+
+    @functools.wraps(build)
+    def factory(data, **layout):
+        with metrics.block(f"figure.{build.__name__}"):
+            key = figure_key(build.__name__, data, layout)
+            return figure_cache.get_or_build(key, lambda: build(data, **layout))
+
+    return factory
+
+
+# Horizontal bar coloured by its value axis (skills proficiency, project impact)
+@cached_figure
+def horizontal_bar(data, x, y, title, color_scale, height):
+    import pandas as pd
+    import plotly.express as px
+
+    fig = px.bar(
+        pd.DataFrame(dict(data)),
+        x=x,
+        y=y,
+        orientation='h',
+        title=title,
+        color=x,
+        color_continuous_scale=color_scale
+    )
+    fig.update_layout(height=height)
+    return fig
+
+
+# Filled radar chart over a single series
+@cached_figure
+def radar(data, name, title, color):
+    import plotly.graph_objects as go
+
+    fig = go.Figure()
+    fig.add_trace(go.Scatterpolar(
+        r=data['values'],
+        theta=data['categories'],
+        fill='toself',
+        name=name,
+        line=dict(color=color)
+    ))
+    fig.update_layout(
+        polar=dict(
+            radialaxis=dict(
+                visible=True,
+                range=[0, 100]
+            )),
+        showlegend=True,
+        title=title
+    )
+    return fig
+
+
+# Line with markers, e.g. the career timeline
+@cached_figure
+def timeline(data, x, y, title, height):
+    import pandas as pd
+    import plotly.express as px
+
+    fig = px.line(pd.DataFrame(dict(data)), x=x, y=y, title=title, markers=True)
+    fig.update_layout(height=height)
+    return fig
+
+
+@cached_figure
+def pie(data, values, names, title, colors):
+    import pandas as pd
+    import plotly.express as px
+
+    return px.pie(pd.DataFrame(dict(data)), values=values, names=names, title=title,
+                  color_discrete_sequence=list(colors))
+
+
+# Scatter sized and coloured by the same column (certification journey)
+@cached_figure
+def bubble_scatter(data, x, y, size, title, color_scale, height):
+    import pandas as pd
+    import plotly.express as px
+
+    fig = px.scatter(pd.DataFrame(dict(data)), x=x, y=y, size=size, title=title, color=size,
+                     color_continuous_scale=color_scale)
+    fig.update_layout(height=height)
+    return fig
+
+
+# Density grid, data = {"z": rows of values, "x": column centres, "y": row centres}
+@cached_figure
+def heatmap(data, title, color_scale, height, z_range=None):
+    import plotly.graph_objects as go
+
+    zmin, zmax = z_range or (None, None)
+    fig = go.Figure(go.Heatmap(z=data["z"], x=data["x"], y=data["y"], colorscale=color_scale, zmin=zmin, zmax=zmax))
+    fig.update_layout(height=height, title=title)
+    return fig
+
+
+# Line or markers over many points, drawn with WebGL if asked to
+@cached_figure
+def series(data, x, y, title, mode, webgl, height):
+    import plotly.graph_objects as go
+
+    trace = go.Scattergl if webgl else go.Scatter
+    fig = go.Figure(trace(x=data[x], y=data[y], mode=mode, marker=dict(size=4, opacity=0.6)))
+    fig.update_layout(height=height, title=title, xaxis_title=x, yaxis_title=y)
+    return fig
+
+
+# Pre-binned histogram, data = {"edges": bin edges, "counts": rows per bin}
+@cached_figure
+def histogram(data, title, x_title, color, height):
+    import plotly.graph_objects as go
+
+    edges = data["edges"]
+    fig = go.Figure(go.Bar(x=[(a + b) / 2 for a, b in zip(edges, edges[1:])], y=data["counts"],
+                           width=[b - a for a, b in zip(edges, edges[1:])], marker_color=color))
+    fig.update_layout(height=height, title=title, xaxis_title=x_title, yaxis_title="Rows", bargap=0)
+    return fig
@@ -0,0 +1,261 @@
+"""Live GitHub profile stats for the Contact page, never fetched on a script thread.
+
+``stats()`` is the process-wide ``StatsCache`` for the configured account.
+``StatsCache.get()`` only reads memory and returns at once:
+
+* fresh (younger than ``ttl``): served as is;
+* stale (up to ``stale_ttl`` more): served, and a refresh is started;
+* missing or older: nothing to show, and a refresh is started.
+
+Refreshes run on one asyncio event loop in a background thread, and at most
+one is in flight per process, so a burst of visitors triggers a single
+fetch. A failed refresh keeps the last value and is not retried for
+``retry_after`` seconds. The last good value is saved to
+``<data dir>/github/<user>.json`` and served (as stale) after a restart.
+
+Requests are made with ``urllib.request`` in the event loop's default
+executor, so redirects, HTTPS and the ``https_proxy``/``no_proxy``
+environment are handled by the standard library; bodies over ``MAX_BODY``
+are rejected. Two API calls are made: ``/users/<user>`` and its public
+repositories.
+Configured in the ``[portfolio.github]`` section of config.toml;
+``PORTFOLIO_GITHUB_USER`` and ``PORTFOLIO_GITHUB_API`` override the account
+and the API URL, and ``GITHUB_TOKEN`` raises the rate limit.
+"""
+import asyncio
+import collections
+import json
+import logging
+import http.client
+import os
+import threading
+import time
+import urllib.error
+import urllib.parse
+import urllib.request
+from dataclasses import asdict, dataclass
+
+from portfolio import metrics, settings
+from portfolio.content import get_content
+
+_LOGGER = logging.getLogger(__name__)
+
+DEFAULT_API = "https://api.github.com"
+GITHUB_DIR = settings.DATA_DIR / "github"
+MAX_BODY = 8 * 2 ** 20
+# Public repositories counted at most (100 per page)
+MAX_PAGES = 10
+
+fetches = metrics.Counter("portfolio_github_fetches_total", "GitHub stats refreshes by result.", ["result"])
+lookups = metrics.Counter("portfolio_github_lookups_total", "GitHub stats cache lookups by state.", ["state"])
+metrics.METRICS.extend([fetches, lookups])
+
+
+class FetchError(Exception):
+    pass
+
+
+@dataclass(frozen=True, slots=True)
+class GitHubStats:
+    user: str
+    url: str
+    repos: int
+    stars: int
+    forks: int
+    followers: int
+    languages: tuple  # (language, repositories), most used first
+    fetched_at: float  # time.time()
+
+
+@dataclass(frozen=True, slots=True)
+class Snapshot:
+    value: GitHubStats | None
+    state: str  # "fresh", "stale" or "missing"
+    error: str | None  # last refresh failure, None after a success
+
+    @property
+    def age(self):
+        return time.time() - self.value.fetched_at if self.value else None
+
+
+def _get(url, token, timeout):
+    request = urllib.request.Request(url, headers={"User-Agent": "portfolio-github-stats",
+                                                   "Accept": "application/vnd.github+json"})
+    if token:
+        # Not forwarded if a redirect leads elsewhere
+        request.add_unredirected_header("Authorization", f"Bearer {token}")
+    with urllib.request.urlopen(request, timeout=timeout) as response:
+        status = response.status
+        body = response.read(MAX_BODY + 1)
+    if len(body) > MAX_BODY:
+        raise ValueError("response too large")
+    return status, body
+
+
+async def get_json(url, token=None, timeout=5.0):
+    """GET ``url`` and decode its JSON body; FetchError on anything but a 200 within ``timeout``."""
+    loop = asyncio.get_running_loop()
+    try:
+        status, body = await asyncio.wait_for(loop.run_in_executor(None, _get, url, token, timeout), timeout)
+    except urllib.error.HTTPError as exc:
+        raise FetchError(f"{url}: HTTP {exc.code}") from None
+    except (OSError, asyncio.TimeoutError, http.client.HTTPException, ValueError) as exc:
+        raise FetchError(f"{url}: {type(exc).__name__} {exc}".strip()) from None
+    if status != 200:
+        raise FetchError(f"{url}: HTTP {status}")
+    try:
+        return json.loads(body)
+    except ValueError:
+        raise FetchError(f"{url}: invalid JSON") from None
+
+
+async def fetch_stats(api_url, user, token=None, timeout=5.0):
+    """Profile and repository totals of ``user``: two requests in parallel, more for over 100 repos."""
+    base = f"{api_url.rstrip('/')}/users/{urllib.parse.quote(user)}"
+
+    def page(number):
+        return get_json(f"{base}/repos?per_page=100&type=owner&page={number}", token, timeout)
+
+    profile, repos = await asyncio.gather(get_json(base, token, timeout), page(1))
+    number = 1
+    while len(repos) == 100 * number and number < MAX_PAGES:
+        number += 1
+        repos += await page(number)
+    languages = collections.Counter(repo["language"] for repo in repos if repo.get("language"))
+    return GitHubStats(
+        user=profile.get("login", user),
+        url=profile.get("html_url", f"https://github.com/{user}"),
+        repos=int(profile.get("public_repos", len(repos))),
+        stars=sum(int(repo.get("stargazers_count", 0)) for repo in repos),
+        forks=sum(int(repo.get("forks_count", 0)) for repo in repos),
+        followers=int(profile.get("followers", 0)),
+        languages=tuple(languages.most_common(3)),
+        fetched_at=time.time(),
+    )
+
+
+_loop = None
+_loop_lock = threading.Lock()
+
+
+def _event_loop():
+    """The process-wide event loop that runs refreshes, started on first use."""
+    global _loop
+    if _loop is None:
+        with _loop_lock:
+            if _loop is None:
+                loop = asyncio.new_event_loop()
+                threading.Thread(target=loop.run_forever, name="github-stats", daemon=True).start()
+                _loop = loop
+    return _loop
+
+
+class StatsCache:
+    """Last value of ``fetch()`` (a coroutine function) with TTL, stale-while-revalidate and single flight."""
+
+    def __init__(self, fetch, ttl=600.0, stale_ttl=86400.0, retry_after=60.0, path=None):
+        self.fetch = fetch
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self.retry_after = retry_after
+        self.path = path
+        self._lock = threading.Lock()
+        self._value = self._read()
+        self._error = None
+        self._failed_at = None
+        self._inflight = None  # concurrent.futures.Future of the running refresh
+
+    def _read(self):
+        try:
+            raw = json.loads(self.path.read_text(encoding="utf-8"))
+            return GitHubStats(**{**raw, "languages": tuple(map(tuple, raw["languages"]))})
+        except (AttributeError, OSError, ValueError, TypeError, KeyError):
+            return None
+
+    def _save(self, value):
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_name(f".{self.path.name}.{os.getpid()}.tmp")
+        tmp.write_text(json.dumps(asdict(value)), encoding="utf-8")
+        tmp.replace(self.path)
+
+    def get(self):
+        """Snapshot of the cached value; starts a refresh when it is not fresh. Never blocks."""
+        with self._lock:
+            value, error = self._value, self._error
+        age = time.time() - value.fetched_at if value else None
+        if age is not None and age < self.ttl:
+            state = "fresh"
+        else:
+            state = "stale" if age is not None and age < self.ttl + self.stale_ttl else "missing"
+            self.refresh()
+        lookups.inc(state)
+        return Snapshot(value if state != "missing" else None, state, error)
+
+    def refresh(self, force=False):
+        """Future of the running refresh, starting one unless a failure is still within ``retry_after``."""
+        with self._lock:
+            if self._inflight is not None:
+                return self._inflight
+            if not force and self._failed_at is not None and time.monotonic() - self._failed_at < self.retry_after:
+                return None
+            self._inflight = asyncio.run_coroutine_threadsafe(self._refresh(), _event_loop())
+            return self._inflight
+
+    async def _refresh(self):
+        try:
+            value = await self.fetch()
+        except Exception as exc:
+            fetches.inc("error")
+            _LOGGER.warning("GitHub stats refresh failed: %s", exc)
+            with self._lock:
+                self._error, self._failed_at, self._inflight = str(exc), time.monotonic(), None
+            return None
+        fetches.inc("ok")
+        with self._lock:
+            self._value, self._error, self._failed_at, self._inflight = value, None, None, None
+        if self.path is not None:
+            try:
+                self._save(value)
+            except OSError as exc:
+                _LOGGER.warning("GitHub stats not saved: %s", exc)
+        return value
+
+
+def config():
+    return settings.portfolio_config().get("github", {})
+
+
+def user():
+    """Configured account: PORTFOLIO_GITHUB_USER, ``[portfolio.github] user``, else the About page's GitHub URL."""
+    name = os.environ.get("PORTFOLIO_GITHUB_USER") or config().get("user", "")
+    if not name:
+        name = urllib.parse.urlsplit(get_content().about.github).path.strip("/").split("/")[0]
+    return name
+
+
+_caches = {}
+_caches_lock = threading.Lock()
+
+
+def stats():
+    """The process-wide StatsCache for ``user()``, or None when no account is configured."""
+    name = user()
+    if not name:
+        return None
+    cache = _caches.get(name)
+    if cache is None:
+        with _caches_lock:
+            cache = _caches.get(name)
+            if cache is None:
+                cfg = config()
+                api_url = os.environ.get("PORTFOLIO_GITHUB_API") or cfg.get("api_url", DEFAULT_API)
+                token = os.environ.get("GITHUB_TOKEN") or None
+                timeout = float(cfg.get("timeout", 5.0))
+                cache = _caches[name] = StatsCache(
+                    lambda: fetch_stats(api_url, name, token, timeout),
+                    ttl=float(cfg.get("ttl", 600)),
+                    stale_ttl=float(cfg.get("stale_ttl", 86400)),
+                    retry_after=float(cfg.get("retry_after", 60)),
+                    path=GITHUB_DIR / f"{name}.json",
+                )
+    return cache
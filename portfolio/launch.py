@@ -0,0 +1,190 @@
+"""Run several app workers behind the session-affine proxy.
+
+    python -m portfolio.launch [--workers N] [--port P] [streamlit run options]
+
+Starts N ``python -m portfolio.serve`` processes on 127.0.0.1 (each with its
+own interpreter, GIL and boot warm-up) and portfolio.proxy on the public
+port. Options the launcher does not know are passed to every worker.
+
+* SIGHUP: rolling restart. Each worker's replacement is started on the
+  slot's other port; once it passes its health check the old worker is
+  drained (no new sessions, up to ``drain_timeout`` seconds for open ones)
+  and stopped, so there is always a live worker.
+* SIGTERM / SIGINT: stop accepting, drain every worker, stop them and exit.
+* A worker that exits unexpectedly is restarted.
+
+Each worker process logs page views to its own
+``<data dir>/analytics/w<slot>g<generation>`` directory; the admin dashboard
+adds up all of them. Configured in the
+``[portfolio.cluster]`` section of config.toml.
+"""
+import argparse
+import asyncio
+import logging
+import os
+import signal
+import sys
+
+from portfolio import proxy, settings
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class Worker:
+    """One ``portfolio.serve`` process and the proxy backend pointing at it."""
+
+    def __init__(self, slot, generation, port, metrics_port, args):
+        self.slot = slot
+        self.generation = generation
+        self.backend = proxy.Backend(f"w{slot}g{generation}", port,
+                                     ready_port=metrics_port or None)
+        self.metrics_port = metrics_port
+        self.args = args
+        self.process = None
+        self.stopping = False
+
+    async def start(self):
+        # The id includes the generation: during a rolling restart the old and
+        # new worker of a slot run side by side and must not share log files
+        env = dict(os.environ, PORTFOLIO_WORKER=self.backend.name,
+                   PORTFOLIO_METRICS_PORT=str(self.metrics_port))
+        self.process = await asyncio.create_subprocess_exec(
+            sys.executable, "-m", "portfolio.serve", "--server.port", str(self.backend.port),
+            "--server.address", "127.0.0.1", "--server.headless", "true", *self.args,
+            cwd=settings.ROOT, env=env,
+        )
+
+    async def stop(self, timeout=10.0):
+        self.stopping = True
+        if self.process is None or self.process.returncode is not None:
+            return
+        self.process.terminate()
+        try:
+            await asyncio.wait_for(self.process.wait(), timeout)
+        except asyncio.TimeoutError:
+            self.process.kill()
+            await self.process.wait()
+
+
+class Launcher:
+    def __init__(self, workers, port, host="0.0.0.0", base_port=8600, metrics_port=0, health_interval=2.0,
+                 drain_timeout=30.0, start_timeout=120.0, worker_args=()):
+        self.count = workers
+        self.port = port
+        self.host = host
+        self.base_port = base_port
+        self.metrics_port = metrics_port
+        self.drain_timeout = drain_timeout
+        self.start_timeout = start_timeout
+        self.worker_args = list(worker_args)
+        self.proxy = proxy.Proxy(health_interval)
+        self.workers = {}  # slot -> Worker
+        self._restarting = False
+        self._stopped = asyncio.Event()
+
+    def _ports(self, slot, generation):
+        # Two ports per slot, so a replacement can start before the old worker stops
+        offset = 2 * slot + generation % 2
+        return self.base_port + offset, (self.metrics_port + 1 + offset if self.metrics_port else 0)
+
+    async def _spawn(self, slot, generation):
+        worker = Worker(slot, generation, *self._ports(slot, generation), self.worker_args)
+        await worker.start()
+        self.proxy.add(worker.backend)
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.start_timeout
+        while not await self.proxy.check(worker.backend):
+            if worker.process.returncode is not None or loop.time() > deadline:
+                _LOGGER.error("worker %s did not become ready", worker.backend.name)
+                break
+            await asyncio.sleep(0.2)
+        return worker
+
+    async def _retire(self, worker):
+        if not await self.proxy.drain(worker.backend, self.drain_timeout):
+            _LOGGER.warning("worker %s still had %d sessions after %.0f s", worker.backend.name,
+                            worker.backend.sessions, self.drain_timeout)
+        await worker.stop()
+        self.proxy.remove(worker.backend)
+
+    async def replace(self, slot):
+        old = self.workers.get(slot)
+        new = await self._spawn(slot, old.generation + 1 if old else 0)
+        self.workers[slot] = new
+        if old is not None:
+            await self._retire(old)
+
+    async def rolling_restart(self):
+        if self._restarting:
+            return
+        self._restarting = True
+        try:
+            for slot in sorted(self.workers):
+                await self.replace(slot)
+            _LOGGER.info("rolling restart finished")
+        finally:
+            self._restarting = False
+
+    async def supervise(self):
+        while not self._stopped.is_set():
+            await asyncio.sleep(1.0)
+            for slot, worker in list(self.workers.items()):
+                if not worker.stopping and worker.process.returncode is not None and not self._restarting:
+                    _LOGGER.warning("worker %s exited with %s; restarting", worker.backend.name,
+                                    worker.process.returncode)
+                    worker.stopping = True
+                    self.proxy.remove(worker.backend)
+                    await self.replace(slot)
+
+    async def shutdown(self):
+        self.proxy.close()
+        await asyncio.gather(*(self._retire(worker) for worker in self.workers.values()))
+        self._stopped.set()
+
+    async def run(self):
+        loop = asyncio.get_running_loop()
+        loop.add_signal_handler(signal.SIGHUP, lambda: asyncio.ensure_future(self.rolling_restart()))
+        for sig in (signal.SIGTERM, signal.SIGINT):
+            loop.add_signal_handler(sig, lambda: asyncio.ensure_future(self.shutdown()))
+
+        await asyncio.gather(*(self.replace(slot) for slot in range(self.count)))
+        await self.proxy.start(self.host, self.port)
+        _LOGGER.info("proxy on %s:%s in front of %d workers", self.host, self.port, self.count)
+        tasks = [asyncio.ensure_future(self.proxy.health_loop()), asyncio.ensure_future(self.supervise())]
+        await self._stopped.wait()
+        for task in tasks:
+            task.cancel()
+
+
+def main(argv=None):
+    config = settings.portfolio_config().get("cluster", {})
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--workers", type=int,
+                        default=int(os.environ.get("PORTFOLIO_WORKERS", config.get("workers", 2))),
+                        help="app worker processes (0: one per CPU core)")
+    parser.add_argument("--port", type=int, default=int(os.environ.get("PORT", config.get("port", 8501))),
+                        help="public port of the proxy (default: $PORT, then config)")
+    parser.add_argument("--host", default=config.get("host", "0.0.0.0"))
+    parser.add_argument("--base-port", type=int, default=int(config.get("base_port", 8600)),
+                        help="first worker port; a slot uses two (default: config)")
+    args, worker_args = parser.parse_known_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(name)s %(message)s")
+    metrics_config = settings.portfolio_config().get("metrics", {})
+    metrics_port = int(os.environ.get("PORTFOLIO_METRICS_PORT", metrics_config.get("port", 0)))
+    launcher = Launcher(
+        args.workers or os.cpu_count() or 1,
+        args.port,
+        host=args.host,
+        base_port=args.base_port,
+        metrics_port=metrics_port if metrics_config.get("enabled", False) else 0,
+        health_interval=float(config.get("health_interval", 2.0)),
+        drain_timeout=float(config.get("drain_timeout", 30.0)),
+        worker_args=worker_args,
+    )
+    asyncio.run(launcher.run())
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
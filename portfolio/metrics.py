@@ -0,0 +1,283 @@
+"""Rerun instrumentation exported in Prometheus text format.
+
+app1.py wraps each rerun in ``page()`` and its sections (CSS, page body,
+footer) in ``block()``; figure factories and ``ui.show_chart`` time
+chart building and ``st.plotly_chart`` serialization the same way. Each
+Streamlit session runs its script in its own thread, so the current page is
+kept in a thread-local and blocks are labelled with it automatically.
+
+The endpoint also answers ``/ready``: 200 once every callable in
+``READY_CHECKS`` returns true (e.g. the boot warm-up has finished), 503
+before, for hosts and load balancers that hold traffic until then.
+
+Exporters are configured in the ``[portfolio.metrics]`` and
+``[portfolio.profiler]`` sections of config.toml (see settings.py).
+"""
+import contextlib
+import http.server
+import logging
+import os
+import sys
+import threading
+import time
+from collections import Counter as _Tally
+
+from portfolio.settings import DATA_DIR, ROOT
+
+_LOGGER = logging.getLogger(__name__)
+
+SECONDS_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+def _escape(value):
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _labels(names, values, extra=()):
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)] + list(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+class Counter:
+    def __init__(self, name, help, labels=()):
+        self.name = name
+        self.help = help
+        self.label_names = tuple(labels)
+        self._values = {}
+        self._lock = threading.Lock()
+
+    def inc(self, *labels, amount=1):
+        with self._lock:
+            self._values[labels] = self._values.get(labels, 0) + amount
+
+    def value(self, *labels):
+        return self._values.get(labels, 0)
+
+    def expose(self):
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} counter"]
+        with self._lock:
+            for labels, value in sorted(self._values.items()):
+                lines.append(f"{self.name}{_labels(self.label_names, labels)} {value}")
+        return lines
+
+
+class Histogram:
+    def __init__(self, name, help, labels=(), buckets=SECONDS_BUCKETS):
+        self.name = name
+        self.help = help
+        self.label_names = tuple(labels)
+        self.buckets = tuple(buckets)
+        self._series = {}  # labels -> [bucket counts..., sum, count]
+        self._lock = threading.Lock()
+
+    def observe(self, value, *labels):
+        with self._lock:
+            series = self._series.get(labels)
+            if series is None:
+                series = self._series[labels] = [0] * (len(self.buckets) + 2)
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    series[i] += 1
+                    break
+            series[-2] += value
+            series[-1] += 1
+
+    def count(self, *labels):
+        series = self._series.get(labels)
+        return series[-1] if series else 0
+
+    def expose(self):
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} histogram"]
+        with self._lock:
+            for labels, series in sorted(self._series.items()):
+                cumulative = 0
+                for bound, hits in zip(self.buckets, series):
+                    cumulative += hits
+                    le = _labels(self.label_names, labels, [f'le="{bound}"'])
+                    lines.append(f"{self.name}_bucket{le} {cumulative}")
+                le = _labels(self.label_names, labels, ['le="+Inf"'])
+                lines.append(f"{self.name}_bucket{le} {series[-1]}")
+                lines.append(f"{self.name}_sum{_labels(self.label_names, labels)} {series[-2]:.6f}")
+                lines.append(f"{self.name}_count{_labels(self.label_names, labels)} {series[-1]}")
+        return lines
+
+
+page_seconds = Histogram("portfolio_page_render_seconds", "Time to render one page (one rerun).", ["page"])
+block_seconds = Histogram("portfolio_block_seconds", "Time spent in a named block of a rerun.", ["page", "block"])
+reruns = Counter("portfolio_reruns_total", "Script reruns per page.", ["page"])
+profile_samples = Counter("portfolio_profiler_samples_total", "Stack samples taken from script threads.")
+payload_bytes = Counter("portfolio_payload_bytes_total", "Bytes of selected page content sent to browsers.",
+                        ["page", "kind"])
+
+METRICS = [page_seconds, block_seconds, reruns, profile_samples, payload_bytes]
+# Callables returning extra exposition lines, e.g. cache statistics
+COLLECTORS = []
+# Callables that must all return True for /ready to answer 200
+READY_CHECKS = []
+
+_current = threading.local()
+
+
+@contextlib.contextmanager
+def page(name):
+    """Time one rerun of ``name``; blocks inside it are labelled with the page."""
+    _current.page = name
+    reruns.inc(name)
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        page_seconds.observe(time.perf_counter() - start, name)
+
+
+@contextlib.contextmanager
+def block(name):
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        block_seconds.observe(time.perf_counter() - start, getattr(_current, "page", ""), name)
+
+
+def add_payload(kind, size):
+    """Count ``size`` bytes of ``kind`` content against the page being rendered."""
+    payload_bytes.inc(getattr(_current, "page", ""), kind, amount=size)
+
+
+def render():
+    lines = []
+    for metric in METRICS:
+        lines.extend(metric.expose())
+    for collect in COLLECTORS:
+        lines.extend(collect())
+    return "\n".join(lines) + "\n"
+
+
+def ready():
+    return all(check() for check in READY_CHECKS)
+
+
+class _Handler(http.server.BaseHTTPRequestHandler):
+    def do_GET(self):
+        path = self.path.split("?")[0]
+        if path == "/metrics":
+            status, body = 200, render()
+        elif path == "/ready":
+            status, body = (200, "ready\n") if ready() else (503, "warming up\n")
+        else:
+            self.send_error(404)
+            return
+        body = body.encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def _serve(host, port):
+    server = http.server.ThreadingHTTPServer((host, port), _Handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, name="metrics-http", daemon=True).start()
+    return server
+
+
+def metrics_path(name):
+    """Where this process writes the metrics file: under the data directory, one file per launch worker."""
+    path = DATA_DIR / name
+    worker = os.environ.get("PORTFOLIO_WORKER")
+    return path.with_name(f"{path.stem}-{worker}{path.suffix}") if worker else path
+
+
+def _write_file(path, interval):
+    while True:
+        time.sleep(interval)
+        tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp.write_text(render(), encoding="utf-8")
+            tmp.replace(path)
+        except OSError as exc:
+            # Keep writing: a full disk or a removed directory may be transient
+            _LOGGER.warning("metrics file %s not written: %s", path, exc)
+
+
+class SamplingProfiler:
+    """Samples Streamlit script threads and writes collapsed stacks (flamegraph input)."""
+
+    def __init__(self, interval, output, flush_every=10.0, thread_prefix="ScriptRunner"):
+        self.interval = interval
+        self.output = output
+        self.flush_every = flush_every
+        self.thread_prefix = thread_prefix
+        self.stacks = _Tally()
+
+    def sample(self):
+        names = {thread.ident: thread.name for thread in threading.enumerate()}
+        for ident, frame in sys._current_frames().items():
+            if not names.get(ident, "").startswith(self.thread_prefix):
+                continue
+            stack = []
+            while frame is not None:
+                code = frame.f_code
+                stack.append(f"{code.co_name} ({code.co_filename}:{frame.f_lineno})")
+                frame = frame.f_back
+            self.stacks[";".join(reversed(stack))] += 1
+            profile_samples.inc()
+
+    def write(self):
+        self.output.parent.mkdir(parents=True, exist_ok=True)
+        lines = [f"{stack} {count}" for stack, count in self.stacks.most_common()]
+        self.output.write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+    def run(self):
+        last_flush = time.monotonic()
+        while True:
+            time.sleep(self.interval)
+            self.sample()
+            if time.monotonic() - last_flush >= self.flush_every:
+                self.write()
+                last_flush = time.monotonic()
+
+    def start(self):
+        threading.Thread(target=self.run, name="metrics-profiler", daemon=True).start()
+        return self
+
+
+_started = False
+_start_lock = threading.Lock()
+
+
+def start_exporters(config):
+    """Start the endpoint, file writer and profiler from ``settings.portfolio_config()``, once per process."""
+    global _started
+    with _start_lock:
+        if _started:
+            return
+        _started = True
+
+    metrics_config = config.get("metrics", {})
+    if metrics_config.get("enabled", False):
+        port = int(os.environ.get("PORTFOLIO_METRICS_PORT", metrics_config.get("port", 0)))
+        if port:
+            try:
+                _serve(metrics_config.get("host", "127.0.0.1"), port)
+            except OSError as exc:
+                _LOGGER.warning("metrics endpoint not started on port %s: %s", port, exc)
+        if metrics_config.get("file"):
+            threading.Thread(
+                target=_write_file,
+                args=(metrics_path(metrics_config["file"]), float(metrics_config.get("file_interval", 15))),
+                name="metrics-file",
+                daemon=True,
+            ).start()
+
+    profiler_config = config.get("profiler", {})
+    if profiler_config.get("enabled", False):
+        SamplingProfiler(
+            float(profiler_config.get("interval", 0.005)),
+            ROOT / profiler_config.get("output", ".data/profile.folded"),
+        ).start()
@@ -0,0 +1,160 @@
+"""Contact form submissions, persisted off the script thread.
+
+``ContactOutbox.submit`` only de-duplicates, rate-limits and enqueues a message, so
+the Streamlit script never waits on disk I/O. A background writer thread
+drains the queue and commits whatever has accumulated as one batch to a local
+SQLite database in WAL mode.
+"""
+import hashlib
+import queue
+import sqlite3
+import threading
+import time
+from collections import OrderedDict, deque
+
+# submit() results
+QUEUED = "queued"
+DUPLICATE = "duplicate"
+RATE_LIMITED = "rate_limited"
+
+_STOP = object()
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS messages (
+    id INTEGER PRIMARY KEY,
+    received_at REAL NOT NULL,
+    session_id TEXT NOT NULL,
+    name TEXT NOT NULL,
+    email TEXT NOT NULL,
+    subject TEXT NOT NULL,
+    message TEXT NOT NULL,
+    digest TEXT NOT NULL UNIQUE
+)
+"""
+
+
+def message_digest(email, subject, message):
+    # Whitespace and case changes alone don't make a message new
+    normalized = "\x1f".join(" ".join(part.split()).lower() for part in (email, subject, message))
+    return hashlib.sha256(normalized.encode("utf-8")).hexdigest()
+
+
+class ContactOutbox:
+    """In-memory queue in front of a batching SQLite writer thread."""
+
+    def __init__(self, db_path, rate_limit=3, rate_window=600.0, dedupe_window=86400.0, batch_size=500):
+        self.db_path = db_path
+        self.rate_limit = rate_limit
+        self.rate_window = rate_window
+        self.dedupe_window = dedupe_window
+        self.batch_size = batch_size
+
+        self._queue = queue.Queue()
+        self._lock = threading.Lock()
+        self._recent = OrderedDict()  # session id -> submit times, least recent submitter first
+        self._seen = OrderedDict()  # digest -> submit time, oldest first
+
+        self.counts = {QUEUED: 0, DUPLICATE: 0, RATE_LIMITED: 0, "written": 0, "batches": 0, "dropped": 0}
+        self.error = None
+
+        self._thread = threading.Thread(target=self._drain, name="contact-outbox", daemon=True)
+        self._thread.start()
+
+    def submit(self, session_id, name, email, subject, message):
+        now = time.monotonic()
+        digest = message_digest(email, subject, message)
+        with self._lock:
+            while self._seen and next(iter(self._seen.values())) < now - self.dedupe_window:
+                self._seen.popitem(last=False)
+            if digest in self._seen:
+                self.counts[DUPLICATE] += 1
+                return DUPLICATE
+
+            # Forget sessions whose last submit is outside the window
+            while self._recent and next(iter(self._recent.values()))[-1] < now - self.rate_window:
+                self._recent.popitem(last=False)
+            stamps = self._recent.get(session_id, deque())
+            while stamps and stamps[0] < now - self.rate_window:
+                stamps.popleft()
+            if len(stamps) >= self.rate_limit:
+                self.counts[RATE_LIMITED] += 1
+                return RATE_LIMITED
+
+            stamps.append(now)
+            self._recent[session_id] = stamps
+            self._recent.move_to_end(session_id)
+            self._seen[digest] = now
+            self.counts[QUEUED] += 1
+
+        self._queue.put((time.time(), session_id, name, email, subject, message, digest))
+        return QUEUED
+
+    def _connect(self):
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(self.db_path)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute(SCHEMA)
+        conn.commit()
+        return conn
+
+    def _drain(self):
+        try:
+            conn = self._connect()
+        except (OSError, sqlite3.Error) as exc:
+            # Keep draining so flush() never hangs; the messages are counted as dropped
+            conn = None
+            self.error = exc
+
+        stopping = False
+        while not stopping:
+            batch = [self._queue.get()]
+            # Take everything already waiting, up to one batch
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            fetched = len(batch)
+            if any(item is _STOP for item in batch):
+                batch = [item for item in batch if item is not _STOP]
+                stopping = True
+
+            try:
+                if batch and conn is None:
+                    self.counts["dropped"] += len(batch)
+                elif batch:
+                    before = conn.total_changes
+                    with conn:
+                        # The UNIQUE digest also drops duplicates from before a restart
+                        conn.executemany(
+                            "INSERT OR IGNORE INTO messages"
+                            " (received_at, session_id, name, email, subject, message, digest)"
+                            " VALUES (?, ?, ?, ?, ?, ?, ?)",
+                            batch,
+                        )
+                    self.counts["written"] += conn.total_changes - before
+                    self.counts["batches"] += 1
+            except sqlite3.Error as exc:
+                self.counts["dropped"] += len(batch)
+                self.error = exc
+            finally:
+                for _ in range(fetched):
+                    self._queue.task_done()
+        if conn is not None:
+            conn.close()
+
+    def flush(self):
+        """Block until every queued message has been committed."""
+        self._queue.join()
+
+    def close(self):
+        self._queue.put(_STOP)
+        self._thread.join()
+
+    def stored(self):
+        conn = sqlite3.connect(self.db_path)
+        try:
+            return conn.execute("SELECT COUNT(*) FROM messages").fetchone()[0]
+        finally:
+            conn.close()
@@ -0,0 +1,32 @@
+"""Sidebar pages, one module per page.
+
+Page modules are imported on first render only, so Plotly and pandas are not
+loaded until a visitor opens a page that draws a chart.
+"""
+import importlib
+
+# Sidebar label -> module in this package, in sidebar order
+PAGES = {
+    "🏠 Home": "home",
+    "👨‍💼 About": "about",
+    "🛠️ Skills": "skills",
+    "💼 Experience": "experience",
+    "🚀 Projects": "projects",
+    "🏆 Achievements": "achievements",
+    "📜 Certifications": "certifications",
+    "📞 Contact": "contact",
+}
+
+
+# Sidebar index for a ``?page=<module>`` link, e.g. from the static export
+def index_for(slug):
+    slugs = list(PAGES.values())
+    return slugs.index(slug) if slug in slugs else 0
+
+
+def load(page):
+    return importlib.import_module(f"{__name__}.{PAGES[page]}")
+
+
+def render(page):
+    load(page).render()
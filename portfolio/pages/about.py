@@ -0,0 +1,66 @@
+"""About page."""
+import streamlit as st
+
+from portfolio import cv
+from portfolio.content import get_content
+
+
+# Polls while the worker builds the CV (only when content.json just changed,
+# warm-up builds it at boot), then re-runs the page to show the button
+@st.fragment(run_every=1.0)
+def cv_pending():
+    if cv.builder().get(get_content()) is not None:
+        st.rerun()
+    st.caption("⏳ Preparing the CV for download...")
+
+
+def cv_download():
+    content = get_content()
+    data = cv.builder().get(content)
+    if data is None:
+        cv_pending()
+        return
+    # The bytes are served from Streamlit's media store; a click does not re-run the script
+    st.download_button("📄 Download CV", data, file_name=cv.filename(content), mime="text/html",
+                       on_click="ignore")
+
+
+def render():
+    about = get_content().about
+    st.markdown('<h1 class="section-header">About Me</h1>', unsafe_allow_html=True)
+
+    col1, col2 = st.columns([3, 2])
+
+    with col1:
+        drivers = "\n".join(f"- **{title}**: {description}" for title, description in about.drivers)
+        st.markdown(f"""
+### 🎯 Professional Summary
+
+{about.summary}
+
+### 🌟 What Drives Me
+
+{drivers}
+
+### 🎯 Career Objective
+
+{about.objective}
+""")
+
+    with col2:
+        education = "\n\n".join(
+            f"**🎓 {e.period}**  \n**{e.degree}**{f' - {e.field}' if e.field else ''}  \n*{e.school}*  \n"
+            f"**Grade:** {e.grade}"
+            for e in about.education
+        )
+        interests = "\n".join(f"- {interest}" for interest in about.interests)
+        st.markdown(f"""
+### 📚 Educational Journey
+
+{education}
+
+### 🎲 Personal Interests
+{interests}
+""")
+
+        cv_download()
@@ -0,0 +1,32 @@
+"""Achievements page."""
+import streamlit as st
+
+from portfolio import figures, ui
+from portfolio.content import get_content
+
+
+def render():
+    content = get_content()
+
+    st.markdown('<h1 class="section-header">Achievements & Recognition</h1>', unsafe_allow_html=True)
+
+    achievements = content.achievements
+
+    for achievement in achievements:
+        st.markdown(f"""
+        <div class="achievement-badge">
+            <h3>{achievement.title}</h3>
+            <p><strong>📅 Date:</strong> {achievement.date}</p>
+            <p><strong>📋 Category:</strong> {achievement.category}</p>
+            <p>{achievement.description}</p>
+        </div>
+        """, unsafe_allow_html=True)
+        st.markdown("<br>", unsafe_allow_html=True)
+
+    # Achievement categories visualization
+    category_data = content.achievement_categories
+
+    chart = figures.pie(category_data, values='Count', names='Category',
+                        title='Achievement Categories Distribution',
+                        colors=['#FF6B6B', '#4ECDC4', '#45B7D1'])
+    ui.show_chart(chart, 'achievement_categories')
@@ -0,0 +1,50 @@
+"""Visitor analytics dashboard (hidden; opened with ``?admin=<token>``)."""
+import pandas as pd
+import streamlit as st
+
+from portfolio import analytics
+
+
+# Changing the period re-runs this section only
+@st.fragment
+def views_per_day(days):
+    st.markdown("### 📅 Views per day")
+    per_day = pd.DataFrame([counts for _, counts in days], index=pd.DatetimeIndex([day for day, _ in days]))
+    period = st.selectbox("Period", ["Last 30 days", "Last 365 days", "All time"])
+    if period != "All time":
+        span = pd.Timedelta(days=(30 if period == "Last 30 days" else 365) - 1)
+        per_day = per_day[per_day.index >= per_day.index[-1] - span]
+    st.line_chart(per_day)
+    with st.expander("Daily counts"):
+        st.dataframe(per_day.iloc[::-1], use_container_width=True)
+
+
+def render():
+    st.markdown('<h1 class="section-header">Visitor Analytics</h1>', unsafe_allow_html=True)
+
+    log = analytics.event_log()
+    if log is None:
+        st.info("Analytics is disabled in config.toml ([portfolio.analytics] enabled).")
+        return
+
+    summary = log.summary(analytics.worker_logs())
+    days = summary["days"]
+    col1, col2, col3, col4 = st.columns(4)
+    with col1:
+        st.metric("Page views", f"{summary['rows']:,}")
+    with col2:
+        st.metric("Days", f"{len(days):,}")
+    with col3:
+        st.metric("Pages", len(summary["pages"]))
+    with col4:
+        st.metric("Dropped events", f"{summary['dropped']:,}")
+    if log.error:
+        st.error(f"Writer error: {log.error}")
+    if not days:
+        st.info("No page views logged yet.")
+        return
+
+    st.markdown("### 📊 Views per page")
+    st.bar_chart(pd.Series(summary["pages"], name="views"))
+
+    views_per_day(days)
@@ -0,0 +1,37 @@
+"""Certifications page."""
+import streamlit as st
+
+from portfolio import figures, ui
+from portfolio.content import get_content
+from portfolio.components import skill_badges
+
+
+def render():
+    content = get_content()
+
+    st.markdown('<h1 class="section-header">Professional Certifications</h1>', unsafe_allow_html=True)
+
+    certifications = content.certifications
+
+    for cert in certifications:
+        with st.expander(f"📜 {cert.title}", expanded=True):
+            col1, col2 = st.columns([3, 1])
+
+            with col1:
+                st.markdown(f"**Issuer:** {cert.issuer}")
+                st.markdown(f"**Description:** {cert.description}")
+                st.markdown("**Skills Gained:**")
+                st.markdown(skill_badges(cert.skills), unsafe_allow_html=True)
+
+            with col2:
+                st.markdown("### 🎯 Status")
+                st.success("✅ Completed")
+
+    # Certification timeline
+    st.markdown("### 📅 Certification Timeline")
+
+    cert_timeline = content.cert_timeline
+
+    chart = figures.bubble_scatter(cert_timeline, x='Year', y='Certification', size='Importance',
+                                   title='Certification Journey', color_scale='Viridis', height=400)
+    ui.show_chart(chart, 'cert_timeline')
@@ -0,0 +1,145 @@
+"""Contact page."""
+import streamlit as st
+
+from portfolio import github, outbox, settings, ui
+from portfolio.content import get_content
+
+
+# One writer thread and database connection per process, shared by all sessions
+@st.cache_resource
+def get_outbox():
+    return outbox.ContactOutbox(settings.DATA_DIR / "contact.sqlite3")
+
+
+# Interactive regions are fragments: submitting the form or clicking a link
+# button re-runs only that region, not the page, sidebar and footer
+@st.fragment
+def contact_form():
+    with st.form("contact_form"):
+        # Form input is the only per-visitor state; cap what a session can hold
+        name = st.text_input("Your Name", max_chars=100)
+        email = st.text_input("Your Email", max_chars=254)
+        subject = st.selectbox("Subject",
+                               ["Job Opportunity", "Project Collaboration", "General Inquiry", "Other"])
+        message = st.text_area("Message", height=100, max_chars=5000)
+
+        submitted = st.form_submit_button("Send Message")
+
+        if submitted:
+            if not (name.strip() and email.strip() and message.strip()):
+                st.warning("Please fill in your name, email and message.")
+            else:
+                result = get_outbox().submit(ui.session_id(), name, email, subject, message)
+                if result == outbox.QUEUED:
+                    st.success("Thank you for your message! I'll get back to you soon. 📧")
+                    st.balloons()
+                elif result == outbox.DUPLICATE:
+                    st.info("I've already received this message - thanks! 📧")
+                else:
+                    st.warning("You've sent several messages already. Please try again later.")
+
+
+# Profile links; a profile without a URL in content.json keeps the placeholder
+@st.fragment
+def social_links():
+    about = get_content().about
+    if about.linkedin:
+        st.link_button("🔗 LinkedIn Profile", about.linkedin)
+    elif st.button("🔗 LinkedIn Profile"):
+        st.info("LinkedIn profile link would open here")
+
+    if about.github:
+        st.link_button("💻 GitHub Repository", about.github)
+    elif st.button("💻 GitHub Repository"):
+        st.info("GitHub profile link would open here")
+
+    st.link_button("📧 Send Email", f"mailto:{about.email}")
+
+
+# Polls while the first fetch is in flight, then re-runs the page to show the stats
+@st.fragment(run_every=1.0)
+def github_pending():
+    snapshot = github.stats().get()
+    if snapshot.value is not None or snapshot.error:
+        st.rerun()
+    st.caption("⏳ Fetching GitHub stats...")
+
+
+def github_stats():
+    """Cached stats only: a refresh, when due, runs in the background."""
+    cache = github.stats()
+    st.markdown("### 💻 GitHub")
+    if cache is None:
+        # Opt-in: no account in content.json, [portfolio.github] or PORTFOLIO_GITHUB_USER
+        st.caption("GitHub stats will show here once a GitHub account is set.")
+        return
+    snapshot = cache.get()
+    stats = snapshot.value
+    if stats is None:
+        if snapshot.error:
+            st.caption("GitHub stats are unavailable right now.")
+        else:
+            github_pending()
+        return
+    col1, col2 = st.columns(2)
+    col1.metric("Public Repositories", stats.repos)
+    col2.metric("Stars", stats.stars)
+    col1.metric("Followers", stats.followers)
+    col2.metric("Forks", stats.forks)
+    if stats.languages:
+        st.caption("Top languages: " + ", ".join(f"{language} ({n})" for language, n in stats.languages))
+    st.caption(f"[@{stats.user}]({stats.url}) · updated {int(snapshot.age // 60)} min ago")
+
+
+def render():
+    st.markdown('<h1 class="section-header">Get In Touch</h1>', unsafe_allow_html=True)
+
+    col1, col2 = st.columns([2, 1])
+
+    with col1:
+        st.markdown("""
+        ### 📬 Let's Connect!
+
+        I'm always interested in new opportunities, collaborations, and interesting projects. 
+        Whether you're looking for a data analyst, have a project in mind, or just want to 
+        chat about data science, feel free to reach out!
+
+        ### 🎯 What I'm Looking For:
+        - **Full-time Data Analyst positions**
+        - **Freelance data analysis projects**
+        - **Collaboration opportunities**
+        - **Mentorship in advanced analytics**
+        """)
+
+        # Contact form
+        st.markdown("### 📝 Send me a message:")
+
+        contact_form()
+
+    with col2:
+        st.markdown("""
+        <div class="contact-info">
+            <h3>📞 Contact Information</h3>
+            <p><strong>📱 Phone:</strong><br>+91 7410173864</p>
+            <p><strong>📧 Email:</strong><br>sainarka2@gmail.com</p>
+            <p><strong>📍 Location:</strong><br>Kolkata, West Bengal, India</p>
+            <p><strong>🔗 LinkedIn:</strong><br>Connect with me</p>
+            <p><strong>💻 GitHub:</strong><br>View my code</p>
+        </div>
+        """, unsafe_allow_html=True)
+
+        st.markdown("### 🌍 Find Me Online")
+
+        social_links()
+
+        # Quick stats: counts come from content.json, the rest from its stats table
+        st.markdown("### 📊 Quick Stats")
+
+        content = get_content()
+        st.metric(label="Projects Completed", value=len(content.experience))
+        st.metric(label="Certifications", value=len(content.certifications))
+        for metric, value in zip(content.stats["Metric"], content.stats["Value"]):
+            st.metric(label=metric, value=value)
+        st.metric(label="Programming Languages", value=len(content.languages))
+
+        github_stats()
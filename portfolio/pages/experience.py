@@ -0,0 +1,39 @@
+"""Experience page."""
+import streamlit as st
+
+from portfolio import figures, ui
+from portfolio.content import get_content
+from portfolio.components import skill_badges
+
+
+def render():
+    content = get_content()
+
+    st.markdown('<h1 class="section-header">Professional Experience</h1>', unsafe_allow_html=True)
+
+    st.markdown("""
+    <div class="experience-card">
+        <h3>🔍 Data Analyst Intern</h3>
+        <h4>PRODIGY INFOTECH - Tech Services</h4>
+        <p><strong>📅 Duration:</strong> April 2025 – May 2025</p>
+        <p><strong>📍 Location:</strong> Kolkata, West Bengal, India</p>
+    </div>
+    """, unsafe_allow_html=True)
+
+    st.markdown("### 🎯 Key Responsibilities & Achievements")
+
+    experience_data = content.experience
+
+    for i, exp in enumerate(experience_data):
+        with st.expander(f"📋 {exp.task}", expanded=True):
+            st.write(exp.description)
+            st.markdown("**Skills Used:**")
+            st.markdown(skill_badges(exp.skills), unsafe_allow_html=True)
+
+    # Experience timeline
+    st.markdown("### 📅 Career Timeline")
+
+    timeline_data = content.timeline
+
+    chart = figures.timeline(timeline_data, x='Year', y='Event', title='Career Timeline', height=300)
+    ui.show_chart(chart, 'career_timeline')
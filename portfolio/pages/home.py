@@ -0,0 +1,77 @@
+"""Home page."""
+import streamlit as st
+
+
+def render():
+    st.markdown('<h1 class="main-header">Arka Sain</h1>', unsafe_allow_html=True)
+    st.markdown(
+        '<p class="sub-header">Data Analyst | Business Analytics Enthusiast | Machine Learning Practitioner</p>',
+        unsafe_allow_html=True)
+
+    # Hero section with metrics
+    col1, col2, col3, col4 = st.columns(4)
+
+    with col1:
+        st.markdown("""
+        <div class="metric-card">
+            <h3>📊</h3>
+            <h4>Data Analysis</h4>
+            <p>Expert Level</p>
+        </div>
+        """, unsafe_allow_html=True)
+
+    with col2:
+        st.markdown("""
+        <div class="metric-card">
+            <h3>🎓</h3>
+            <h4>Education</h4>
+            <p>PGP + MBA</p>
+        </div>
+        """, unsafe_allow_html=True)
+
+    with col3:
+        st.markdown("""
+        <div class="metric-card">
+            <h3>🏆</h3>
+            <h4>Projects</h4>
+            <p>5+ Completed</p>
+        </div>
+        """, unsafe_allow_html=True)
+
+    with col4:
+        st.markdown("""
+        <div class="metric-card">
+            <h3>📜</h3>
+            <h4>Certifications</h4>
+            <p>5+ Earned</p>
+        </div>
+        """, unsafe_allow_html=True)
+
+    st.markdown("---")
+
+    # Quick overview
+    col1, col2 = st.columns([2, 1])
+
+    with col1:
+        st.markdown('<h2 class="section-header">👋 Welcome to My Portfolio</h2>', unsafe_allow_html=True)
+        st.markdown("""
+        I'm a passionate **Data Analyst** and **Business Analytics** student with hands-on experience in:
+
+        - **Data Analysis & Visualization** using Power BI, Tableau, and Python
+        - **Machine Learning** implementations with real-world datasets
+        - **Business Intelligence** dashboard development
+        - **Statistical Analysis** and predictive modeling
+
+        Currently pursuing **PGP + MBA in Business Analytics & Data Science** at Bengal Institute of Business Studies, 
+        I combine technical expertise with business acumen to derive actionable insights from data.
+        """)
+
+    with col2:
+        st.markdown("""
+        <div class="contact-info">
+            <h3>📞 Quick Contact</h3>
+            <p><strong>📱 Phone:</strong> +91 7410173864</p>
+            <p><strong>📧 Email:</strong> sainarka2@gmail.com</p>
+            <p><strong>📍 Location:</strong> Kolkata, West Bengal</p>
+        </div>
+        """, unsafe_allow_html=True)
@@ -0,0 +1,106 @@
+"""Projects page."""
+import streamlit as st
+
+from portfolio import demos, figures, ui
+from portfolio.content import get_content
+from portfolio.components import skill_badges
+
+
+# The demos re-run on their own: a slicer or button re-executes this region only
+@st.fragment
+def live_demos():
+    st.markdown("### 🧪 Live Demos")
+    demo = st.radio("Run a demo", ["—", *demos.DEMOS], horizontal=True, key="demo")
+    if demo != "—":
+        demos.render(demo)
+
+
+def render():
+    content = get_content()
+
+    st.markdown('<h1 class="section-header">Featured Projects</h1>', unsafe_allow_html=True)
+
+    # Project 1
+    st.markdown("""
+    <div class="project-card">
+        <h3>📊 Sales & Business Insights Dashboard</h3>
+        <p><strong>Technology:</strong> Power BI</p>
+    </div>
+    """, unsafe_allow_html=True)
+
+    col1, col2 = st.columns([2, 1])
+    with col1:
+        st.markdown("""
+        **Project Overview:**
+        Designed and developed a comprehensive Sales & Business Insights Dashboard in Power BI to visualize 
+        key performance indicators (KPIs), sales trends, and regional insights for improved business decision-making.
+
+        **Key Features:**
+        - Dynamic reports with interactive visuals
+        - DAX measures for complex calculations
+        - Slicers and filters for user interaction
+        - Regional performance analysis
+        - Sales trend identification
+        """)
+
+    with col2:
+        st.markdown("""
+        **Technologies Used:**
+        """)
+        project1_skills = ["Power BI", "DAX", "Data Cleaning", "EDA", "KPI Development"]
+        st.markdown(skill_badges(project1_skills), unsafe_allow_html=True)
+
+    st.markdown("---")
+
+    # Project 2
+    st.markdown("""
+    <div class="project-card">
+        <h3>🛒 Blink IT Sales Power BI Dashboard</h3>
+        <p><strong>Technology:</strong> Power BI, Advanced Analytics</p>
+    </div>
+    """, unsafe_allow_html=True)
+
+    col1, col2 = st.columns([2, 1])
+    with col1:
+        st.markdown("""
+        **Project Overview:**
+        Comprehensive analysis of 12+ months of sales data to uncover key business insights and performance drivers.
+
+        **Key Achievements:**
+        - Analyzed over 12 months of sales data
+        - Identified top-performing products and underperforming regions
+        - Discovered that 60% of total revenue came from 3 key products
+        - Created dynamic visuals and KPIs for monitoring targets
+        - Enabled data-driven sales strategies and quarterly reviews
+        """)
+
+    with col2:
+        st.markdown("""
+        **Impact Metrics:**
+        """)
+
+        # Create impact metrics visualization
+        impact_data = content.project_impact
+
+        chart = figures.horizontal_bar(impact_data, x='Impact', y='Metric', title='Project Impact Metrics',
+                                       color_scale='Greens', height=300)
+        ui.show_chart(chart, 'project_impact')
+
+    # Additional Projects Section
+    st.markdown("### 🛠️ Technical Projects from Internship")
+
+    projects = content.projects
+
+    cols = st.columns(3)
+    for i, project in enumerate(projects):
+        with cols[i]:
+            st.markdown(f"""
+            <div class="mini-project-card">
+                <h4>{project.title}</h4>
+                <p><strong>Dataset:</strong> {project.dataset}</p>
+                <p>{project.description}</p>
+                <p><strong>Outcome:</strong> {project.outcome}</p>
+            </div>
+            """, unsafe_allow_html=True)
+
+    live_demos()
@@ -0,0 +1,43 @@
+"""Skills page."""
+import streamlit as st
+
+from portfolio import figures, ui
+from portfolio.content import get_content
+from portfolio.components import skill_badges
+
+
+def render():
+    content = get_content()
+
+    st.markdown('<h1 class="section-header">Technical Skills</h1>', unsafe_allow_html=True)
+
+    # Programming Languages
+    st.markdown("### 💻 Programming Languages")
+    languages = content.languages
+    st.markdown(skill_badges(languages), unsafe_allow_html=True)
+
+    # Create a skills proficiency chart
+    skills_data = content.skills_proficiency
+
+    chart = figures.horizontal_bar(skills_data, x='Proficiency', y='Skill', title='Technical Skills Proficiency',
+                                   color_scale='Blues', height=400)
+    ui.show_chart(chart, 'skills_proficiency')
+
+    col1, col2 = st.columns(2)
+
+    with col1:
+        st.markdown("### 🛠️ Technologies & Tools")
+        tech_tools = content.tech_tools
+        st.markdown(skill_badges(tech_tools), unsafe_allow_html=True)
+
+    with col2:
+        st.markdown("### 🧠 Core Competencies")
+        core_skills = content.core_skills
+        st.markdown(skill_badges(core_skills), unsafe_allow_html=True)
+
+    # Skills radar chart
+    st.markdown("### 📊 Skills Overview")
+
+    chart = figures.radar(content.skills_radar, name='Skill Level',
+                          title="Skills Radar Chart", color='#1f77b4')
+    ui.show_chart(chart, 'skills_radar')
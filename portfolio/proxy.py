@@ -0,0 +1,207 @@
+"""Session-affine asyncio reverse proxy in front of several app workers.
+
+Streamlit keeps every session -- widget state, cached media for download
+buttons, the websocket itself -- in the memory of the process that served it,
+so all requests of one browser have to reach the same worker. The proxy
+works on raw HTTP/1.1: it reads the request head, picks a backend, forwards
+the head and then pipes bytes both ways, so websocket upgrades and
+keep-alive connections pass through untouched. A visitor without a valid
+``portfolio_worker`` cookie is sent to the live backend with the fewest open
+sessions and gets the cookie on the first response; later requests and
+websocket reconnects follow it.
+
+A backend is live when its last health check passed (Streamlit's
+``/_stcore/health``, plus the worker's ``/ready`` when it has a metrics port)
+and it is not draining. ``drain()`` stops new sessions going to a backend
+and waits for its open websockets to close. ``/_proxy/status`` returns the
+backends as JSON. portfolio.launch starts the workers and drives restarts.
+"""
+import asyncio
+import json
+import logging
+
+_LOGGER = logging.getLogger(__name__)
+
+COOKIE = "portfolio_worker"
+MAX_HEAD = 64 * 1024
+STATUS_PATH = "/_proxy/status"
+
+
+class Backend:
+    def __init__(self, name, port, host="127.0.0.1", ready_port=None):
+        self.name = name
+        self.host = host
+        self.port = port
+        self.ready_port = ready_port  # metrics endpoint answering /ready, if any
+        self.healthy = False
+        self.draining = False
+        self.sessions = 0  # open websocket connections
+        self.connections = 0  # all open client connections
+
+    @property
+    def live(self):
+        return self.healthy and not self.draining
+
+    def status(self):
+        return {"name": self.name, "port": self.port, "healthy": self.healthy, "draining": self.draining,
+                "sessions": self.sessions, "connections": self.connections}
+
+
+def _headers(head):
+    lines = head.decode("latin-1").split("\r\n")
+    headers = {}
+    for line in lines[1:]:
+        name, sep, value = line.partition(":")
+        if sep:
+            headers.setdefault(name.strip().lower(), value.strip())
+    return lines[0], headers
+
+
+def _cookie(headers, name):
+    for part in headers.get("cookie", "").split(";"):
+        key, _, value = part.strip().partition("=")
+        if key == name:
+            return value
+    return None
+
+
+def _add_header(head, line):
+    # head ends with the blank line; insert before it
+    return head[:-2] + line.encode("latin-1") + b"\r\n\r\n"
+
+
+def _response(status, body, content_type="text/plain; charset=utf-8"):
+    body = body.encode("utf-8")
+    return (f"HTTP/1.1 {status}\r\nContent-Type: {content_type}\r\nContent-Length: {len(body)}\r\n"
+            f"Connection: close\r\n\r\n").encode("latin-1") + body
+
+
+async def _pipe(reader, writer):
+    try:
+        while data := await reader.read(65536):
+            writer.write(data)
+            await writer.drain()
+    except (ConnectionError, asyncio.IncompleteReadError):
+        pass
+
+
+async def http_status(host, port, path, timeout=2.0):
+    """Status code of a GET, or None when the server does not answer."""
+    try:
+        reader, writer = await asyncio.wait_for(asyncio.open_connection(host, port), timeout)
+    except (OSError, asyncio.TimeoutError):
+        return None
+    try:
+        writer.write(f"GET {path} HTTP/1.1\r\nHost: {host}:{port}\r\nConnection: close\r\n\r\n".encode("latin-1"))
+        line = await asyncio.wait_for(reader.readline(), timeout)
+        return int(line.split()[1])
+    except (OSError, asyncio.TimeoutError, ValueError, IndexError):
+        return None
+    finally:
+        writer.close()
+
+
+class Proxy:
+    def __init__(self, health_interval=2.0):
+        self.backends = {}  # name -> Backend
+        self.health_interval = health_interval
+        self._server = None
+
+    def add(self, backend):
+        self.backends[backend.name] = backend
+
+    def remove(self, backend):
+        self.backends.pop(backend.name, None)
+
+    def pick(self, headers):
+        """(backend, True if the visitor has to be (re)assigned), or (None, True) when nothing is live."""
+        backend = self.backends.get(_cookie(headers, COOKIE))
+        if backend is not None and backend.live:
+            return backend, False
+        live = [backend for backend in self.backends.values() if backend.live]
+        if not live:
+            return None, True
+        return min(live, key=lambda backend: (backend.sessions, backend.connections)), True
+
+    async def check(self, backend):
+        healthy = await http_status(backend.host, backend.port, "/_stcore/health") == 200
+        if healthy and backend.ready_port:
+            healthy = await http_status(backend.host, backend.ready_port, "/ready") == 200
+        if healthy != backend.healthy:
+            _LOGGER.info("worker %s (port %s) is %s", backend.name, backend.port, "up" if healthy else "down")
+        backend.healthy = healthy
+        return healthy
+
+    async def health_loop(self):
+        while True:
+            await asyncio.gather(*(self.check(backend) for backend in list(self.backends.values())))
+            await asyncio.sleep(self.health_interval)
+
+    async def drain(self, backend, timeout):
+        """Send no new sessions to ``backend``; True once its websockets closed within ``timeout``."""
+        backend.draining = True
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        while backend.sessions and loop.time() < deadline:
+            await asyncio.sleep(0.1)
+        return backend.sessions == 0
+
+    async def handle(self, client_reader, client_writer):
+        upstream_writer = None
+        try:
+            try:
+                head = await client_reader.readuntil(b"\r\n\r\n")
+            except (asyncio.IncompleteReadError, asyncio.LimitOverrunError, ConnectionError):
+                return
+            request_line, headers = _headers(head)
+            if request_line.split(" ")[1:2] == [STATUS_PATH]:
+                body = json.dumps([backend.status() for backend in self.backends.values()])
+                client_writer.write(_response("200 OK", body, "application/json"))
+                return
+            backend, assign = self.pick(headers)
+            if backend is None:
+                client_writer.write(_response("503 Service Unavailable", "no worker is ready\n"))
+                return
+            # Counted before connecting, so a burst of new visitors spreads over the backends
+            websocket = headers.get("upgrade", "").lower() == "websocket"
+            backend.connections += 1
+            backend.sessions += websocket
+            try:
+                try:
+                    upstream_reader, upstream_writer = await asyncio.open_connection(
+                        backend.host, backend.port, limit=MAX_HEAD)
+                except OSError:
+                    backend.healthy = False
+                    client_writer.write(_response("502 Bad Gateway", "worker unavailable\n"))
+                    return
+                peer = client_writer.get_extra_info("peername")
+                upstream_writer.write(_add_header(head, f"X-Forwarded-For: {peer[0] if peer else ''}"))
+                response = await upstream_reader.readuntil(b"\r\n\r\n")
+                if assign:
+                    response = _add_header(response, f"Set-Cookie: {COOKIE}={backend.name}; Path=/; HttpOnly; "
+                                                     "SameSite=Lax")
+                client_writer.write(response)
+                # Either side closing ends the exchange (keep-alive requests stay on this backend)
+                pipes = [asyncio.ensure_future(_pipe(client_reader, upstream_writer)),
+                         asyncio.ensure_future(_pipe(upstream_reader, client_writer))]
+                _, pending = await asyncio.wait(pipes, return_when=asyncio.FIRST_COMPLETED)
+                for task in pending:
+                    task.cancel()
+            except (asyncio.IncompleteReadError, asyncio.LimitOverrunError, ConnectionError):
+                pass
+            finally:
+                backend.connections -= 1
+                backend.sessions -= websocket
+        finally:
+            for writer in (upstream_writer, client_writer):
+                if writer is not None:
+                    writer.close()
+
+    async def start(self, host, port):
+        self._server = await asyncio.start_server(self.handle, host, port, limit=MAX_HEAD)
+        return self._server
+
+    def close(self):
+        """Stop accepting connections; open ones keep running."""
+        if self._server is not None:
+            self._server.close()
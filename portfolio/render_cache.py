@@ -0,0 +1,171 @@
+"""Render results shared by every process on the host, in one SQLite file.
+
+The in-memory caches (figures, badges, snapshots index) are per process, so
+a restarted server or each extra worker of portfolio.launch would rebuild
+every chart before it could show it. ``RenderCache`` keeps serialized
+renders -- today the Plotly figure JSON behind every chart -- in
+``<data dir>/render-cache.sqlite3`` under their content hash, so a new
+process reads them back instead.
+
+WAL mode lets readers in any process run alongside one writer, and writes
+wait up to ``BUSY_TIMEOUT`` seconds for each other. Each thread has its own
+connection. Every entry records its size and when it was last used; once
+the total is over ``max_bytes`` the least recently used entries are deleted
+in the same transaction as the write, down to ``EVICT_TO`` of the budget. A
+cache that cannot be opened or written to (read-only disk, corrupt file)
+logs a warning and behaves as empty: rendering never depends on it.
+
+Configured in the ``[portfolio.render_cache]`` section of config.toml;
+``PORTFOLIO_RENDER_CACHE=0`` turns it off.
+"""
+import logging
+import os
+import sqlite3
+import threading
+import time
+
+from portfolio import metrics, settings
+
+_LOGGER = logging.getLogger(__name__)
+
+CACHE_PATH = settings.DATA_DIR / "render-cache.sqlite3"
+BUSY_TIMEOUT = 5.0
+# Fraction of max_bytes left after an eviction, so not every write evicts
+EVICT_TO = 0.9
+# Last-use times are only rewritten when older than this, so hits stay read-only
+TOUCH_INTERVAL = 60.0
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    key TEXT PRIMARY KEY,
+    kind TEXT NOT NULL,
+    value TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    used_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS entries_used_at ON entries (used_at);
+"""
+
+lookups = metrics.Counter("portfolio_render_cache_lookups_total", "Shared render cache lookups.",
+                          ["kind", "result"])
+evictions = metrics.Counter("portfolio_render_cache_evictions_total", "Entries evicted from the shared render cache.")
+metrics.METRICS.extend([lookups, evictions])
+
+
+class RenderCache:
+    """Text values by (kind, key) in an SQLite file, bounded to ``max_bytes`` by least recent use."""
+
+    def __init__(self, path, max_bytes=64 * 2 ** 20):
+        self.path = path
+        self.max_bytes = max_bytes
+        self._local = threading.local()
+        self._broken = False
+
+    def _connection(self):
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(self.path, timeout=BUSY_TIMEOUT, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.executescript(SCHEMA)
+            self._local.conn = conn
+        return conn
+
+    def _failed(self, action, exc):
+        if not self._broken:
+            _LOGGER.warning("render cache %s failed, rendering without it: %s", action, exc)
+        self._broken = True
+
+    def get(self, kind, key):
+        """The cached value, or None."""
+        try:
+            conn = self._connection()
+            row = conn.execute("SELECT value, used_at FROM entries WHERE key = ?", (f"{kind}:{key}",)).fetchone()
+            if row is not None and time.time() - row[1] > TOUCH_INTERVAL:
+                conn.execute("UPDATE entries SET used_at = ? WHERE key = ?", (time.time(), f"{kind}:{key}"))
+        except (OSError, sqlite3.Error) as exc:
+            self._failed("read", exc)
+            return None
+        lookups.inc(kind, "miss" if row is None else "hit")
+        return None if row is None else row[0]
+
+    def put(self, kind, key, value):
+        size = len(value.encode("utf-8"))
+        if size > self.max_bytes * (1 - EVICT_TO):
+            return  # would evict most of the cache
+        try:
+            conn = self._connection()
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                conn.execute("INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?, ?)",
+                             (f"{kind}:{key}", kind, value, size, time.time()))
+                self._evict(conn)
+                conn.execute("COMMIT")
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+        except (OSError, sqlite3.Error) as exc:
+            self._failed("write", exc)
+
+    def _evict(self, conn):
+        total = conn.execute("SELECT total(size) FROM entries").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        victims = []
+        for key, size in conn.execute("SELECT key, size FROM entries ORDER BY used_at"):
+            if total <= self.max_bytes * EVICT_TO:
+                break
+            victims.append((key,))
+            total -= size
+        conn.executemany("DELETE FROM entries WHERE key = ?", victims)
+        evictions.inc(amount=len(victims))
+
+    def stats(self):
+        try:
+            count, size = self._connection().execute("SELECT count(*), total(size) FROM entries").fetchone()
+        except (OSError, sqlite3.Error):
+            count, size = 0, 0
+        return {"entries": count, "bytes": int(size), "max_bytes": self.max_bytes}
+
+    def clear(self):
+        self._connection().execute("DELETE FROM entries")
+
+
+def config():
+    return settings.portfolio_config().get("render_cache", {})
+
+
+_cache = None
+_cache_lock = threading.Lock()
+
+
+def shared():
+    """The process-wide RenderCache over CACHE_PATH, or None when turned off."""
+    global _cache
+    enabled = os.environ.get("PORTFOLIO_RENDER_CACHE", str(config().get("enabled", True)))
+    if enabled.lower() in ("0", "false", "no"):
+        return None
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                _cache = RenderCache(CACHE_PATH, int(float(config().get("max_mb", 64)) * 2 ** 20))
+    return _cache
+
+
+def _render_cache_metrics():
+    cache = _cache
+    if cache is None:
+        return []
+    stats = cache.stats()
+    return [
+        "# HELP portfolio_render_cache_bytes Bytes held by the shared render cache.",
+        "# TYPE portfolio_render_cache_bytes gauge",
+        f"portfolio_render_cache_bytes {stats['bytes']}",
+        "# HELP portfolio_render_cache_entries Entries in the shared render cache.",
+        "# TYPE portfolio_render_cache_entries gauge",
+        f"portfolio_render_cache_entries {stats['entries']}",
+    ]
+
+
+metrics.COLLECTORS.append(_render_cache_metrics)
@@ -0,0 +1,142 @@
+"""Full-text search over the portfolio content, for the sidebar search box.
+
+``SearchIndex`` is an inverted index (term -> {document: weight}) with the
+vocabulary kept sorted, so a query word matches every term it is a prefix of
+with two bisects, and the postings stored as flat NumPy arrays, so scoring
+is vectorized. Titles and skill tags weigh more than descriptions, and an
+exact word match more than a prefix match. Every query word has to match
+(AND); results are ranked by summed weight.
+
+The index is built once per content version (``index_for``), shared by every
+session, and remembers recent queries.
+"""
+import bisect
+import functools
+import re
+import threading
+from dataclasses import dataclass
+
+from portfolio import metrics
+
+TOKEN = re.compile(r"[a-z0-9][a-z0-9+#.]*")
+# Field weights
+TITLE, TAG, TEXT = 3.0, 2.0, 1.0
+# Prefix matches count for less than whole words, and need this many characters
+PREFIX_WEIGHT = 0.5
+MIN_PREFIX = 2
+
+index_builds = metrics.Counter("portfolio_search_index_builds_total", "Search index builds.")
+metrics.METRICS.append(index_builds)
+
+
+@dataclass(frozen=True, slots=True)
+class Document:
+    page: str  # module name in portfolio.pages, e.g. "experience"
+    title: str
+    snippet: str
+
+
+def tokens(text):
+    # "Power BI" -> power, bi; "Scikit-Learn" -> scikit, learn; trailing dots dropped ("admin.")
+    return [token.rstrip(".") for token in TOKEN.findall(text.lower().replace("-", " "))]
+
+
+def documents(content):
+    """One Document per searchable item, with (text, weight) fields."""
+    for item in content.experience:
+        yield (Document("experience", item.task, item.description),
+               [(item.task, TITLE), (" ".join(item.skills), TAG), (item.description, TEXT)])
+    for item in content.projects:
+        yield (Document("projects", item.title, item.description),
+               [(item.title, TITLE), (item.dataset, TAG), (item.description, TEXT), (item.outcome, TEXT)])
+    for item in content.achievements:
+        yield (Document("achievements", item.title, item.description),
+               [(item.title, TITLE), (item.category, TAG), (item.description, TEXT)])
+    for item in content.certifications:
+        yield (Document("certifications", item.title, f"{item.issuer} · {item.description}"),
+               [(item.title, TITLE), (" ".join(item.skills), TAG), (item.issuer, TAG), (item.description, TEXT)])
+    for group, skills in (("Languages", content.languages), ("Tools & Technologies", content.tech_tools),
+                          ("Core Skills", content.core_skills)):
+        for skill in skills:
+            yield Document("skills", skill, group), [(skill, TITLE), (group, TEXT)]
+
+
+class SearchIndex:
+    def __init__(self, items):
+        import numpy as np
+
+        self.documents = []
+        postings = {}
+        for doc, fields in items:
+            doc_id = len(self.documents)
+            self.documents.append(doc)
+            for text, weight in fields:
+                for term in tokens(text):
+                    entry = postings.setdefault(term, {})
+                    # A word counts once per document, at its best field
+                    if entry.get(doc_id, 0) < weight:
+                        entry[doc_id] = weight
+        self.terms = sorted(postings)
+        # Postings laid out in term order (CSR): the terms sharing a prefix are
+        # adjacent, so their postings are one contiguous slice
+        self.offsets = np.zeros(len(self.terms) + 1, dtype=np.int64)
+        np.cumsum([len(postings[term]) for term in self.terms], out=self.offsets[1:])
+        total = int(self.offsets[-1])
+        self.doc_ids = np.fromiter((d for term in self.terms for d in postings[term]), dtype=np.int32, count=total)
+        self.weights = np.fromiter((w for term in self.terms for w in postings[term].values()), dtype=np.float32,
+                                   count=total)
+        self.search = functools.lru_cache(maxsize=1024)(self._search)
+
+    def _matches(self, word):
+        """Each document's best weight for one query word (0: no match), or None if nothing matches."""
+        import numpy as np
+
+        start = bisect.bisect_left(self.terms, word)
+        exact = start + 1 if start < len(self.terms) and self.terms[start] == word else start
+        end = bisect.bisect_left(self.terms, word + "\uffff", start) if len(word) >= MIN_PREFIX else exact
+        lo, mid, hi = self.offsets[start], self.offsets[exact], self.offsets[end]
+        if lo == hi:
+            return None
+        scores = np.zeros(len(self.documents), dtype=np.float32)
+        np.maximum.at(scores, self.doc_ids[mid:hi], self.weights[mid:hi] * PREFIX_WEIGHT)
+        ids = self.doc_ids[lo:mid]  # the exact term lists each document once
+        scores[ids] = np.maximum(scores[ids], self.weights[lo:mid])
+        return scores
+
+    def _search(self, query, limit=10):
+        import numpy as np
+
+        total = None
+        for word in dict.fromkeys(tokens(query)):
+            scores = self._matches(word)
+            if scores is None:
+                return ()
+            total = scores if total is None else np.where((total > 0) & (scores > 0), total + scores, 0)
+        if total is None:
+            return ()
+        hits = np.flatnonzero(total > 0)
+        # Highest score first, then content order; weights are multiples of 0.5, so the key is exact
+        n = len(self.documents)
+        keys = np.rint(total[hits] * 2).astype(np.int64) * (n + 1) + (n - hits)
+        if len(hits) > limit:
+            top = np.argpartition(-keys, limit)[:limit]
+            hits, keys = hits[top], keys[top]
+        return tuple(self.documents[i] for i in hits[np.argsort(-keys)])
+
+
+_index = None
+_index_version = None
+_index_lock = threading.Lock()
+
+
+def index_for(content):
+    """The SearchIndex for ``content``, rebuilt only when content.json changes."""
+    global _index, _index_version
+    if _index_version == content.version:
+        return _index
+    with _index_lock:
+        if _index_version != content.version:
+            _index = SearchIndex(documents(content))
+            _index_version = content.version
+            index_builds.inc()
+        return _index
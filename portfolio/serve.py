@@ -0,0 +1,32 @@
+"""Run the app with the metrics endpoint and the warm-up started at boot.
+
+    python -m portfolio.serve [streamlit run options, e.g. --server.port 8501]
+
+Same as ``streamlit run app1.py [options]``, except that the exporters
+(including ``/ready``) and ``portfolio.warmup`` start with the process
+instead of with the first visitor's session, so the caches are filling
+while the server is still coming up. The sentiment demo's worker pool is
+started here too, before any session's script thread runs.
+"""
+import sys
+
+from portfolio import metrics, settings, warmup
+
+APP_SCRIPT = settings.ROOT / "app1.py"
+
+
+def main(argv=None):
+    from streamlit.web import cli
+
+    from portfolio.demos import sentiment
+
+    config = settings.portfolio_config()
+    sentiment.start()
+    metrics.start_exporters(config)
+    warmup.start(config)
+    args = sys.argv[1:] if argv is None else argv
+    return cli.main(["run", str(APP_SCRIPT), *args], prog_name="streamlit")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,22 @@
+"""Paths and settings shared by the portfolio modules."""
+import functools
+import os
+from pathlib import Path
+
+import toml
+
+ROOT = Path(__file__).resolve().parent.parent
+
+# Runtime state (SQLite databases, caches); created on first use
+DATA_DIR = Path(os.environ.get("PORTFOLIO_DATA_DIR", ROOT / ".data"))
+
+CONFIG_PATH = Path(os.environ.get("PORTFOLIO_CONFIG", ROOT / "config.toml"))
+
+
+@functools.lru_cache(maxsize=None)
+def portfolio_config():
+    """The ``[portfolio.*]`` sections of config.toml, read once per process."""
+    try:
+        return toml.load(CONFIG_PATH).get("portfolio", {})
+    except FileNotFoundError:
+        return {}
@@ -0,0 +1,164 @@
+"""Pre-rendered chart images shown instead of the interactive Plotly chart.
+
+``snapshot(chart)`` renders a CachedFigure from portfolio.figures to SVG once
+and keeps the file in static/charts/ under the figure's hash, so every
+session and every restart reuses it. With static serving on, pages send a
+short ``<img>`` tag and the browser fetches (and caches) the file; the Plotly
+JSON and Streamlit's Plotly bundle are only loaded when a visitor switches a
+chart to interactive. Kaleido is used when it is installed and working;
+otherwise portfolio.svgchart draws the figure.
+"""
+import hashlib
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict, namedtuple
+from pathlib import Path
+
+from portfolio import svgchart
+from portfolio.settings import ROOT
+
+_LOGGER = logging.getLogger(__name__)
+
+CHART_DIR = ROOT / "static" / "charts"
+URL_PREFIX = "app/static/charts/"
+MAX_FILES = 256
+# A file served from the index gets its mtime refreshed at most this often, so
+# pruning (oldest first) removes charts nobody views rather than popular ones
+TOUCH_INTERVAL = 600.0
+
+# Built-in renderer files carry its source hash: a fixed renderer redraws them
+SVGCHART = "svgchart-" + hashlib.sha1(Path(svgchart.__file__).read_bytes()).hexdigest()[:8]
+
+# path and href are None when the file could not be written; svg is always set
+Snapshot = namedtuple("Snapshot", ["key", "path", "href", "svg"])
+
+_kaleido_failed = False
+
+
+def _kaleido_svg(figure):
+    global _kaleido_failed
+    if _kaleido_failed:
+        return None
+    try:
+        import kaleido  # noqa: F401
+    except ImportError:
+        _kaleido_failed = True
+        return None
+    try:
+        return figure.to_image(format="svg").decode("utf-8")
+    except Exception as exc:  # kaleido needs a browser it can drive
+        _LOGGER.warning("kaleido export failed, using the built-in SVG renderer: %s", exc)
+        _kaleido_failed = True
+        return None
+
+
+def render_svg(figure):
+    """Return ``(renderer, svg)`` for a plotly figure."""
+    svg = _kaleido_svg(figure)
+    if svg is not None:
+        return "kaleido", svg
+    return SVGCHART, svgchart.render(figure)
+
+
+def _mtime(path):
+    try:
+        return path.stat().st_mtime
+    except OSError:  # removed by another process meanwhile
+        return 0.0
+
+
+def _prune(keep, protected=()):
+    files = sorted(CHART_DIR.glob("*.svg"), key=_mtime, reverse=True)
+    for path in files[keep:]:
+        if path not in protected:
+            path.unlink(missing_ok=True)
+
+
+def _write(path, svg, protected=()):
+    CHART_DIR.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    tmp.write_text(svg, encoding="utf-8")
+    tmp.replace(path)
+    _prune(MAX_FILES, protected)
+
+
+class SnapshotCache:
+    """In-memory index over the on-disk SVG files, bounded like the figure cache."""
+
+    def __init__(self, max_entries=64):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.renders = 0
+
+    def get(self, chart):
+        with self._lock:
+            entry = self._entries.get(chart.key)
+            if entry is not None:
+                self._entries.move_to_end(chart.key)
+        if entry is not None:
+            if entry.path is None or self._keep(entry.path):
+                return entry
+            # Pruned by another process: write it again from memory
+            entry = self._store(entry.key, entry.path, entry.svg)
+            with self._lock:
+                self._entries[chart.key] = entry
+            return entry
+
+        entry = self._load(chart)
+        with self._lock:
+            entry = self._entries.setdefault(chart.key, entry)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return entry
+
+    def _load(self, chart):
+        # Kaleido's file or the current built-in renderer's will do; a fresh
+        # render only happens for new figures
+        for path in sorted(CHART_DIR.glob(f"{chart.key}.*.svg")):
+            if path.name.split(".")[1] not in ("kaleido", SVGCHART):
+                continue
+            try:
+                return Snapshot(chart.key, path, URL_PREFIX + path.name, path.read_text(encoding="utf-8"))
+            except OSError:
+                continue
+
+        renderer, svg = render_svg(chart.figure)
+        self.renders += 1
+        return self._store(chart.key, CHART_DIR / f"{chart.key}.{renderer}.svg", svg)
+
+    def _keep(self, path):
+        """False if ``path`` is gone; refreshes its mtime when it is getting old."""
+        try:
+            mtime = path.stat().st_mtime
+            if time.time() - mtime > TOUCH_INTERVAL:
+                os.utime(path)
+        except FileNotFoundError:
+            return False
+        except OSError:
+            pass
+        return True
+
+    def _store(self, key, path, svg):
+        with self._lock:
+            protected = {entry.path for entry in self._entries.values()}
+        try:
+            _write(path, svg, protected)
+        except OSError as exc:
+            _LOGGER.warning("chart snapshot not cached on disk: %s", exc)
+            return Snapshot(key, None, None, svg)
+        return Snapshot(key, path, URL_PREFIX + path.name, svg)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.renders = 0
+
+
+snapshot_cache = SnapshotCache()
+
+
+def snapshot(chart):
+    return snapshot_cache.get(chart)
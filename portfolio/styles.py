@@ -0,0 +1,131 @@
+"""Stylesheet pipeline: the app's CSS as one minified, content-hashed file.
+
+portfolio/assets/portfolio.css is the source. ``stylesheet()`` minifies it
+and writes ``static/portfolio.<hash>.css`` next to app1.py, which Streamlit
+serves at ``app/static/`` when ``server.enableStaticServing`` is on. Reruns
+then send one ``<link>`` tag instead of the whole stylesheet; the file name
+changes with its content, so browsers and proxies may cache it for good.
+With static serving off (or a read-only checkout) the minified CSS is inlined
+as before.
+
+    python -m portfolio.styles   # build the file and report bytes saved per page view
+"""
+import hashlib
+import os
+import re
+import sys
+from collections import namedtuple
+from functools import lru_cache
+from pathlib import Path
+
+from portfolio import metrics
+from portfolio.settings import ROOT
+
+SOURCE = Path(__file__).resolve().parent / "assets" / "portfolio.css"
+STATIC_DIR = ROOT / "static"
+URL_PREFIX = "app/static/"
+
+css_bytes_saved = metrics.Counter(
+    "portfolio_css_bytes_saved_total", "Stylesheet bytes not sent because reruns link the static file.")
+metrics.METRICS.append(css_bytes_saved)
+
+# path is None when the file could not be written and the CSS has to be inlined
+Stylesheet = namedtuple("Stylesheet", "path href css")
+
+_COMMENTS = re.compile(r"/\*.*?\*/", re.S)
+_SPACES = re.compile(r"\s+")
+_PUNCTUATION = re.compile(r"\s*([{};,>])\s*")
+
+
+def minify(css):
+    css = _COMMENTS.sub("", css)
+    css = _SPACES.sub(" ", css)
+    css = _PUNCTUATION.sub(r"\1", css)
+    return css.replace(": ", ":").replace(";}", "}").strip()
+
+
+def _mtime(path):
+    try:
+        return path.stat().st_mtime
+    except OSError:  # removed by another worker meanwhile
+        return 0.0
+
+
+def _write(css, digest):
+    path = STATIC_DIR / f"portfolio.{digest}.css"
+    if path.exists():
+        return path
+    STATIC_DIR.mkdir(exist_ok=True)
+    tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    tmp.write_text(css, encoding="utf-8")
+    tmp.replace(path)
+    # Keep the newest previous file: during a rolling restart, workers still on
+    # the old stylesheet keep linking to it
+    older = sorted((old for old in STATIC_DIR.glob("portfolio.*.css") if old != path),
+                   key=_mtime, reverse=True)
+    for old in older[1:]:
+        old.unlink(missing_ok=True)
+    return path
+
+
+@lru_cache(maxsize=4)
+def _build(mtime_ns, size):
+    css = minify(SOURCE.read_text(encoding="utf-8"))
+    digest = hashlib.sha256(css.encode("utf-8")).hexdigest()[:12]
+    try:
+        path = _write(css, digest)
+    except OSError:
+        return Stylesheet(None, None, css)
+    return Stylesheet(path, URL_PREFIX + path.name, css)
+
+
+def stylesheet():
+    """Current stylesheet; rebuilt only when the source file changes."""
+    stat = SOURCE.stat()
+    return _build(stat.st_mtime_ns, stat.st_size)
+
+
+def link_tag(sheet):
+    return f'<link rel="stylesheet" href="{sheet.href}">'
+
+
+def inline_tag(sheet):
+    return f"<style>{sheet.css}</style>"
+
+
+def inject():
+    """Emit the stylesheet for this rerun: a link when static serving is on, inline CSS otherwise."""
+    import streamlit as st
+
+    sheet = stylesheet()
+    if sheet.path is not None and st.get_option("server.enableStaticServing"):
+        tag = link_tag(sheet)
+        css_bytes_saved.inc(amount=len(inline_tag(sheet).encode("utf-8")) - len(tag.encode("utf-8")))
+    else:
+        tag = inline_tag(sheet)
+    st.markdown(tag, unsafe_allow_html=True)
+    metrics.add_payload("css", len(tag.encode("utf-8")))
+
+
+def main():
+    import gzip
+
+    sheet = stylesheet()
+    source = SOURCE.read_text(encoding="utf-8")
+    link = len(link_tag(sheet).encode("utf-8"))
+    rows = [
+        ("source CSS", len(source.encode("utf-8"))),
+        ("minified CSS", len(sheet.css.encode("utf-8"))),
+        ("minified + gzip (one download)", len(gzip.compress(sheet.css.encode("utf-8")))),
+        ("source inlined per rerun (before)", len(f"<style>{source}</style>".encode("utf-8"))),
+        ("<link> per rerun (now)", link),
+    ]
+    for label, size in rows:
+        print(f"{label:<36}{size:>8,} bytes")
+    print(f"{'saved per page view':<36}{rows[3][1] - link:>8,} bytes")
+    print(f"written to {sheet.path.relative_to(ROOT) if sheet.path else '(not writable, inlined)'}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
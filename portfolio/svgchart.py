@@ -0,0 +1,313 @@
+"""Minimal SVG rendering of the figures built by portfolio/figures.py.
+
+A fallback for static chart snapshots when kaleido (Plotly's own image
+exporter, in requirements.txt) isn't installed or can't start Chrome. It
+covers what the factories produce -- horizontal and vertical bars, lines with
+markers and bubble scatters (SVG or WebGL traces) on numeric or category
+axes, pies, a filled radar and heatmaps -- in Plotly's default template
+colours. Other trace types are skipped.
+"""
+import html
+import math
+import numbers
+
+WIDTH = 700
+DEFAULT_HEIGHT = 450
+FONT = 'font-family="Open Sans, Verdana, Arial, sans-serif"'
+TEXT = "#2a3f5f"
+PLOT_BG = "#E5ECF6"
+COLORWAY = ("#636efa", "#EF553B", "#00cc96", "#ab63fa", "#FFA15A", "#19d3f3", "#FF6692", "#B6E880")
+
+
+def _esc(value):
+    return html.escape(str(value), quote=True)
+
+
+def _num(value):
+    return f"{value:.1f}".rstrip("0").rstrip(".")
+
+
+def _text(x, y, label, size=12, anchor="start", color=TEXT, extra=""):
+    return (f'<text x="{_num(x)}" y="{_num(y)}" font-size="{size}" fill="{color}" '
+            f'text-anchor="{anchor}"{extra}>{_esc(label)}</text>')
+
+
+def _is_numeric(values):
+    return all(isinstance(v, numbers.Real) and not isinstance(v, bool) for v in values)
+
+
+def nice_ticks(lo, hi, count=6):
+    span = hi - lo or 1.0
+    raw = span / count
+    magnitude = 10 ** math.floor(math.log10(raw))
+    step = next(m * magnitude for m in (1, 2, 2.5, 5, 10) if m * magnitude >= raw)
+    first = math.ceil(lo / step) * step
+    return [first + i * step for i in range(int((hi - first) / step + 1e-9) + 1)]
+
+
+class _Axis:
+    """Maps data values to pixels along one cartesian axis."""
+
+    def __init__(self, values, start, end, include_zero=False):
+        self.start, self.end = start, end
+        self.categories = None if _is_numeric(values) else list(dict.fromkeys(values))
+        if self.categories is not None:
+            # Index per category: position() runs once per point
+            self._index = {category: i for i, category in enumerate(self.categories)}
+            self.lo, self.hi = -0.5, len(self.categories) - 0.5
+            return
+        if not values:  # an empty series (e.g. a filter that matches nothing): a bare frame
+            self.lo, self.hi = 0.0, 1.0
+            return
+        lo, hi = min(values), max(values)
+        if include_zero:
+            lo, hi = min(lo, 0), max(hi, 0)
+            hi += (hi - lo) * 0.05
+        else:
+            pad = (hi - lo) * 0.08 or 1.0
+            lo, hi = lo - pad, hi + pad
+        self.lo, self.hi = lo, hi
+
+    def position(self, value):
+        if self.categories is not None:
+            value = self._index[value]
+        return self.start + (value - self.lo) / (self.hi - self.lo) * (self.end - self.start)
+
+    def ticks(self):
+        if self.categories is not None:
+            return [(c, self.position(c)) for c in self.categories]
+        return [(_num(v), self.position(v)) for v in nice_ticks(self.lo, self.hi)]
+
+    @property
+    def band(self):
+        return abs(self.end - self.start) / (self.hi - self.lo)
+
+
+def _colors(values, colorscale, lo, hi):
+    from plotly.colors import sample_colorscale
+
+    # Values outside [lo, hi] (a fixed zmin/zmax) take the end colours
+    points = [min(max((v - lo) / (hi - lo), 0.0), 1.0) if hi > lo else 0.5 for v in values]
+    return sample_colorscale([list(stop) for stop in colorscale], points)
+
+
+def _colorbar(parts, x, top, bottom, colorscale, lo, hi, title):
+    stops = "".join(
+        f'<stop offset="{_num(100 * (1 - pos))}%" stop-color="{color}"/>' for pos, color in reversed(colorscale))
+    parts.append(f'<defs><linearGradient id="cbar" x1="0" y1="0" x2="0" y2="1">{stops}</linearGradient></defs>')
+    parts.append(f'<rect x="{x}" y="{_num(top)}" width="14" height="{_num(bottom - top)}" fill="url(#cbar)"/>')
+    parts.append(_text(x, top - 10, title, 12))
+    for value in nice_ticks(lo, hi, 4):
+        y = bottom - (value - lo) / ((hi - lo) or 1) * (bottom - top)
+        parts.append(_text(x + 20, y + 4, _num(value), 11))
+
+
+def _cartesian(parts, figure, height):
+    layout = figure.layout
+    traces = [t for t in figure.data if t.type in ("bar", "scatter", "scattergl")]
+    xs = [v for t in traces for v in t.x]
+    ys = [v for t in traces for v in t.y]
+    colorscale = layout.coloraxis.colorscale
+    y_labels = [] if _is_numeric(ys) else [str(v) for v in ys]
+    left = max(80, 7 * max(map(len, y_labels), default=0) + 40)
+    right = WIDTH - (130 if colorscale else 40)
+    top, bottom = 100, height - 80
+
+    # Horizontal bars grow from x=0, vertical ones (the default) from y=0
+    horizontal = any(t.type == "bar" and t.orientation == "h" for t in traces)
+    vertical = any(t.type == "bar" and t.orientation != "h" for t in traces)
+    x_axis = _Axis(xs, left, right, include_zero=horizontal)
+    y_axis = _Axis(ys, bottom, top, include_zero=vertical)
+
+    parts.append(f'<rect x="{left}" y="{top}" width="{right - left}" height="{bottom - top}" fill="{PLOT_BG}"/>')
+    for label, x in x_axis.ticks():
+        parts.append(f'<line x1="{_num(x)}" y1="{top}" x2="{_num(x)}" y2="{bottom}" stroke="white"/>')
+        parts.append(_text(x, bottom + 18, label, 12, "middle"))
+    for label, y in y_axis.ticks():
+        parts.append(f'<line x1="{left}" y1="{_num(y)}" x2="{right}" y2="{_num(y)}" stroke="white"/>')
+        parts.append(_text(left - 8, y + 4, label, 12, "end"))
+    if layout.xaxis.title.text:
+        parts.append(_text((left + right) / 2, bottom + 50, layout.xaxis.title.text, 14, "middle"))
+    if layout.yaxis.title.text:
+        ty = (top + bottom) / 2
+        parts.append(_text(18, ty, layout.yaxis.title.text, 14, "middle",
+                           extra=f' transform="rotate(-90 18 {_num(ty)})"'))
+
+    for i, trace in enumerate(traces):
+        default = trace.line.color if trace.type != "bar" and trace.line.color else COLORWAY[i % len(COLORWAY)]
+        marker_color = trace.marker.color
+        if colorscale and marker_color is not None and not isinstance(marker_color, str) and len(marker_color):
+            fills = _colors(list(marker_color), colorscale, min(marker_color), max(marker_color))
+        else:
+            fills = [marker_color if isinstance(marker_color, str) else default] * len(trace.x)
+        points = [(x_axis.position(x), y_axis.position(y)) for x, y in zip(trace.x, trace.y)]
+
+        if trace.type == "bar" and trace.orientation == "h":
+            half = 0.4 * y_axis.band
+            zero = x_axis.position(0)
+            for (x, y), fill in zip(points, fills):
+                parts.append(f'<rect x="{_num(min(x, zero))}" y="{_num(y - half)}" width="{_num(abs(x - zero))}" '
+                             f'height="{_num(2 * half)}" fill="{fill}"/>')
+            continue
+        if trace.type == "bar":
+            # Widths in x units when the trace sets them (histogram bins), else 80% of a slot
+            if trace.width is None:
+                slot = 1.0 if x_axis.categories is not None else min(
+                    (b - a for a, b in zip(sorted(trace.x), sorted(trace.x)[1:]) if b > a), default=1.0)
+                widths = [0.8 * slot] * len(points)
+            elif isinstance(trace.width, numbers.Real):
+                widths = [trace.width] * len(points)
+            else:
+                widths = list(trace.width)
+            zero = y_axis.position(0)
+            for (x, y), fill, width in zip(points, fills, widths):
+                half = width * x_axis.band / 2
+                parts.append(f'<rect x="{_num(x - half)}" y="{_num(min(y, zero))}" width="{_num(2 * half)}" '
+                             f'height="{_num(abs(y - zero))}" fill="{fill}"/>')
+            continue
+
+        mode = trace.mode or "markers"
+        if "lines" in mode:
+            path = " ".join(f"{_num(x)},{_num(y)}" for x, y in points)
+            parts.append(f'<polyline points="{path}" fill="none" stroke="{default}" stroke-width="2"/>')
+        if "markers" in mode:
+            sizes = list(trace.marker.size) if trace.marker.size is not None and not isinstance(
+                trace.marker.size, numbers.Real) else [trace.marker.size or 6] * len(points)
+            sizeref = trace.marker.sizeref or 1
+            for (x, y), fill, size in zip(points, fills, sizes):
+                radius = math.sqrt(size / sizeref) / 2 if trace.marker.sizemode == "area" else size / 2
+                parts.append(f'<circle cx="{_num(x)}" cy="{_num(y)}" r="{_num(radius)}" fill="{fill}"/>')
+
+    if colorscale:
+        values = [v for t in traces if t.marker.color is not None and not isinstance(t.marker.color, str)
+                  for v in t.marker.color]
+        if values:
+            title = layout.coloraxis.colorbar.title.text or ""
+            _colorbar(parts, right + 30, top + 20, bottom, colorscale, min(values), max(values), title)
+
+
+def _pie(parts, figure, height):
+    trace = next(t for t in figure.data if t.type == "pie")
+    colors = list(trace.marker.colors or figure.layout.piecolorway or COLORWAY)
+    items = list(zip(trace.labels, trace.values))
+    if trace.sort is not False:
+        items.sort(key=lambda item: -item[1])
+    total = sum(value for _, value in items) or 1
+    cx, cy = (WIDTH - 160) / 2 + 20, (height + 60) / 2
+    radius = min(WIDTH - 200, height - 140) / 2
+    angle = -math.pi / 2  # start at 12 o'clock, clockwise
+    for i, (label, value) in enumerate(items):
+        color = colors[i % len(colors)]
+        sweep = 2 * math.pi * value / total
+        x1, y1 = cx + radius * math.cos(angle), cy + radius * math.sin(angle)
+        x2, y2 = cx + radius * math.cos(angle + sweep), cy + radius * math.sin(angle + sweep)
+        if sweep >= 2 * math.pi - 1e-9:
+            parts.append(f'<circle cx="{_num(cx)}" cy="{_num(cy)}" r="{_num(radius)}" fill="{color}"/>')
+        else:
+            large = 1 if sweep > math.pi else 0
+            parts.append(f'<path d="M{_num(cx)},{_num(cy)} L{_num(x1)},{_num(y1)} A{_num(radius)},{_num(radius)} 0 '
+                         f'{large} 1 {_num(x2)},{_num(y2)} Z" fill="{color}" stroke="white"/>')
+        mid = angle + sweep / 2
+        parts.append(_text(cx + 0.6 * radius * math.cos(mid), cy + 0.6 * radius * math.sin(mid) + 4,
+                           f"{100 * value / total:.1f}%", 12, "middle", "white"))
+        parts.append(f'<rect x="{WIDTH - 150}" y="{100 + 22 * i}" width="12" height="12" fill="{color}"/>')
+        parts.append(_text(WIDTH - 132, 110 + 22 * i, label, 12))
+        angle += sweep
+
+
+def _polar(parts, figure, height):
+    traces = [t for t in figure.data if t.type == "scatterpolar"]
+    categories = list(dict.fromkeys(v for t in traces for v in t.theta))
+    if not categories:
+        return
+    index = {category: i for i, category in enumerate(categories)}
+    radial = figure.layout.polar.radialaxis
+    lo, hi = radial.range or (0, max(v for t in traces for v in t.r))
+    cx, cy = WIDTH / 2 - 40, (height + 60) / 2
+    radius = min(WIDTH - 300, height - 160) / 2
+
+    def point(index, value):
+        theta = 2 * math.pi * index / len(categories)  # counter-clockwise from 3 o'clock
+        r = radius * (value - lo) / ((hi - lo) or 1)
+        return cx + r * math.cos(theta), cy - r * math.sin(theta)
+
+    parts.append(f'<circle cx="{_num(cx)}" cy="{_num(cy)}" r="{_num(radius)}" fill="{PLOT_BG}"/>')
+    for tick in nice_ticks(lo, hi, 5):
+        if lo < tick <= hi:
+            r = radius * (tick - lo) / ((hi - lo) or 1)
+            parts.append(f'<circle cx="{_num(cx)}" cy="{_num(cy)}" r="{_num(r)}" fill="none" stroke="white"/>')
+            parts.append(_text(cx + r + 2, cy - 3, _num(tick), 10))
+    for i, category in enumerate(categories):
+        x, y = point(i, hi)
+        parts.append(f'<line x1="{_num(cx)}" y1="{_num(cy)}" x2="{_num(x)}" y2="{_num(y)}" stroke="white"/>')
+        lx, ly = point(i, hi + (hi - lo) * 0.08)
+        anchor = "middle" if abs(lx - cx) < 10 else ("start" if lx > cx else "end")
+        parts.append(_text(lx, ly + 4, category, 12, anchor))
+
+    for n, trace in enumerate(traces):
+        color = trace.line.color or COLORWAY[n % len(COLORWAY)]
+        path = " ".join(f"{_num(x)},{_num(y)}" for x, y in
+                        (point(index[t], r) for t, r in zip(trace.theta, trace.r)))
+        fill = f'fill="{color}" fill-opacity="0.5"' if trace.fill == "toself" else 'fill="none"'
+        parts.append(f'<polygon points="{path}" {fill} stroke="{color}" stroke-width="2"/>')
+        if figure.layout.showlegend and trace.name:
+            parts.append(f'<rect x="{WIDTH - 150}" y="{100 + 22 * n}" width="12" height="12" fill="{color}"/>')
+            parts.append(_text(WIDTH - 132, 110 + 22 * n, trace.name, 12))
+
+
+def _heatmap(parts, figure, height):
+    trace = next(t for t in figure.data if t.type == "heatmap")
+    z = [list(row) for row in trace.z]
+    xs, ys = list(trace.x), list(trace.y)
+    left, right = 80, WIDTH - 130
+    top, bottom = 100, height - 80
+    x_axis = _Axis(xs, left, right)
+    y_axis = _Axis(ys, bottom, top)
+    if not xs or not ys:
+        parts.append(f'<rect x="{left}" y="{top}" width="{right - left}" height="{bottom - top}" fill="{PLOT_BG}"/>')
+        return
+    # Cells are centred on x/y; assume even spacing
+    width = abs(x_axis.position(xs[-1]) - x_axis.position(xs[0])) / max(len(xs) - 1, 1)
+    cell_height = abs(y_axis.position(ys[-1]) - y_axis.position(ys[0])) / max(len(ys) - 1, 1)
+
+    parts.append(f'<rect x="{left}" y="{top}" width="{right - left}" height="{bottom - top}" fill="{PLOT_BG}"/>')
+    for label, x in x_axis.ticks():
+        parts.append(_text(x, bottom + 18, label, 12, "middle"))
+    for label, y in y_axis.ticks():
+        parts.append(_text(left - 8, y + 4, label, 12, "end"))
+
+    # Missing cells (None or NaN) are left as background, as Plotly does
+    cells = [(i, j, v) for i, row in enumerate(z) for j, v in enumerate(row) if v is not None and v == v]
+    if not cells:
+        return
+    lo = trace.zmin if trace.zmin is not None else min(v for _, _, v in cells)
+    hi = trace.zmax if trace.zmax is not None else max(v for _, _, v in cells)
+    fills = _colors([v for _, _, v in cells], trace.colorscale, lo, hi)
+    for (i, j, _), fill in zip(cells, fills):
+        x, y = x_axis.position(xs[j]), y_axis.position(ys[i])
+        parts.append(f'<rect x="{_num(x - width / 2)}" y="{_num(y - cell_height / 2)}" width="{_num(width + 0.5)}" '
+                     f'height="{_num(cell_height + 0.5)}" fill="{fill}"/>')
+    _colorbar(parts, right + 30, top + 20, bottom, trace.colorscale, lo, hi, trace.colorbar.title.text or "")
+
+
+def render(figure):
+    """Return an SVG document for ``figure`` (a plotly ``go.Figure``)."""
+    height = figure.layout.height or DEFAULT_HEIGHT
+    parts = [
+        f'<svg xmlns="http://www.w3.org/2000/svg" width="{WIDTH}" height="{height}" '
+        f'viewBox="0 0 {WIDTH} {height}" {FONT}>',
+        f'<rect width="{WIDTH}" height="{height}" fill="white"/>',
+    ]
+    kinds = {trace.type for trace in figure.data}
+    if "pie" in kinds:
+        _pie(parts, figure, height)
+    elif "scatterpolar" in kinds:
+        _polar(parts, figure, height)
+    elif "heatmap" in kinds:
+        _heatmap(parts, figure, height)
+    elif kinds & {"bar", "scatter", "scattergl"}:
+        _cartesian(parts, figure, height)
+    if figure.layout.title.text:
+        parts.append(_text(35, 50, figure.layout.title.text, 17))
+    parts.append("</svg>")
+    return "".join(parts)
@@ -0,0 +1,69 @@
+"""Streamlit display helpers shared by the pages."""
+import html
+import os
+import uuid
+
+import streamlit as st
+
+from portfolio import metrics, pages, search, settings, snapshots
+from portfolio.content import get_content
+
+
+def session_id():
+    if "session_id" not in st.session_state:
+        st.session_state.session_id = uuid.uuid4().hex
+    return st.session_state.session_id
+
+
+def chart_mode():
+    mode = settings.portfolio_config().get("charts", {}).get("mode", "static")
+    return os.environ.get("PORTFOLIO_CHART_MODE", mode)
+
+
+# Show a cached figure as a pre-rendered image, or as an interactive Plotly
+# chart when configured or asked for; the block times either path. A fragment,
+# so flipping the toggle re-runs this chart only
+@st.fragment
+def show_chart(chart, name):
+    toggle_key = f"interactive.{name}"
+    with metrics.block(f"chart.{name}"):
+        if chart_mode() == "interactive" or st.session_state.get(toggle_key, False):
+            st.plotly_chart(chart.figure, use_container_width=True)
+            metrics.add_payload("chart_json", len(chart.json))
+        else:
+            show_snapshot(chart)
+    if chart_mode() != "interactive":
+        st.toggle("🔍 Interactive chart", key=toggle_key)
+
+
+def show_snapshot(chart):
+    snap = snapshots.snapshot(chart)
+    if snap.href is not None and st.get_option("server.enableStaticServing"):
+        alt = html.escape(chart.title or "chart")
+        tag = f'<img class="chart-snapshot" src="{snap.href}" alt="{alt}">'
+        st.markdown(tag, unsafe_allow_html=True)
+        metrics.add_payload("chart_img_tag", len(tag))
+    else:
+        st.image(snap.svg)
+        metrics.add_payload("chart_svg_inline", len(snap.svg))
+
+
+def _go_to(page):
+    st.session_state.nav = page
+
+
+# Sidebar search box; each hit is a button that switches the sidebar radio
+# (key "nav") to the hit's page
+def search_sidebar():
+    query = st.sidebar.text_input("🔎 Search", placeholder="e.g. SQL, Power BI", key="search").strip()
+    if not query:
+        return
+    with metrics.block("search"):
+        hits = search.index_for(get_content()).search(query.lower())
+    if not hits:
+        st.sidebar.caption("No matches")
+    labels = {slug: label for label, slug in pages.PAGES.items()}
+    for i, doc in enumerate(hits):
+        label = labels[doc.page]
+        st.sidebar.button(f"{doc.title} · {label}", key=f"search.{i}", help=doc.snippet,
+                          on_click=_go_to, args=(label,))
@@ -0,0 +1,115 @@
+"""Boot-time warm-up: fill the shared caches before the first visitor arrives.
+
+A fresh process pays on its first reruns for the cold imports (Plotly,
+pandas), content.json, every page's figures and chart snapshots, the badge
+HTML, the stylesheet, the search index and the CV. ``start()`` does that
+work once, in a background thread, as soon as the process is up (``python
+-m portfolio.serve`` starts it at boot; app1.py otherwise starts it with the
+first session). Each page's ``render()`` is called outside a script run:
+Streamlit elements are no-ops there and fragments are skipped, but the
+process-wide caches behind them fill exactly as they do for a visitor. The
+figures built along the way are then rendered to their snapshot files.
+
+``ready()`` turns true once warm-up has finished; the metrics endpoint
+reports it at ``/ready`` (200 or 503) and as ``portfolio_ready``. A failed
+step is logged and skipped, since the app serves the same content cold.
+
+Configured in the ``[portfolio.warmup]`` section of config.toml;
+``PORTFOLIO_WARMUP=0`` turns it off.
+"""
+import logging
+import os
+import threading
+import time
+
+from portfolio import metrics
+
+_LOGGER = logging.getLogger(__name__)
+
+THREAD_NAME = "portfolio-warmup"
+
+_ready = threading.Event()
+_steps = {}  # step -> seconds, in completion order
+_started = False
+_start_lock = threading.Lock()
+
+
+def ready():
+    return _ready.is_set()
+
+
+def steps():
+    """(step, seconds) for every finished step so far."""
+    return list(_steps.items())
+
+
+class _BareModeFilter(logging.Filter):
+    # Outside a script run every st.* call logs "missing ScriptRunContext"
+    def filter(self, record):
+        return record.threadName != THREAD_NAME
+
+
+def _step(name, work):
+    start = time.perf_counter()
+    try:
+        work()
+    except Exception:
+        _LOGGER.exception("warm-up step %s failed", name)
+    _steps[name] = time.perf_counter() - start
+
+
+def _snapshots():
+    from portfolio import figures, snapshots, ui
+
+    if ui.chart_mode() != "interactive":
+        for chart in figures.figure_cache.entries():
+            snapshots.snapshot(chart)
+
+
+def run():
+    """Warm every cache in the calling thread (``start()`` runs this in the background)."""
+    from portfolio import cv, pages, search, styles
+    from portfolio.content import get_content
+
+    start = time.perf_counter()
+    _step("content", get_content)
+    _step("search", lambda: search.index_for(get_content()))
+    _step("styles", styles.stylesheet)
+    _step("cv", lambda: cv.builder().build(get_content()).result())
+    for page, module in pages.PAGES.items():
+        _step(f"page.{module}", lambda page=page: pages.render(page))
+    _step("snapshots", _snapshots)
+    _ready.set()
+    _LOGGER.info("warm-up finished in %.2f s", time.perf_counter() - start)
+
+
+def start(config):
+    """Start warm-up from ``settings.portfolio_config()``, once per process; ready at once when disabled."""
+    global _started
+    with _start_lock:
+        if _started:
+            return
+        _started = True
+
+    enabled = os.environ.get("PORTFOLIO_WARMUP", str(config.get("warmup", {}).get("enabled", True)))
+    if enabled.lower() in ("0", "false", "no"):
+        _ready.set()
+        return
+    logging.getLogger("streamlit.runtime.scriptrunner_utils.script_run_context").addFilter(_BareModeFilter())
+    threading.Thread(target=run, name=THREAD_NAME, daemon=True).start()
+
+
+def _warmup_metrics():
+    lines = [
+        "# HELP portfolio_ready 1 once the boot warm-up has finished.",
+        "# TYPE portfolio_ready gauge",
+        f"portfolio_ready {int(ready())}",
+        "# HELP portfolio_warmup_seconds Time spent in each warm-up step.",
+        "# TYPE portfolio_warmup_seconds gauge",
+    ]
+    lines.extend(f'portfolio_warmup_seconds{{step="{name}"}} {seconds:.6f}' for name, seconds in steps())
+    return lines
+
+
+metrics.COLLECTORS.append(_warmup_metrics)
+metrics.READY_CHECKS.append(ready)